@@ -0,0 +1,79 @@
+"""
+Assembler and loader throughput on generated programs of increasing size.
+
+Usage:
+    python -m benchmarks.bench_assembler [--sizes 1000,10000,100000,1000000]
+        [--repeat R] [--modifications-per-record M]
+
+For each size, times LineParser, SymbolTable bulk insertion and PassOne in
+lines per second, and the Loader in object-code bytes per second on an
+object program with that many Text records. Peak traced memory is measured
+with tracemalloc in a separate, untimed run, since tracing slows Python down.
+"""
+import argparse
+import timeit
+import tracemalloc
+
+from src.assembler.parser import LineParser
+from src.assembler.pass_one import PassOne
+from src.assembler.symtab import SymbolTable
+from src.machine import SICMachine
+from src.loader import Loader
+
+from .generate import generate_source, generate_object_program
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+
+def peak_memory(func) -> int:
+    """Returns the peak traced allocation in bytes while func runs."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench(label: str, func, units: int, unit: str, repeat: int):
+    """Times func, then measures its peak memory, and prints one result row."""
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    peak = peak_memory(func)
+    print(f"  {label:<22} {units / best:>14,.0f} {unit:<8} {best * 1000:>10.1f} ms "
+          f"{peak / 2**20:>10.1f} MiB peak")
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                            help="Comma-separated line counts.")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--modifications-per-record", type=float, default=0.1,
+                            help="M records generated per T record.")
+    args = arg_parser.parse_args(argv)
+
+    for size in (int(text) for text in args.sizes.split(",")):
+        print(f"{size:,} lines")
+        source = generate_source(size)
+        parser = LineParser()
+        bench("LineParser", lambda source=source: list(map(parser.parse, source)),
+              size, "lines/s", args.repeat)
+
+        symbols = PassOne().run(source)[0].items()
+        bench("SymbolTable.add_symbols", lambda: SymbolTable().add_symbols(symbols),
+              len(symbols), "syms/s", args.repeat)
+
+        pass_one = PassOne()
+        bench("PassOne.run", lambda source=source: pass_one.run(source), size, "lines/s", args.repeat)
+
+        object_code = generate_object_program(
+            size, modification_count=int(size * args.modifications_per_record))
+        machine = SICMachine()
+        loader = Loader(machine)
+        bench("Loader.load", lambda: loader.load(object_code), size * 30, "bytes/s", args.repeat)
+        bench("Loader.load relocated", lambda: loader.load(object_code, 0x1000),
+              size * 30, "bytes/s", args.repeat)
+
+
+if __name__ == "__main__":
+    main()
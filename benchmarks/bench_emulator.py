@@ -0,0 +1,135 @@
+"""
+Emulator throughput benchmark over the canonical SIC workloads.
+
+Usage:
+    python -m benchmarks.bench_emulator [--workload NAME] [--repeat R] [--warmup W]
+        [--save-baseline FILE] [--baseline FILE] [--threshold 0.10]
+
+Reports guest instructions per second (median and standard deviation over
+the repeated runs). With --baseline, exits with status 1 if any workload's
+median is more than the threshold below the stored value.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import NamedTuple
+
+from .workloads import WORKLOADS, Workload
+
+
+class Result(NamedTuple):
+    """Throughput of one workload over repeated runs."""
+    name: str
+    instructions: int
+    median_ips: float
+    stdev_ips: float
+
+
+def measure(workload: Workload, repeat: int = 5, warmup: int = 1) -> Result:
+    """
+    Times a workload on fresh machines.
+
+    Args:
+        workload: The workload to run.
+        repeat: The number of measured runs.
+        warmup: Runs executed first and discarded.
+
+    Returns:
+        The median and standard deviation of instructions per second.
+
+    Raises:
+        RuntimeError: If a run leaves the wrong result in the machine.
+    """
+    rates = []
+    instructions = 0
+    for run in range(warmup + repeat):
+        machine = workload.build()
+        started = time.perf_counter()
+        instructions = workload.execute(machine)
+        elapsed = time.perf_counter() - started
+        if not workload.verify(machine):
+            raise RuntimeError(f"Workload {workload.name} produced a wrong result.")
+        if run >= warmup:
+            rates.append(instructions / elapsed)
+    stdev = statistics.stdev(rates) if len(rates) > 1 else 0.0
+    return Result(workload.name, instructions, statistics.median(rates), stdev)
+
+
+def save_baseline(path, results: list[Result]):
+    """Writes results as a JSON baseline."""
+    baseline = {
+        "python": platform.python_version(),
+        "workloads": {
+            result.name: {"median_ips": result.median_ips, "stdev_ips": result.stdev_ips}
+            for result in results
+        },
+    }
+    with open(path, "w") as file:
+        json.dump(baseline, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def load_baseline(path) -> dict[str, float]:
+    """Reads a JSON baseline, returning the median IPS per workload."""
+    with open(path) as file:
+        baseline = json.load(file)
+    return {name: entry["median_ips"] for name, entry in baseline["workloads"].items()}
+
+
+def compare(results: list[Result], baseline: dict[str, float], threshold: float) -> list[str]:
+    """
+    Finds workloads that got slower than the baseline allows.
+
+    Args:
+        results: The new measurements.
+        baseline: Median IPS per workload from load_baseline().
+        threshold: The tolerated relative slowdown, e.g. 0.10 for 10%.
+
+    Returns:
+        The names of regressed workloads. Workloads missing from the
+        baseline are not compared.
+    """
+    return [
+        result.name for result in results
+        if result.name in baseline and result.median_ips < baseline[result.name] * (1 - threshold)
+    ]
+
+
+def main(argv=None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--workload", action="append", choices=sorted(WORKLOADS),
+                            help="Run only this workload (repeatable).")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--warmup", type=int, default=1)
+    arg_parser.add_argument("--save-baseline", metavar="FILE")
+    arg_parser.add_argument("--baseline", metavar="FILE")
+    arg_parser.add_argument("--threshold", type=float, default=0.10,
+                            help="Tolerated slowdown against the baseline (default 0.10).")
+    args = arg_parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline) if args.baseline else {}
+    results = []
+    print(f"{'WORKLOAD':<18} {'INSTRUCTIONS':>12} {'MEDIAN IPS':>14} {'STDEV':>10} {'VS BASELINE':>12}")
+    for name in args.workload or WORKLOADS:
+        result = measure(WORKLOADS[name](), args.repeat, args.warmup)
+        results.append(result)
+        change = ""
+        if name in baseline:
+            change = f"{100 * (result.median_ips / baseline[name] - 1):+.1f}%"
+        print(f"{name:<18} {result.instructions:>12,} {result.median_ips:>14,.0f} "
+              f"{result.stdev_ips:>10,.0f} {change:>12}")
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"Regressed by more than {args.threshold:.0%}: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Benchmark for the assembler's LineParser on large synthetic sources.
+
+Usage:
+    python -m benchmarks.bench_parser [--lines N] [--repeat R]
+"""
+import argparse
+import timeit
+
+from src.assembler.parser import LineParser
+from src.assembler.pass_one import PassOne
+
+# Representative free-format lines, including comments, blank lines and a
+# quoted literal with embedded spaces.
+FREE_FORMAT_LINES = [
+    "FIRST   STL     RETADR          SAVE RETURN ADDRESS",
+    "CLOOP   JSUB    RDREC",
+    "        LDA     LENGTH",
+    "        COMP    ZERO",
+    "        JEQ     ENDFIL",
+    "        STCH    BUFFER,X",
+    ". THIS IS A COMMENT LINE",
+    "",
+    "EOF     BYTE    C'EOF  '",
+    "        RSUB",
+]
+
+# The same statements laid out in the fixed Beck columns.
+FIXED_COLUMN_LINES = [
+    "FIRST    STL      RETADR             SAVE RETURN ADDRESS",
+    "CLOOP    JSUB     RDREC",
+    "         LDA      LENGTH",
+    "         COMP     ZERO",
+    "         JEQ      ENDFIL",
+    "         STCH     BUFFER,X",
+    ". THIS IS A COMMENT LINE",
+    "",
+    "EOF      BYTE     C'EOF  '",
+    "         RSUB",
+]
+
+
+def make_source(template: list[str], line_count: int) -> list[str]:
+    """Repeats a template until the source has line_count lines."""
+    repeats = line_count // len(template) + 1
+    return (template * repeats)[:line_count]
+
+
+def make_program(line_count: int) -> list[str]:
+    """Builds an assemblable program with line_count statements and unique labels."""
+    lines = ["BENCH   START   0"]
+    for i in range(line_count):
+        lines.append(f"L{i:<6d}  LDA     L0")
+    lines.append("        END     BENCH")
+    return lines
+
+
+def bench(label: str, func, line_count: int, repeat: int):
+    """Times func and prints the best lines-per-second figure."""
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    print(f"{label:<28} {line_count / best:>14,.0f} lines/s")
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--lines", type=int, default=100_000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args(argv)
+
+    free_source = make_source(FREE_FORMAT_LINES, args.lines)
+    fixed_source = make_source(FIXED_COLUMN_LINES, args.lines)
+    program = make_program(args.lines)
+
+    free_parser = LineParser()
+    fixed_parser = LineParser(fixed_columns=True)
+    pass_one = PassOne()
+
+    bench("LineParser (free format)", lambda: list(map(free_parser.parse, free_source)),
+          args.lines, args.repeat)
+    bench("LineParser (fixed columns)", lambda: list(map(fixed_parser.parse, fixed_source)),
+          args.lines, args.repeat)
+    bench("PassOne.run", lambda: pass_one.run(program), args.lines, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
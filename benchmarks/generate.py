@@ -0,0 +1,114 @@
+"""
+Generators for synthetic SIC sources and object programs of any size.
+
+Output is deterministic for a given seed, so benchmark runs are comparable.
+Sources are accepted by PassOne; object programs are accepted by the Loader,
+with Text record addresses wrapped to stay inside memory however many
+records are generated.
+"""
+import random
+
+from src.memory import Memory
+from src.assembler.optab import OPTAB, OPERAND_NONE
+
+# Instructions that take a memory operand, in a stable order.
+MEMORY_MNEMONICS = sorted(name for name, info in OPTAB.items() if info.operand != OPERAND_NONE)
+
+
+def generate_source(line_count: int, symbol_count: int | None = None,
+                    comment_ratio: float = 0.05, data_ratio: float = 0.1, seed: int = 0) -> list[str]:
+    """
+    Generates a free-format SIC source program.
+
+    Args:
+        line_count: The total number of lines, including START and END (at least 2).
+        symbol_count: How many lines carry a label; defaults to a quarter of the lines.
+        comment_ratio: The fraction of body lines that are comments.
+        data_ratio: The fraction of statements that are WORD/BYTE/RESW/RESB.
+        seed: Seed for the pseudo-random choices.
+
+    Returns:
+        The source lines. Operands refer to the generated labels, including
+        forward references.
+
+    Raises:
+        ValueError: If line_count is less than 2.
+    """
+    if line_count < 2:
+        raise ValueError("A generated source needs at least START and END.")
+    body_count = line_count - 2
+    if symbol_count is None:
+        symbol_count = body_count // 4
+    symbol_count = max(1, min(symbol_count, body_count)) if body_count else 0
+
+    rng = random.Random(seed)
+    # Spread the labels evenly over the body.
+    step = max(1, body_count // symbol_count) if symbol_count else 1
+    labelled = set(range(0, step * symbol_count, step))
+    labels = [f"S{index}" for index in range(symbol_count)]
+
+    lines = ["SYNTH   START   0"]
+    next_label = 0
+    for index in range(body_count):
+        if index in labelled:
+            label = labels[next_label]
+            next_label += 1
+        else:
+            label = ""
+            if rng.random() < comment_ratio:
+                lines.append(f". generated comment {index}")
+                continue
+        if rng.random() < data_ratio:
+            kind = rng.randrange(4)
+            if kind == 0:
+                statement = f"WORD    {rng.randrange(1 << 23)}"
+            elif kind == 1:
+                statement = f"BYTE    X'{rng.randrange(1 << 24):06X}'"
+            elif kind == 2:
+                statement = f"RESW    {rng.randrange(1, 4)}"
+            else:
+                statement = "BYTE    C'EOF'"
+        else:
+            mnemonic = rng.choice(MEMORY_MNEMONICS)
+            operand = rng.choice(labels) if labels else "0"
+            if rng.random() < 0.2:
+                operand += ",X"
+            statement = f"{mnemonic:<8}{operand}"
+        lines.append(f"{label:<8}{statement}")
+    lines.append("        END     SYNTH")
+    return lines
+
+
+def generate_object_program(record_count: int, record_bytes: int = 30,
+                            modification_count: int = 0, seed: int = 0) -> str:
+    """
+    Generates an object program in the Loader's record layout.
+
+    Args:
+        record_count: The number of Text records.
+        record_bytes: Bytes of object code per Text record (1-30).
+        modification_count: The number of full-word Modification records.
+        seed: Seed for the pseudo-random object code.
+
+    Returns:
+        The object program text: H, T..., M..., E.
+
+    Raises:
+        ValueError: If record_bytes is out of range.
+    """
+    if not 1 <= record_bytes <= 30:
+        raise ValueError(f"record_bytes must be between 1 and 30, got {record_bytes}.")
+    rng = random.Random(seed)
+    # Text records are laid end to end and wrap within the lower half of
+    # memory, leaving room to load the program relocated by up to 16 KB.
+    span = Memory.SIZE // 2 // record_bytes * record_bytes
+    records = [f"HSYNTH {0:06X}{min(span, record_count * record_bytes):06X}"]
+    for index in range(record_count):
+        address = index * record_bytes % span
+        code = rng.randbytes(record_bytes).hex().upper()
+        records.append(f"T{address:06X}{record_bytes:02X}{code}")
+    for index in range(modification_count):
+        address = rng.randrange(0, span - 3)
+        records.append(f"M{address:06X}06+SYNTH")
+    records.append("E000000")
+    return "\n".join(records)
@@ -0,0 +1,209 @@
+"""
+Microbenchmarks for the primitives on every instruction's path.
+
+Usage:
+    python -m benchmarks.micro [--number N] [--repeat R] [--group NAME]
+
+Each group times the current implementation ("current") next to candidate
+alternatives, in isolation and in mixes shaped like LDA/STA. Results are the
+best of R repeats, in nanoseconds per operation, with the ratio to the
+group's current implementation.
+"""
+import argparse
+import timeit
+from functools import lru_cache
+
+from src.memory import Memory
+from src.registers import Registers
+from src.instruction import Instruction
+from src.cpu import DECODE_CACHE_SIZE
+
+ADDRESS = 0x1234
+WORD = 0x00A123  # LDA 2123,X
+
+
+# --- Candidate implementations ---
+
+class UncheckedMemory(Memory):
+    """Word access without the explicit bounds check; bytearray indexing still raises."""
+
+    def read_word(self, address):
+        memory = self._memory
+        return (memory[address] << 16) | (memory[address + 1] << 8) | memory[address + 2]
+
+    def write_word(self, address, value):
+        memory = self._memory
+        memory[address] = (value >> 16) & 0xFF
+        memory[address + 1] = (value >> 8) & 0xFF
+        memory[address + 2] = value & 0xFF
+
+
+class SliceMemory(Memory):
+    """Word access through int.from_bytes/to_bytes on 3-byte slices."""
+
+    def read_word(self, address):
+        if not (0 <= address < self.SIZE - 2):
+            raise IndexError(f"Word read at address {address} would exceed memory bounds.")
+        return int.from_bytes(self._memory[address:address + 3], "big")
+
+    def write_word(self, address, value):
+        if not (0 <= address < self.SIZE - 2):
+            raise IndexError(f"Word write at address {address} would exceed memory bounds.")
+        self._memory[address:address + 3] = (value & 0xFFFFFF).to_bytes(3, "big")
+
+
+class PlainRegisters:
+    """Plain slot attributes; callers mask at the use sites that can overflow."""
+    __slots__ = ("A", "X", "L", "PC", "SW")
+
+    def __init__(self):
+        self.A = self.X = self.L = self.PC = self.SW = 0
+
+
+def decode_tuple(word):
+    """Decodes an instruction word into (opcode, x, address) without an object."""
+    return word >> 16, (word >> 15) & 1, word & 0x7FFF
+
+
+class SlotsInstruction:
+    """Fields decoded eagerly into slots instead of properties."""
+    __slots__ = ("opcode", "x", "address")
+
+    def __init__(self, word):
+        self.opcode = word >> 16
+        self.x = (word >> 15) & 1
+        self.address = word & 0x7FFF
+
+
+# --- Benchmark groups: name -> list of (label, statement, namespace) ---
+
+def memory_group():
+    current, unchecked, sliced = Memory(), UncheckedMemory(), SliceMemory()
+    buffer = current.buffer
+    return [
+        ("read_word current", "m.read_word(a)", {"m": current, "a": ADDRESS}),
+        ("read_word unchecked", "m.read_word(a)", {"m": unchecked, "a": ADDRESS}),
+        ("read_word from_bytes", "m.read_word(a)", {"m": sliced, "a": ADDRESS}),
+        ("read_word inline buffer", "(b[a] << 16) | (b[a + 1] << 8) | b[a + 2]", {"b": buffer, "a": ADDRESS}),
+        ("write_word current", "m.write_word(a, 0x123456)", {"m": current, "a": ADDRESS}),
+        ("write_word unchecked", "m.write_word(a, 0x123456)", {"m": unchecked, "a": ADDRESS}),
+        ("write_word to_bytes", "m.write_word(a, 0x123456)", {"m": sliced, "a": ADDRESS}),
+        ("read_byte current", "m.read_byte(a)", {"m": current, "a": ADDRESS}),
+        ("read_byte buffer", "b[a]", {"b": buffer, "a": ADDRESS}),
+    ]
+
+
+def registers_group():
+    current, plain = Registers(), PlainRegisters()
+    return [
+        ("set A current", "r.A = 0x123456", {"r": current}),
+        ("set A plain", "r.A = 0x123456", {"r": plain}),
+        ("set A plain+mask", "r.A = 0x123456 & 0xFFFFFF", {"r": plain}),
+        ("get A current", "r.A", {"r": current}),
+        ("get A plain", "r.A", {"r": plain}),
+        ("PC += 3 current", "r.PC += 3", {"r": current}),
+        ("PC += 3 plain+mask", "r.PC = (r.PC + 3) & 0xFFFFFF", {"r": plain}),
+    ]
+
+
+def instruction_group():
+    cache = lru_cache(maxsize=DECODE_CACHE_SIZE)(Instruction)
+    return [
+        ("decode current", "i = I(w); i.opcode; i.x; i.address", {"I": Instruction, "w": WORD}),
+        ("decode cached (CPU)", "i = c(w); i.opcode; i.x; i.address", {"c": cache, "w": WORD}),
+        ("decode slots", "i = S(w); i.opcode; i.x; i.address", {"S": SlotsInstruction, "w": WORD}),
+        ("decode tuple", "op, x, ad = d(w)", {"d": decode_tuple, "w": WORD}),
+        ("decode inline", "op = w >> 16; x = (w >> 15) & 1; ad = w & 0x7FFF", {"w": WORD}),
+    ]
+
+
+# A load-accumulator step: fetch, decode, PC += 3, effective address, load.
+LDA_MIX = """\
+i = decode(m.read_word(r.PC))
+r.PC += 3
+ea = i.address + r.X if i.x else i.address
+r.A = m.read_word(ea)
+"""
+
+LDA_MIX_INLINE = """\
+w = (b[r.PC] << 16) | (b[r.PC + 1] << 8) | b[r.PC + 2]
+r.PC = (r.PC + 3) & 0xFFFFFF
+ea = (w & 0x7FFF) + r.X if w & 0x8000 else w & 0x7FFF
+r.A = (b[ea] << 16) | (b[ea + 1] << 8) | b[ea + 2]
+"""
+
+STA_MIX = """\
+i = decode(m.read_word(r.PC))
+r.PC += 3
+ea = i.address + r.X if i.x else i.address
+m.write_word(ea, r.A)
+"""
+
+
+def mix_group():
+    def setup(memory, registers):
+        registers.PC = 0x1000
+        memory.write_word(0x1000, WORD)
+        return {"m": memory, "r": registers, "b": memory.buffer}
+
+    cached_decode = lru_cache(maxsize=DECODE_CACHE_SIZE)(Instruction)
+
+    # PC is reset before each iteration so every fetch reads the same word.
+    def mix(statement):
+        return "r.PC = 0x1000\n" + statement
+
+    current = setup(Memory(), Registers())
+    return [
+        ("LDA current", mix(LDA_MIX), dict(current, decode=Instruction)),
+        ("LDA decode cache (CPU)", mix(LDA_MIX), dict(current, decode=cached_decode)),
+        ("LDA unchecked+plain", mix(LDA_MIX), dict(setup(UncheckedMemory(), PlainRegisters()), decode=Instruction)),
+        ("LDA fully inlined", mix(LDA_MIX_INLINE), setup(Memory(), PlainRegisters())),
+        ("STA current", mix(STA_MIX), dict(current, decode=Instruction)),
+        ("STA decode cache (CPU)", mix(STA_MIX), dict(current, decode=cached_decode)),
+        ("STA unchecked+plain", mix(STA_MIX), dict(setup(UncheckedMemory(), PlainRegisters()), decode=Instruction)),
+    ]
+
+
+GROUPS = {
+    "memory": memory_group,
+    "registers": registers_group,
+    "instruction": instruction_group,
+    "mix": mix_group,
+}
+
+
+def run_group(name: str, number: int, repeat: int) -> list[tuple[str, float]]:
+    """
+    Times every case in a group.
+
+    Returns:
+        (label, nanoseconds per operation) pairs in group order.
+    """
+    results = []
+    for label, statement, namespace in GROUPS[name]():
+        best = min(timeit.repeat(statement, globals=namespace, number=number, repeat=repeat))
+        results.append((label, best / number * 1e9))
+    return results
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--number", type=int, default=200_000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--group", action="append", choices=sorted(GROUPS))
+    args = arg_parser.parse_args(argv)
+
+    for name in args.group or GROUPS:
+        results = run_group(name, args.number, args.repeat)
+        # Labels start with the operation; ratios are against its first case,
+        # the current code.
+        print(f"\n[{name}]")
+        reference = {}
+        for label, nanoseconds in results:
+            operation = label.split(" ", 1)[0]
+            reference.setdefault(operation, nanoseconds)
+            print(f"{label:<26} {nanoseconds:>9.1f} ns   x{nanoseconds / reference[operation]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
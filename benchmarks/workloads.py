@@ -0,0 +1,241 @@
+"""
+Canonical SIC programs used to measure emulator throughput.
+
+Each workload is written in SIC assembly, assembled once, and loaded into a
+fresh machine for every measured run. Programs end by spinning on a label
+named HALT; a run is over once the PC reaches it. Every workload can check
+the machine state afterwards, so a fast but wrong emulator does not pass.
+"""
+from src.assembler.pass_two import assemble
+from src.devices import ConsoleInputDevice, ConsoleOutputDevice
+from src.machine import SICMachine
+
+# Devices used by the echo workload. The CPU takes the device number from
+# the operand address, so TD/RD/WD name them numerically.
+INPUT_DEVICE = 0xF1
+OUTPUT_DEVICE = 0x05
+
+
+class Workload:
+    """An assembled SIC program with its machine setup and result check."""
+
+    def __init__(self, name: str, source: list[str], setup=None, verify=None):
+        """
+        Assembles the workload.
+
+        Args:
+            name: The name results are reported and baselined under.
+            source: The program's assembly source. It must define HALT.
+            setup: Optional callable(machine, symtab) run after loading.
+            verify: Optional callable(machine, symtab) returning True if the
+                program produced the right result.
+        """
+        self.name = name
+        self.object_code, self.symtab = assemble(source)
+        self.halt = self.symtab.get_address("HALT")
+        self._setup = setup
+        self._verify = verify
+
+    def build(self) -> SICMachine:
+        """Returns a new machine with the program loaded and set up."""
+        machine = SICMachine()
+        machine.load_object_code(self.object_code)
+        if self._setup is not None:
+            self._setup(machine, self.symtab)
+        return machine
+
+    def execute(self, machine: SICMachine, chunk: int = 4096, max_steps: int = 100_000_000) -> int:
+        """
+        Runs the program until it reaches HALT.
+
+        Args:
+            machine: A machine from build().
+            chunk: Instructions per run() call between checks for HALT.
+            max_steps: Give up after this many instructions.
+
+        Returns:
+            The number of instructions executed, including up to one chunk
+            of spinning on HALT.
+
+        Raises:
+            RuntimeError: If HALT is not reached within max_steps.
+        """
+        registers = machine.registers
+        halt = self.halt
+        while registers.PC != halt:
+            if machine.instructions_executed >= max_steps:
+                raise RuntimeError(f"Workload {self.name} did not halt within {max_steps} instructions.")
+            machine.run(chunk)
+        return machine.instructions_executed
+
+    def verify(self, machine: SICMachine) -> bool:
+        """Returns True if the machine holds the expected result."""
+        return self._verify is None or self._verify(machine, self.symtab)
+
+
+def _pattern(length: int) -> bytes:
+    """Deterministic pseudo-random bytes (a small LCG), for table data."""
+    data = bytearray(length)
+    value = 12345
+    for i in range(length):
+        value = (value * 1103515245 + 12345) & 0x7FFFFFFF
+        data[i] = value >> 16 & 0xFF
+    return bytes(data)
+
+
+def arithmetic_loop(iterations: int = 20_000) -> Workload:
+    """A tight loop of loads, MUL, ADD, AND and stores: ACC = (ACC*3+7) & FFFF."""
+    source = [
+        "ARITH   START   1000",
+        "        LDX     ZERO",
+        "LOOP    LDA     ACC",
+        "        MUL     THREE",
+        "        ADD     SEVEN",
+        "        AND     MASK",
+        "        STA     ACC",
+        "        TIX     COUNT",
+        "        JLT     LOOP",
+        "HALT    J       HALT",
+        "ZERO    WORD    0",
+        "ACC     WORD    1",
+        "THREE   WORD    3",
+        "SEVEN   WORD    7",
+        "MASK    WORD    65535",
+        f"COUNT   WORD    {iterations}",
+        "        END     ARITH",
+    ]
+    expected = 1
+    for _ in range(iterations):
+        expected = (expected * 3 + 7) & 0xFFFF
+
+    def verify(machine, symtab):
+        return machine.memory.read_word(symtab.get_address("ACC")) == expected
+
+    return Workload("arithmetic_loop", source, verify=verify)
+
+
+def table_copy(length: int = 1024, passes: int = 30) -> Workload:
+    """Copies a byte table with indexed LDCH/STCH, several times over."""
+    source = [
+        "COPY    START   1000",
+        "OUTER   LDX     ZERO",
+        "LOOP    LDCH    SRC,X",
+        "        STCH    DST,X",
+        "        TIX     LEN",
+        "        JLT     LOOP",
+        "        LDA     PASS",
+        "        ADD     ONE",
+        "        STA     PASS",
+        "        COMP    PASSES",
+        "        JLT     OUTER",
+        "HALT    J       HALT",
+        "ZERO    WORD    0",
+        "ONE     WORD    1",
+        "PASS    WORD    0",
+        f"PASSES  WORD    {passes}",
+        f"LEN     WORD    {length}",
+        f"SRC     RESB    {length}",
+        f"DST     RESB    {length}",
+        "        END     OUTER",
+    ]
+    data = _pattern(length)
+
+    def setup(machine, symtab):
+        src = symtab.get_address("SRC")
+        machine.memory.buffer[src:src + length] = data
+
+    def verify(machine, symtab):
+        dst = symtab.get_address("DST")
+        return bytes(machine.memory.buffer[dst:dst + length]) == data
+
+    return Workload("table_copy", source, setup, verify)
+
+
+def device_echo(length: int = 10_000) -> Workload:
+    """Echoes input to output a byte at a time, polling both devices with TD."""
+    source = [
+        "ECHO    START   1000",
+        "        LDX     ZERO",
+        f"LOOP    TD      {INPUT_DEVICE}",
+        "        JEQ     LOOP",
+        f"        RD      {INPUT_DEVICE}",
+        f"WAIT    TD      {OUTPUT_DEVICE}",
+        "        JEQ     WAIT",
+        f"        WD      {OUTPUT_DEVICE}",
+        "        TIX     COUNT",
+        "        JLT     LOOP",
+        "HALT    J       HALT",
+        "ZERO    WORD    0",
+        f"COUNT   WORD    {length}",
+        "        END     ECHO",
+    ]
+    text = "".join(chr(byte) for byte in _pattern(length))
+
+    def setup(machine, symtab):
+        console_in = ConsoleInputDevice()
+        console_in.set_input(text)
+        machine.device_manager.add_device(INPUT_DEVICE, console_in)
+        machine.device_manager.add_device(OUTPUT_DEVICE, ConsoleOutputDevice())
+
+    def verify(machine, symtab):
+        return machine.device_manager.get_device(OUTPUT_DEVICE).get_output() == text
+
+    return Workload("device_echo", source, setup, verify)
+
+
+def bubble_sort(length: int = 150) -> Workload:
+    """Sorts a byte array in place with a bubble sort."""
+    if length < 2:
+        raise ValueError("bubble_sort needs at least 2 elements.")
+    source = [
+        "SORT    START   1000",
+        "        LDA     ZERO",
+        "        STA     PASS",
+        "OUTER   LDX     ZERO",
+        "INNER   LDA     ZERO",
+        "        LDCH    ARR+1,X",
+        "        STA     NEXT",
+        "        LDA     ZERO",
+        "        LDCH    ARR,X",
+        "        COMP    NEXT",
+        "        JLT     NOSWAP",
+        "        JEQ     NOSWAP",
+        "        STCH    ARR+1,X",
+        "        LDA     NEXT",
+        "        STCH    ARR,X",
+        "NOSWAP  TIX     LAST",
+        "        JLT     INNER",
+        "        LDA     PASS",
+        "        ADD     ONE",
+        "        STA     PASS",
+        "        COMP    LAST",
+        "        JLT     OUTER",
+        "HALT    J       HALT",
+        "ZERO    WORD    0",
+        "ONE     WORD    1",
+        "PASS    WORD    0",
+        "NEXT    WORD    0",
+        f"LAST    WORD    {length - 1}",
+        f"ARR     RESB    {length}",
+        "        END     SORT",
+    ]
+    data = _pattern(length)
+
+    def setup(machine, symtab):
+        arr = symtab.get_address("ARR")
+        machine.memory.buffer[arr:arr + length] = data
+
+    def verify(machine, symtab):
+        arr = symtab.get_address("ARR")
+        return bytes(machine.memory.buffer[arr:arr + length]) == bytes(sorted(data))
+
+    return Workload("bubble_sort", source, setup, verify)
+
+
+# Workload factories by name, at their default sizes.
+WORKLOADS = {
+    "arithmetic_loop": arithmetic_loop,
+    "table_copy": table_copy,
+    "device_echo": device_echo,
+    "bubble_sort": bubble_sort,
+}
@@ -5,12 +5,14 @@ class DirectiveHandler(ABC):
     Abstract base class for a directive handling strategy.
     """
     @abstractmethod
-    def handle(self, operand: str | None) -> int:
+    def handle(self, operand: str | None, evaluator=None) -> int:
         """
         Calculates the number of bytes this directive reserves.
 
         Args:
             operand: The operand from the source line.
+            evaluator: Optional ExpressionEvaluator for operands that may be
+                expressions. Without one, numeric operands must be decimal literals.
 
         Returns:
             The number of bytes to add to the location counter.
@@ -19,26 +21,27 @@ class DirectiveHandler(ABC):
 
 class WordDirectiveHandler(DirectiveHandler):
     """Handles the WORD directive."""
-    def handle(self, operand: str | None) -> int:
+    def handle(self, operand: str | None, evaluator=None) -> int:
         return 3
 
 class ReswDirectiveHandler(DirectiveHandler):
     """Handles the RESW directive."""
-    def handle(self, operand: str | None) -> int:
+    def handle(self, operand: str | None, evaluator=None) -> int:
         if operand is None:
             raise ValueError("RESW requires an operand.")
-        return 3 * int(operand)
+        count = evaluator.evaluate(operand) if evaluator else int(operand)
+        return 3 * count
 
 class ResbDirectiveHandler(DirectiveHandler):
     """Handles the RESB directive."""
-    def handle(self, operand: str | None) -> int:
+    def handle(self, operand: str | None, evaluator=None) -> int:
         if operand is None:
             raise ValueError("RESB requires an operand.")
-        return int(operand)
+        return evaluator.evaluate(operand) if evaluator else int(operand)
 
 class ByteDirectiveHandler(DirectiveHandler):
     """Handles the BYTE directive."""
-    def handle(self, operand: str | None) -> int:
+    def handle(self, operand: str | None, evaluator=None) -> int:
         if operand is None:
             raise ValueError("BYTE requires an operand.")
         
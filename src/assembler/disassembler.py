@@ -0,0 +1,45 @@
+from .optab import MNEMONICS, OPTAB, OPERAND_NONE
+
+
+def disassemble_word(word: int) -> str:
+    """
+    Converts a 24-bit SIC instruction word back into assembly text.
+
+    Args:
+        word: The 24-bit instruction word.
+
+    Returns:
+        The instruction text, e.g. "LDA 1050,X". Words whose opcode is not a
+        SIC instruction are rendered as a WORD constant with the decimal
+        operand the assembler reads, so they reassemble to the same bytes.
+    """
+    mnemonic = MNEMONICS[(word >> 16) & 0xFF]
+    if mnemonic is None:
+        return f"WORD {word & 0xFFFFFF}"
+    if OPTAB[mnemonic].operand == OPERAND_NONE:
+        return mnemonic
+    operand = f"{word & 0x7FFF:04X}"
+    if word & 0x8000:
+        operand += ",X"
+    return f"{mnemonic} {operand}"
+
+
+def disassemble(memory, start: int, count: int) -> list[tuple[int, int, str]]:
+    """
+    Disassembles consecutive instruction words from memory.
+
+    Args:
+        memory: The Memory to read from.
+        start: The address of the first instruction.
+        count: The number of instructions to disassemble.
+
+    Returns:
+        A list of (address, word, text) tuples.
+    """
+    listing = []
+    address = start
+    for _ in range(count):
+        word = memory.read_word(address)
+        listing.append((address, word, disassemble_word(word)))
+        address += 3
+    return listing
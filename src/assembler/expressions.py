@@ -0,0 +1,290 @@
+import re
+from functools import lru_cache
+
+# Tokens: decimal numbers, symbols, operators and parentheses.
+_TOKEN_RE = re.compile(r"\s*(?:(\d+)|([A-Za-z_][A-Za-z0-9_]*)|([-+*/()]))")
+
+
+class UndefinedSymbolError(ValueError):
+    """
+    Raised when an expression refers to a symbol that is not (yet) defined.
+    Pass One treats this as a forward reference where one is allowed.
+    """
+
+    def __init__(self, symbol: str):
+        super().__init__(f"Undefined symbol: {symbol}")
+        self.symbol = symbol
+
+
+class Expression:
+    """
+    A parsed assembler expression such as TABLE+3*N or *-BUFFER.
+
+    The expression is stored in postfix form so evaluation is a single pass
+    over a tuple with a small value stack. An expression without symbols or
+    location counter references is folded to a constant when parsed.
+    """
+
+    __slots__ = ("text", "code", "symbols", "uses_location", "constant")
+
+    def __init__(self, text: str, code: tuple, symbols: frozenset, uses_location: bool):
+        self.text = text
+        self.code = code
+        self.symbols = symbols
+        self.uses_location = uses_location
+        self.constant = None
+        if not symbols and not uses_location:
+            self.constant = self.evaluate(None)
+
+    def evaluate(self, symtab, location: int | None = None) -> int:
+        """
+        Computes the value of the expression.
+
+        Args:
+            symtab: The SymbolTable used to resolve symbols.
+            location: The current location counter, the value of '*'.
+
+        Returns:
+            The integer value.
+
+        Raises:
+            UndefinedSymbolError: If a referenced symbol is not defined.
+            ValueError: If '*' is used without a location, or on division by zero.
+        """
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        for kind, value in self.code:
+            if kind == "num":
+                push(value)
+            elif kind == "sym":
+                try:
+                    push(symtab.get_address(value))
+                except KeyError:
+                    raise UndefinedSymbolError(value) from None
+            elif kind == "loc":
+                if location is None:
+                    raise ValueError(f"Location counter is not available in expression: {self.text}")
+                push(location)
+            elif kind == "neg":
+                push(-pop())
+            else:
+                right = pop()
+                left = pop()
+                if value == "+":
+                    push(left + right)
+                elif value == "-":
+                    push(left - right)
+                elif value == "*":
+                    push(left * right)
+                else:
+                    if right == 0:
+                        raise ValueError(f"Division by zero in expression: {self.text}")
+                    # Integer division truncating toward zero, as on the machine.
+                    quotient = abs(left) // abs(right)
+                    push(quotient if (left < 0) == (right < 0) else -quotient)
+        return stack[0]
+
+    def relocation(self, symtab) -> int:
+        """
+        Counts the net relative terms of the expression: 0 for an absolute
+        value, 1 for an address that moves with the program, as in
+        TABLE+3 or LAST-FIRST+BUFFER. Labels and '*' are relative terms;
+        numbers and absolute symbols are not.
+
+        Args:
+            symtab: The SymbolTable telling relative and absolute symbols apart.
+
+        Returns:
+            The net number of relative terms; only 0 and 1 are meaningful.
+
+        Raises:
+            UndefinedSymbolError: If a referenced symbol is not defined.
+            ValueError: If a relative term is multiplied or divided.
+        """
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        for kind, value in self.code:
+            if kind == "num":
+                push(0)
+            elif kind == "sym":
+                if not symtab.has_symbol(value):
+                    raise UndefinedSymbolError(value)
+                push(0 if symtab.is_absolute(value) else 1)
+            elif kind == "loc":
+                push(1)
+            elif kind == "neg":
+                push(-pop())
+            else:
+                right = pop()
+                left = pop()
+                if value == "+":
+                    push(left + right)
+                elif value == "-":
+                    push(left - right)
+                elif left or right:
+                    raise ValueError(f"Relative term in multiplication or division: {self.text}")
+                else:
+                    push(0)
+        return stack[0]
+
+
+class _Parser:
+    """
+    Recursive-descent parser producing postfix code:
+
+        expr   := term (('+' | '-') term)*
+        term   := factor (('*' | '/') factor)*
+        factor := ('+' | '-') factor | NUMBER | SYMBOL | '*' | '(' expr ')'
+
+    A '*' in factor position is the location counter; elsewhere it multiplies.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = self._tokenize(text)
+        self.pos = 0
+        self.code = []
+        self.symbols = set()
+        self.uses_location = False
+
+    def _tokenize(self, text: str) -> list[tuple[str, str]]:
+        tokens = []
+        pos = 0
+        end = len(text.rstrip())
+        while pos < end:
+            match = _TOKEN_RE.match(text, pos)
+            if match is None:
+                raise ValueError(f"Invalid character in expression: {text}")
+            number, symbol, operator = match.groups()
+            if number is not None:
+                tokens.append(("num", number))
+            elif symbol is not None:
+                tokens.append(("sym", symbol))
+            else:
+                tokens.append(("op", operator))
+            pos = match.end()
+        return tokens
+
+    def _peek(self) -> tuple[str, str] | None:
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return None
+
+    def parse(self) -> Expression:
+        if not self.tokens:
+            raise ValueError("Empty expression.")
+        self._expr()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Unexpected token in expression: {self.text}")
+        return Expression(self.text, tuple(self.code), frozenset(self.symbols), self.uses_location)
+
+    def _expr(self):
+        self._term()
+        while (token := self._peek()) in (("op", "+"), ("op", "-")):
+            self.pos += 1
+            self._term()
+            self.code.append(("op", token[1]))
+
+    def _term(self):
+        self._factor()
+        while (token := self._peek()) in (("op", "*"), ("op", "/")):
+            self.pos += 1
+            self._factor()
+            self.code.append(("op", token[1]))
+
+    def _factor(self):
+        token = self._peek()
+        if token is None:
+            raise ValueError(f"Incomplete expression: {self.text}")
+        self.pos += 1
+        kind, value = token
+        if kind == "num":
+            self.code.append(("num", int(value)))
+        elif kind == "sym":
+            # Symbols are case-insensitive, like the symbol table.
+            name = value.upper()
+            self.symbols.add(name)
+            self.code.append(("sym", name))
+        elif value == "*":
+            self.uses_location = True
+            self.code.append(("loc", None))
+        elif value == "(":
+            self._expr()
+            if self._peek() != ("op", ")"):
+                raise ValueError(f"Missing ')' in expression: {self.text}")
+            self.pos += 1
+        elif value == "-":
+            self._factor()
+            self.code.append(("neg", None))
+        elif value == "+":
+            self._factor()
+        else:
+            raise ValueError(f"Unexpected token in expression: {self.text}")
+
+
+@lru_cache(maxsize=4096)
+def parse_expression(text: str) -> Expression:
+    """
+    Parses an operand expression. Results are cached per operand string, so
+    an operand repeated throughout a source is parsed only once.
+
+    Args:
+        text: The expression text, e.g. "TABLE+3*N".
+
+    Returns:
+        The parsed Expression.
+
+    Raises:
+        ValueError: If the text is not a valid expression.
+    """
+    return _Parser(text).parse()
+
+
+class ExpressionEvaluator:
+    """
+    Evaluates operand expressions against a SymbolTable.
+
+    Values of expressions that reference symbols are cached per operand string.
+    A symbol cannot be redefined, so once every symbol an expression uses is
+    defined its value is final, and defining further symbols does not
+    invalidate it. Failed evaluations (undefined symbols) and expressions
+    using the location counter ('*') are never cached.
+    """
+
+    def __init__(self, symtab):
+        """
+        Initializes the evaluator with an empty value cache.
+
+        Args:
+            symtab: The SymbolTable to resolve symbols against.
+        """
+        self.symtab = symtab
+        self._values = {}
+
+    def evaluate(self, text: str, location: int | None = None) -> int:
+        """
+        Evaluates an operand expression.
+
+        Args:
+            text: The expression text.
+            location: The current location counter, needed if the expression uses '*'.
+
+        Returns:
+            The integer value.
+
+        Raises:
+            UndefinedSymbolError: If a referenced symbol is not yet defined.
+            ValueError: If the expression is malformed.
+        """
+        expression = parse_expression(text)
+        if expression.constant is not None:
+            return expression.constant
+        if expression.uses_location:
+            return expression.evaluate(self.symtab, location)
+
+        value = self._values.get(text)
+        if value is None:
+            value = self._values[text] = expression.evaluate(self.symtab)
+        return value
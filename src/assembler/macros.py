@@ -0,0 +1,241 @@
+import re
+from collections.abc import Iterable, Iterator
+
+from .parser import LineParser
+
+# A parameter reference inside a macro body, e.g. &INDEV.
+_PARAMETER_RE = re.compile(r"&([A-Za-z_][A-Za-z0-9_]*)")
+
+# A keyword argument in an invocation, e.g. &INDEV=F1 or INDEV=F1.
+_KEYWORD_RE = re.compile(r"&?([A-Za-z_][A-Za-z0-9_]*)=(.*)", re.DOTALL)
+
+# Guards against macros that (directly or indirectly) invoke themselves forever.
+MAX_EXPANSION_DEPTH = 100
+
+
+def split_arguments(operand: str | None) -> list[str]:
+    """
+    Splits a macro operand field on commas that are not inside quotes.
+
+    Args:
+        operand: The operand field, e.g. "F1,BUFFER,C'A,B'".
+
+    Returns:
+        The list of argument strings; an empty list for no operand.
+    """
+    if not operand:
+        return []
+    arguments = []
+    current = []
+    quoted = False
+    for char in operand:
+        if char == "'":
+            quoted = not quoted
+        elif char == ',' and not quoted:
+            arguments.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    arguments.append("".join(current))
+    return arguments
+
+
+class MacroDefinition:
+    """
+    A macro defined between MACRO and MEND.
+    """
+
+    def __init__(self, name: str, prototype: str | None, body: list[str]):
+        """
+        Parses the prototype operand of a macro definition.
+
+        Args:
+            name: The macro name (the label of the MACRO line).
+            prototype: The MACRO operand, e.g. "&INDEV,&BUFADR,&EOR=04".
+            body: The raw source lines between MACRO and MEND.
+
+        Raises:
+            ValueError: If a parameter does not start with '&'.
+        """
+        self.name = name.upper()
+        self.parameters = []
+        self.defaults = {}
+        for parameter in split_arguments(prototype):
+            parameter = parameter.strip()
+            match = _KEYWORD_RE.fullmatch(parameter)
+            if not parameter.startswith('&') or (match is None and not parameter[1:].isidentifier()):
+                raise ValueError(f"Invalid parameter '{parameter}' in macro {self.name}")
+            if match:
+                key = match.group(1).upper()
+                self.defaults[key] = match.group(2)
+            else:
+                key = parameter[1:].upper()
+            self.parameters.append(key)
+        self.body = tuple(body)
+
+    def bind(self, operand: str | None) -> dict[str, str]:
+        """
+        Binds invocation arguments to the macro's parameters.
+
+        Args:
+            operand: The operand field of the invocation.
+
+        Returns:
+            A mapping of upper-case parameter name to argument text.
+
+        Raises:
+            ValueError: On too many positional arguments or an unknown keyword.
+        """
+        values = dict(self.defaults)
+        position = 0
+        for argument in split_arguments(operand):
+            match = _KEYWORD_RE.fullmatch(argument)
+            if match and match.group(1).upper() in self.parameters:
+                values[match.group(1).upper()] = match.group(2)
+            elif match and argument.startswith('&'):
+                raise ValueError(f"Unknown keyword argument '{argument}' for macro {self.name}")
+            else:
+                if position >= len(self.parameters):
+                    raise ValueError(f"Too many arguments for macro {self.name}")
+                values[self.parameters[position]] = argument
+                position += 1
+        return values
+
+    def expand(self, operand: str | None) -> tuple[str, ...]:
+        """
+        Substitutes invocation arguments into the macro body.
+
+        Args:
+            operand: The operand field of the invocation.
+
+        Returns:
+            The body lines with every known &PARAMETER replaced. Parameters
+            without an argument or default expand to an empty string.
+        """
+        values = self.bind(operand)
+
+        def substitute(match):
+            name = match.group(1).upper()
+            if name in self.parameters:
+                return values.get(name, "")
+            return match.group(0)
+
+        return tuple(_PARAMETER_RE.sub(substitute, line) for line in self.body)
+
+
+class MacroProcessor:
+    """
+    A one-pass macro processor that streams expanded source lines.
+
+    Definitions (MACRO ... MEND) may be nested; an inner macro is defined when
+    the macro containing it is expanded. Invocations may appear inside macro
+    bodies. Expansions are memoized per macro and operand string, so a
+    macro invoked many times with the same arguments is substituted once.
+    Definitions persist across calls to expand(), so a processor can hold a
+    macro library shared by many sources.
+    """
+
+    def __init__(self, parser: LineParser | None = None, cache_size: int = 4096):
+        """
+        Initializes an empty macro table.
+
+        Args:
+            parser: The LineParser used to recognize MACRO, MEND and invocations.
+            cache_size: The maximum number of memoized expansions.
+        """
+        self.parser = parser or LineParser()
+        self.macros = {}
+        self.cache_size = cache_size
+        self._expansions = {}
+        self.hits = 0
+        self.misses = 0
+
+    def expand(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Expands all macro definitions and invocations in a source.
+
+        Args:
+            lines: The source lines. They are read lazily, one at a time.
+
+        Returns:
+            An iterator over the expanded source lines, suitable for PassOne.run.
+
+        Raises:
+            ValueError: On an unterminated definition, bad arguments, or runaway recursion.
+        """
+        return self._process(iter(lines), 0)
+
+    def _process(self, lines: Iterator[str], depth: int) -> Iterator[str]:
+        """Yields expanded lines, consuming definitions from the same iterator."""
+        if depth > MAX_EXPANSION_DEPTH:
+            raise ValueError("Macro expansion nested too deeply.")
+
+        parse = self.parser.parse
+        for line in lines:
+            label, mnemonic, operand = parse(line)
+            if mnemonic is None:
+                yield line
+                continue
+
+            name = mnemonic.upper()
+            if name == 'MACRO':
+                self._define(label, operand, lines)
+                continue
+
+            macro = self.macros.get(name)
+            if macro is None:
+                yield line
+                continue
+
+            # A label on the invocation line labels the first expanded statement.
+            if label:
+                yield label
+            yield from self._process(iter(self._expansion(macro, operand)), depth + 1)
+
+    def _define(self, name: str | None, prototype: str | None, lines: Iterator[str]):
+        """Reads a definition body up to its matching MEND and registers the macro."""
+        if not name:
+            raise ValueError("MACRO requires a name in the label field.")
+
+        parse = self.parser.parse
+        body = []
+        nesting = 0
+        for line in lines:
+            mnemonic = parse(line)[1]
+            keyword = mnemonic.upper() if mnemonic else None
+            if keyword == 'MACRO':
+                nesting += 1
+            elif keyword == 'MEND':
+                if nesting == 0:
+                    self.define(MacroDefinition(name, prototype, body))
+                    return
+                nesting -= 1
+            body.append(line)
+        raise ValueError(f"Macro {name.upper()} is missing MEND.")
+
+    def define(self, macro: MacroDefinition):
+        """
+        Registers (or replaces) a macro definition.
+
+        Args:
+            macro: The macro to register.
+        """
+        self.macros[macro.name] = macro
+
+    def _expansion(self, macro: MacroDefinition, operand: str | None) -> tuple[str, ...]:
+        """Returns the memoized expansion of one invocation."""
+        # Keyed on the definition object, so redefining a macro never reuses
+        # expansions of its previous body.
+        key = (macro, operand)
+        expansion = self._expansions.get(key)
+        if expansion is not None:
+            self.hits += 1
+            return expansion
+
+        self.misses += 1
+        expansion = macro.expand(operand)
+        if len(self._expansions) >= self.cache_size:
+            # Evict the oldest entry; dicts keep insertion order.
+            del self._expansions[next(iter(self._expansions))]
+        self._expansions[key] = expansion
+        return expansion
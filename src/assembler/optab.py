@@ -1,22 +1,77 @@
+from types import MappingProxyType
+from typing import NamedTuple
+
+# Operand kinds for the operand field of an instruction.
+OPERAND_MEMORY = "m"    # A 15-bit memory address, optionally indexed (",X").
+OPERAND_NONE = "none"   # No operand (e.g. RSUB).
+
+
+class OpcodeInfo(NamedTuple):
+    """
+    Metadata for a single machine instruction in the OPTAB.
+    """
+    mnemonic: str
+    opcode: int
+    format: int
+    operand: str
+    length: int
+
+
+def _build_optab() -> MappingProxyType:
+    """
+    Builds the read-only mnemonic -> OpcodeInfo mapping for the standard SIC instructions.
+    """
+    entries = [
+        ("ADD", 0x18), ("AND", 0x40), ("COMP", 0x28), ("DIV", 0x24),
+        ("J", 0x3C), ("JEQ", 0x30), ("JGT", 0x34), ("JLT", 0x38),
+        ("JSUB", 0x48), ("LDA", 0x00), ("LDCH", 0x50), ("LDL", 0x08),
+        ("LDX", 0x04), ("MUL", 0x20), ("OR", 0x44), ("RD", 0xD8),
+        ("RSUB", 0x4C), ("STA", 0x0C), ("STCH", 0x54), ("STL", 0x14),
+        ("STSW", 0xE8), ("STX", 0x10), ("SUB", 0x1C), ("TD", 0xE0),
+        ("TIX", 0x2C), ("WD", 0xDC),
+    ]
+    table = {}
+    for mnemonic, opcode in entries:
+        operand = OPERAND_NONE if mnemonic == "RSUB" else OPERAND_MEMORY
+        # Every standard SIC instruction is a 3-byte Format 3 instruction.
+        table[mnemonic] = OpcodeInfo(mnemonic, opcode, 3, operand, 3)
+    return MappingProxyType(table)
+
+
+# The shared, immutable OPTAB built once at import time. Keys are upper-case mnemonics.
+OPTAB = _build_optab()
+
+# Reverse lookup: MNEMONICS[opcode] is the mnemonic for an 8-bit opcode, or None.
+MNEMONICS = tuple(
+    next((info.mnemonic for info in OPTAB.values() if info.opcode == opcode), None)
+    for opcode in range(256)
+)
+
+
+def lookup(mnemonic: str) -> OpcodeInfo | None:
+    """
+    Returns the OPTAB entry for a mnemonic, or None if it is not an instruction.
+    Upper-case mnemonics are found with a single dictionary lookup; other
+    spellings are normalized only when that lookup misses.
+    """
+    info = OPTAB.get(mnemonic)
+    if info is None:
+        info = OPTAB.get(mnemonic.upper())
+    return info
+
+
 class OpcodeTable:
     """
     Represents the Opcode Table (OPTAB) for the SIC machine.
     It stores a mapping of mnemonic names to their machine code values.
+    All instances share the module-level OPTAB, so creating one is free.
     """
 
     def __init__(self):
         """
-        Initializes the OPTAB with all the standard SIC instructions.
+        Initializes the OPTAB view over the shared table of standard SIC instructions.
         """
-        self._opcodes = {
-            "ADD": 0x18, "AND": 0x40, "COMP": 0x28, "DIV": 0x24,
-            "J": 0x3C, "JEQ": 0x30, "JGT": 0x34, "JLT": 0x38,
-            "JSUB": 0x48, "LDA": 0x00, "LDCH": 0x50, "LDL": 0x08,
-            "LDX": 0x04, "MUL": 0x20, "OR": 0x44, "RD": 0xD8,
-            "RSUB": 0x4C, "STA": 0x0C, "STCH": 0x54, "STL": 0x14,
-            "STSW": 0xE8, "STX": 0x10, "SUB": 0x1C, "TD": 0xE0,
-            "TIX": 0x2C, "WD": 0xDC
-        }
+        self._opcodes = OPTAB
 
     def get_opcode(self, mnemonic: str) -> int:
         """
@@ -31,7 +86,28 @@ class OpcodeTable:
         Raises:
             KeyError: If the mnemonic does not exist in the table.
         """
-        return self._opcodes[mnemonic.upper()]
+        info = lookup(mnemonic)
+        if info is None:
+            raise KeyError(mnemonic)
+        return info.opcode
+
+    def get_info(self, mnemonic: str) -> OpcodeInfo:
+        """
+        Looks up the full metadata record for a given mnemonic.
+
+        Args:
+            mnemonic: The instruction mnemonic (e.g., "LDA").
+
+        Returns:
+            The OpcodeInfo entry with opcode, format, operand kind and length.
+
+        Raises:
+            KeyError: If the mnemonic does not exist in the table.
+        """
+        info = lookup(mnemonic)
+        if info is None:
+            raise KeyError(mnemonic)
+        return info
 
     def is_mnemonic(self, mnemonic: str) -> bool:
         """
@@ -43,4 +119,16 @@ class OpcodeTable:
         Returns:
             True if the mnemonic is valid, False otherwise.
         """
-        return mnemonic.upper() in self._opcodes
+        return lookup(mnemonic) is not None
+
+    def get_mnemonic(self, opcode: int) -> str | None:
+        """
+        Looks up the mnemonic for an 8-bit opcode.
+
+        Args:
+            opcode: The opcode value (0-255).
+
+        Returns:
+            The mnemonic, or None if the opcode is not a SIC instruction.
+        """
+        return MNEMONICS[opcode & 0xFF]
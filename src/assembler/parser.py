@@ -1,9 +1,33 @@
+import re
+
+# Re-reads the operand field of a line whose operand holds a quoted literal
+# with embedded spaces, e.g. C'EOF  '. The leading part skips the optional
+# label and the mnemonic. Only consulted when a whitespace split cut a quote.
+_QUOTED_OPERAND_RE = re.compile(r"\S*\s+\S+\s+((?:[^\s']+|'[^'\n]*')+)")
+
+# Classic fixed-column layout from Beck: label in columns 1-8, mnemonic in
+# columns 10-15 and operand in columns 18-35 (1-based, inclusive).
+LABEL_COLUMNS = slice(0, 8)
+MNEMONIC_COLUMNS = slice(9, 15)
+OPERAND_COLUMNS = slice(17, 35)
+
+
 class LineParser:
     """
     Parses a single line of SIC assembly source code into its constituent parts:
     (label, mnemonic, operand).
     """
 
+    def __init__(self, fixed_columns: bool = False):
+        """
+        Initializes the parser.
+
+        Args:
+            fixed_columns: If True, fields are sliced from the fixed columns of
+                the classic Beck source layout instead of being split on whitespace.
+        """
+        self.fixed_columns = fixed_columns
+
     def parse(self, line: str) -> tuple[str | None, str | None, str | None]:
         """
         Parses a line of assembly code.
@@ -15,34 +39,54 @@ class LineParser:
             A tuple containing the label, mnemonic, and operand.
             If a component is not present, it will be None.
         """
-        # Handle empty lines and comments (though PassOne might filter them too)
-        if not line or not line.strip() or line.strip().startswith('.'):
-            return None, None, None
+        if self.fixed_columns:
+            return self._parse_fixed(line)
 
+        # A single split serves both the empty/comment check and field extraction.
         parts = line.split()
-        if not parts:
+        if not parts or parts[0][0] == '.':
             return None, None, None
 
-        label = None
-        mnemonic = None
-        operand = None
-
-        # Check if there is a label (line does not start with whitespace)
-        # Note: We use the original line string to check indentation
-        has_label = not line[0].isspace()
-        
-        idx = 0
-        if has_label:
-            if idx < len(parts):
-                label = parts[idx]
-                idx += 1
-        
-        if idx < len(parts):
-            mnemonic = parts[idx]
-            idx += 1
-
-        if idx < len(parts):
-            operand = parts[idx]
-            idx += 1
+        count = len(parts)
+        # A label must begin in column 1.
+        if line[0].isspace():
+            label = None
+            mnemonic = parts[0]
+            operand = parts[1] if count > 1 else None
+        else:
+            label = parts[0]
+            mnemonic = parts[1] if count > 1 else None
+            operand = parts[2] if count > 2 else None
+
+        if operand is not None and operand.count("'") % 2:
+            operand = self._rescan_quoted_operand(line, operand)
+
+        return label, mnemonic, operand
+
+    def _rescan_quoted_operand(self, line: str, operand: str) -> str:
+        """
+        Re-reads an operand whose quoted literal contains whitespace.
+
+        Args:
+            line: The full source line.
+            operand: The operand token produced by the whitespace split.
+
+        Returns:
+            The operand including the whole quoted literal. If the quote is
+            never closed the original token is returned unchanged.
+        """
+        match = _QUOTED_OPERAND_RE.match(line)
+        if match is None or len(match.group(1)) <= len(operand):
+            return operand
+        return match.group(1)
+
+    def _parse_fixed(self, line: str) -> tuple[str | None, str | None, str | None]:
+        """Parses a line laid out in the fixed columns of the Beck source format."""
+        stripped = line.lstrip()
+        if not stripped or stripped[0] == '.':
+            return None, None, None
 
+        label = line[LABEL_COLUMNS].strip() or None
+        mnemonic = line[MNEMONIC_COLUMNS].strip() or None
+        operand = line[OPERAND_COLUMNS].strip() or None
         return label, mnemonic, operand
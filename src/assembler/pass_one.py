@@ -1,6 +1,11 @@
+import itertools
+from collections.abc import Iterable
+
 from .parser import LineParser
-from .optab import OpcodeTable
+from .optab import OpcodeTable, lookup
 from .symtab import SymbolTable
+from .expressions import ExpressionEvaluator, UndefinedSymbolError, parse_expression
+from .macros import MacroProcessor
 from .directive_handlers import (
     WordDirectiveHandler, ReswDirectiveHandler, 
     ResbDirectiveHandler, ByteDirectiveHandler
@@ -18,8 +23,17 @@ class PassOne:
     and calculates the program length.
     """
 
-    def __init__(self):
-        self.parser = LineParser()
+    def __init__(self, fixed_columns: bool = False, macro_processor: MacroProcessor | None = None):
+        """
+        Initializes Pass One with its line parser, OPTAB and directive handlers.
+
+        Args:
+            fixed_columns: Parse source lines using the fixed-column Beck layout.
+            macro_processor: If given, source lines are streamed through it so
+                macros are expanded on the fly.
+        """
+        self.parser = LineParser(fixed_columns)
+        self.macro_processor = macro_processor
         self.optab = OpcodeTable()
         self.directive_handlers = {
             'WORD': WordDirectiveHandler(),
@@ -28,12 +42,13 @@ class PassOne:
             'BYTE': ByteDirectiveHandler(),
         }
 
-    def run(self, source_lines: list[str]) -> tuple[SymbolTable, PassOneResult]:
+    def run(self, source_lines: Iterable[str]) -> tuple[SymbolTable, PassOneResult]:
         """
         Executes Pass One of the assembler.
 
         Args:
-            source_lines: A list of strings, where each string is a line of source code.
+            source_lines: An iterable of strings, where each string is a line of source code.
+                Lines are consumed one at a time, so a generator can be passed directly.
 
         Returns:
             A tuple containing the populated SymbolTable and a result object with program length.
@@ -43,35 +58,41 @@ class PassOne:
         start_address = 0
         execution_start_address = 0
 
-        # Pre-process lines to handle START directive correctly
-        # We need to find the first real instruction/directive
-        processed_lines = []
-        for line in source_lines:
-            if line.strip() and not line.strip().startswith('.'):
-                processed_lines.append(line)
+        if self.macro_processor is not None:
+            source_lines = self.macro_processor.expand(source_lines)
 
-        if not processed_lines:
-             return symtab, PassOneResult(0, 0)
+        # Each line is parsed exactly once. Empty lines and comments parse to
+        # (None, None, None) and are skipped here.
+        parse = self.parser.parse
+        statements = (
+            fields for fields in map(parse, source_lines)
+            if fields[0] is not None or fields[1] is not None
+        )
 
-        # check first line for START
-        first_line = processed_lines[0]
-        label, mnemonic, operand = self.parser.parse(first_line)
+        # check first statement for START
+        first = next(statements, None)
+        if first is None:
+            return symtab, PassOneResult(0, 0)
 
+        label, mnemonic, operand = first
         if mnemonic == 'START':
             start_address = int(operand, 16) if operand else 0
             locctr = start_address
             execution_start_address = start_address
             if label:
                 symtab.add_symbol(label, locctr)
-            processed_lines = processed_lines[1:]
         else:
-            start_address = 0
-            locctr = 0
-            execution_start_address = 0
-        
-        for line in processed_lines:
-            label, mnemonic, operand = self.parser.parse(line)
+            statements = itertools.chain((first,), statements)
+
+        evaluator = ExpressionEvaluator(symtab)
+        # EQU definitions waiting on forward references: (label, operand, locctr).
+        pending = []
+        pending_labels = set()
+        # Location counter saved by ORG, and the highest address reached.
+        saved_locctr = None
+        highest = locctr
 
+        for label, mnemonic, operand in statements:
             if mnemonic == 'END':
                 if operand:
                     # Try to resolve operand as symbol or hex
@@ -84,21 +105,85 @@ class PassOne:
                             pass # Keep default
                 break
 
+            if label and (symtab.has_symbol(label) or label.upper() in pending_labels):
+                raise ValueError(f"Duplicate symbol found: {label}")
+
+            if mnemonic == 'EQU':
+                if not label or not operand:
+                    raise ValueError("EQU requires a label and an operand.")
+                try:
+                    self._define_equ(evaluator, label, operand, locctr)
+                except UndefinedSymbolError:
+                    # Forward reference: resolve once the whole source is read.
+                    pending.append((label, operand, locctr))
+                    pending_labels.add(label.upper())
+                continue
+
             if label:
-                if symtab.has_symbol(label):
-                     raise ValueError(f"Duplicate symbol found: {label}")
                 symtab.add_symbol(label, locctr)
 
             if not mnemonic:
                 continue
 
-            if self.optab.is_mnemonic(mnemonic):
-                locctr += 3
+            info = lookup(mnemonic)
+            if info is not None:
+                locctr += info.length
             elif mnemonic in self.directive_handlers:
                 handler = self.directive_handlers[mnemonic]
-                locctr += handler.handle(operand)
+                locctr += handler.handle(operand, evaluator)
+            elif mnemonic == 'ORG':
+                highest = max(highest, locctr)
+                if operand:
+                    # Forward references are not allowed in ORG.
+                    saved_locctr = locctr
+                    locctr = evaluator.evaluate(operand, locctr)
+                elif saved_locctr is not None:
+                    locctr, saved_locctr = saved_locctr, None
             else:
                 raise ValueError(f"Invalid operation code: {mnemonic}")
 
-        program_length = locctr - start_address
+        self._resolve_pending(pending, evaluator)
+
+        program_length = max(highest, locctr) - start_address
         return symtab, PassOneResult(program_length, execution_start_address)
+
+    @staticmethod
+    def _define_equ(evaluator: ExpressionEvaluator, label: str, operand: str, locctr: int):
+        """
+        Defines an EQU symbol: relative if its expression is an address,
+        absolute if it is a constant.
+
+        Raises:
+            UndefinedSymbolError: If the expression has a forward reference.
+            ValueError: If the expression is neither absolute nor relative.
+        """
+        value = evaluator.evaluate(operand, locctr)
+        relocation = parse_expression(operand).relocation(evaluator.symtab)
+        if relocation not in (0, 1):
+            raise ValueError(f"EQU for {label} is neither absolute nor relative: {operand}")
+        evaluator.symtab.add_symbol(label, value, absolute=relocation == 0)
+
+    def _resolve_pending(self, pending: list[tuple[str, str, int]], evaluator: ExpressionEvaluator):
+        """
+        Defines EQU symbols whose expressions contained forward references.
+        Definitions are retried until no more can be resolved, so chains of
+        forward references are handled in any order.
+
+        Args:
+            pending: (label, operand, locctr) for each deferred EQU.
+            evaluator: The evaluator bound to the run's symbol table.
+
+        Raises:
+            ValueError: If a symbol still cannot be resolved.
+        """
+        while pending:
+            unresolved = []
+            for label, operand, locctr in pending:
+                try:
+                    self._define_equ(evaluator, label, operand, locctr)
+                except UndefinedSymbolError:
+                    unresolved.append((label, operand, locctr))
+            if len(unresolved) == len(pending):
+                label, operand, _ = unresolved[0]
+                raise ValueError(f"Cannot resolve EQU for {label}: {operand}")
+            pending = unresolved
@@ -0,0 +1,224 @@
+from collections.abc import Iterable
+
+from .parser import LineParser
+from .optab import lookup, OPERAND_NONE
+from .symtab import SymbolTable
+from .expressions import ExpressionEvaluator, parse_expression
+from .macros import MacroProcessor
+from .pass_one import PassOne, PassOneResult
+from .directive_handlers import (
+    WordDirectiveHandler, ReswDirectiveHandler,
+    ResbDirectiveHandler, ByteDirectiveHandler
+)
+
+# A Text record holds at most 30 bytes of object code (60 hex digits).
+MAX_TEXT_BYTES = 30
+
+
+class PassTwo:
+    """
+    Implements Pass Two of the SIC assembler.
+    This pass re-reads the source with the symbol table built by Pass One and
+    produces an object program of H, T, M and E records, in the layout the
+    Loader reads.
+
+    Operands whose expression is an address (net one relative term, such as
+    TABLE+3 or *) are relocatable: each gets a full-word Modification record,
+    so the program can be loaded at another address. Absolute operands, such
+    as numbers, EQU constants and differences like LAST-FIRST, are not.
+    """
+
+    def __init__(self, fixed_columns: bool = False):
+        """
+        Initializes Pass Two with its line parser and directive handlers.
+
+        Args:
+            fixed_columns: Parse source lines using the fixed-column Beck layout.
+        """
+        self.parser = LineParser(fixed_columns)
+        self.directive_handlers = {
+            'WORD': WordDirectiveHandler(),
+            'RESW': ReswDirectiveHandler(),
+            'RESB': ResbDirectiveHandler(),
+            'BYTE': ByteDirectiveHandler(),
+        }
+
+    def run(self, source_lines: Iterable[str], symtab: SymbolTable, result: PassOneResult) -> str:
+        """
+        Executes Pass Two of the assembler.
+
+        Args:
+            source_lines: The same source lines Pass One read.
+            symtab: The SymbolTable produced by Pass One.
+            result: The PassOneResult produced by Pass One.
+
+        Returns:
+            The object program, one record per line.
+
+        Raises:
+            ValueError: On an undefined symbol, an operand out of range, or a
+                malformed BYTE constant.
+        """
+        parse = self.parser.parse
+        statements = (
+            fields for fields in map(parse, source_lines)
+            if fields[0] is not None or fields[1] is not None
+        )
+        evaluator = ExpressionEvaluator(symtab)
+
+        name = ""
+        start_address = 0
+        locctr = 0
+        saved_locctr = None
+        text = _TextRecords()
+        modifications = []
+
+        first = True
+        for label, mnemonic, operand in statements:
+            if first:
+                first = False
+                if mnemonic == 'START':
+                    name = label or ""
+                    start_address = locctr = int(operand, 16) if operand else 0
+                    continue
+
+            if mnemonic == 'END':
+                break
+            if not mnemonic or mnemonic == 'EQU':
+                continue
+
+            info = lookup(mnemonic)
+            if info is not None:
+                address = 0
+                indexed = False
+                if info.operand != OPERAND_NONE and operand:
+                    expression, indexed = _split_index(operand)
+                    address = self._evaluate(evaluator, expression, locctr)
+                    if not 0 <= address <= 0x7FFF:
+                        raise ValueError(f"Operand out of range for {mnemonic}: {operand}")
+                    if _is_relocatable(expression, symtab):
+                        modifications.append(locctr)
+                word = (info.opcode << 16) | (0x8000 if indexed else 0) | address
+                text.add(locctr, word.to_bytes(3, "big"))
+                locctr += info.length
+            elif mnemonic == 'WORD':
+                value = self._evaluate(evaluator, operand, locctr)
+                if _is_relocatable(operand, symtab):
+                    modifications.append(locctr)
+                text.add(locctr, (value & 0xFFFFFF).to_bytes(3, "big"))
+                locctr += 3
+            elif mnemonic == 'BYTE':
+                text.add(locctr, _byte_constant(operand))
+                locctr += self.directive_handlers['BYTE'].handle(operand)
+            elif mnemonic in self.directive_handlers:
+                # RESW/RESB: reserved space breaks the current Text record.
+                text.flush()
+                locctr += self.directive_handlers[mnemonic].handle(operand, evaluator)
+            elif mnemonic == 'ORG':
+                text.flush()
+                if operand:
+                    saved_locctr = locctr
+                    locctr = evaluator.evaluate(operand, locctr)
+                elif saved_locctr is not None:
+                    locctr, saved_locctr = saved_locctr, None
+            else:
+                raise ValueError(f"Invalid operation code: {mnemonic}")
+
+        text.flush()
+        records = [f"H{name[:6]:<6}{start_address:06X}{result.program_length:06X}"]
+        records.extend(text.records)
+        records.extend(f"M{address:06X}06+{name[:6]}" for address in modifications)
+        records.append(f"E{result.execution_start_address:06X}")
+        return "\n".join(records)
+
+    @staticmethod
+    def _evaluate(evaluator: ExpressionEvaluator, text: str, locctr: int) -> int:
+        """Evaluates an operand, reporting undefined symbols as ValueError."""
+        try:
+            return evaluator.evaluate(text, locctr)
+        except ValueError as error:
+            raise ValueError(f"Invalid operand '{text}': {error}") from None
+
+
+class _TextRecords:
+    """Accumulates object code bytes into Text records of contiguous addresses."""
+
+    def __init__(self):
+        self.records = []
+        self._start = None
+        self._code = bytearray()
+
+    def add(self, address: int, code: bytes):
+        """Appends code at address, starting a new record when needed."""
+        if self._start is not None and (
+            address != self._start + len(self._code)
+            or len(self._code) + len(code) > MAX_TEXT_BYTES
+        ):
+            self.flush()
+        if self._start is None:
+            self._start = address
+        self._code += code
+
+    def flush(self):
+        """Closes the current record, if any."""
+        if self._start is not None and self._code:
+            self.records.append(f"T{self._start:06X}{len(self._code):02X}{self._code.hex().upper()}")
+        self._start = None
+        self._code = bytearray()
+
+
+def _split_index(operand: str) -> tuple[str, bool]:
+    """Splits a trailing ',X' off an instruction operand."""
+    expression, comma, register = operand.rpartition(",")
+    if comma and register.strip().upper() == "X":
+        return expression.strip(), True
+    return operand, False
+
+
+def _is_relocatable(text: str, symtab: SymbolTable) -> bool:
+    """
+    Returns True if an operand is an address that moves with the program,
+    False if it is absolute.
+
+    Raises:
+        ValueError: If the operand is neither absolute nor relative.
+    """
+    relocation = parse_expression(text).relocation(symtab)
+    if relocation not in (0, 1):
+        raise ValueError(f"Operand is neither absolute nor relative: {text}")
+    return relocation == 1
+
+
+def _byte_constant(operand: str) -> bytes:
+    """Converts a BYTE operand (C'...' or X'...') to its bytes."""
+    kind = operand[:1].upper()
+    body = operand[2:-1]
+    if kind == 'C':
+        return body.encode("latin-1")
+    if kind == 'X':
+        try:
+            return bytes.fromhex(body)
+        except ValueError:
+            raise ValueError(f"Invalid BYTE operand format: {operand}") from None
+    raise ValueError(f"Invalid BYTE operand format: {operand}")
+
+
+def assemble(source_lines: Iterable[str], fixed_columns: bool = False,
+             macro_processor: MacroProcessor | None = None) -> tuple[str, SymbolTable]:
+    """
+    Assembles a source program with both passes.
+
+    Args:
+        source_lines: The source lines. They are read once, so a generator is fine.
+        fixed_columns: Parse source lines using the fixed-column Beck layout.
+        macro_processor: If given, macros are expanded before assembly.
+
+    Returns:
+        A tuple of the object program and the SymbolTable.
+    """
+    if macro_processor is not None:
+        source_lines = macro_processor.expand(source_lines)
+    # Both passes read the source, so it is materialized once.
+    source = list(source_lines)
+    symtab, result = PassOne(fixed_columns).run(source)
+    return PassTwo(fixed_columns).run(source, symtab, result), symtab
@@ -1,7 +1,18 @@
+import bisect
+import sys
+from collections.abc import Iterable
+
+
 class SymbolTable:
     """
     Represents the Symbol Table (SYMTAB) for the SIC assembler.
-    It stores a mapping of label names to their memory addresses.
+    It stores a mapping of label names to their memory addresses, plus an
+    address-ordered index for reverse lookups ("which symbol covers address N").
+
+    Symbols are relative (labels, whose values are addresses and move when the
+    program is relocated) or absolute (EQU constants). Absolute symbols are
+    kept out of the address index, so a constant whose value happens to equal
+    an address is never reported as the symbol at that address.
     """
 
     def __init__(self):
@@ -9,22 +20,87 @@ class SymbolTable:
         Initializes an empty SYMTAB.
         """
         self._symbols = {}
+        # Spelling -> interned upper-case name, filled as symbols are added so
+        # lookups using the defining spelling skip str.upper().
+        self._keys = {}
+        # Parallel lists sorted by address; names at equal addresses keep
+        # definition order.
+        self._addresses = []
+        self._names = []
+        # Keys of the absolute symbols.
+        self._absolute = set()
+
+    def _normalize(self, label: str) -> str:
+        """Returns the upper-case key for a label, reusing the interned key when known."""
+        key = self._keys.get(label)
+        if key is None:
+            key = label.upper()
+        return key
 
-    def add_symbol(self, label: str, address: int):
+    def _intern(self, label: str) -> str:
+        """Interns and remembers the upper-case key for a defining spelling."""
+        key = sys.intern(label.upper())
+        self._keys[label] = key
+        self._keys[key] = key
+        return key
+
+    def add_symbol(self, label: str, address: int, absolute: bool = False):
         """
         Adds a new symbol and its address to the table.
 
         Args:
             label: The symbol's name.
-            address: The symbol's memory address.
+            address: The symbol's memory address, or its value if absolute.
+            absolute: True for a constant that is not an address; it is
+                not relocated and not used for reverse lookups.
 
         Raises:
             ValueError: If the symbol already exists in the table.
         """
-        label_upper = label.upper()
+        label_upper = self._normalize(label)
         if label_upper in self._symbols:
             raise ValueError(f"Duplicate symbol found: {label}")
+        label_upper = self._intern(label)
         self._symbols[label_upper] = address
+        if absolute:
+            self._absolute.add(label_upper)
+            return
+
+        # Sources define symbols in ascending address order, so this is
+        # usually an append.
+        index = bisect.bisect_right(self._addresses, address)
+        self._addresses.insert(index, address)
+        self._names.insert(index, label_upper)
+
+    def add_symbols(self, symbols: Iterable[tuple[str, int]]):
+        """
+        Adds many relative symbols at once, re-sorting the address index only once.
+
+        Args:
+            symbols: An iterable of (label, address) pairs.
+
+        Raises:
+            ValueError: If any symbol already exists in the table or is repeated.
+                No symbol is added in that case.
+        """
+        new_entries = []
+        seen = set()
+        for label, address in symbols:
+            label_upper = self._normalize(label)
+            if label_upper in self._symbols or label_upper in seen:
+                raise ValueError(f"Duplicate symbol found: {label}")
+            seen.add(label_upper)
+            new_entries.append((label, address))
+
+        for label, address in new_entries:
+            self._symbols[self._intern(label)] = address
+
+        entries = list(zip(self._addresses, self._names))
+        entries.extend((address, self._keys[label]) for label, address in new_entries)
+        # Stable sort on the address only, so equal addresses keep definition order.
+        entries.sort(key=lambda entry: entry[0])
+        self._addresses = [address for address, _ in entries]
+        self._names = [name for _, name in entries]
 
     def has_symbol(self, label: str) -> bool:
         """
@@ -36,7 +112,19 @@ class SymbolTable:
         Returns:
             True if the symbol exists, False otherwise.
         """
-        return label.upper() in self._symbols
+        return self._normalize(label) in self._symbols
+
+    def is_absolute(self, label: str) -> bool:
+        """
+        Checks if a symbol is absolute (a constant) rather than relative.
+
+        Args:
+            label: The symbol to check.
+
+        Returns:
+            True if the symbol is defined as absolute, False otherwise.
+        """
+        return self._normalize(label) in self._absolute
 
     def get_address(self, label: str) -> int:
         """
@@ -51,4 +139,70 @@ class SymbolTable:
         Raises:
             KeyError: If the symbol does not exist.
         """
-        return self._symbols[label.upper()]
+        return self._symbols[self._normalize(label)]
+
+    def symbol_at(self, address: int) -> str | None:
+        """
+        Finds the symbol covering an address: the one with the highest address
+        not above it. Among symbols sharing that address, the last defined wins.
+
+        Args:
+            address: The memory address to look up.
+
+        Returns:
+            The symbol name, or None if no symbol lies at or below the address.
+        """
+        index = bisect.bisect_right(self._addresses, address)
+        if index == 0:
+            return None
+        return self._names[index - 1]
+
+    def symbols_in_range(self, low: int, high: int) -> list[tuple[str, int]]:
+        """
+        Lists the symbols whose addresses fall within [low, high).
+
+        Args:
+            low: The first address of the range.
+            high: The address just past the end of the range.
+
+        Returns:
+            A list of (name, address) pairs in address order.
+        """
+        start = bisect.bisect_left(self._addresses, low)
+        end = bisect.bisect_left(self._addresses, high, start)
+        return list(zip(self._names[start:end], self._addresses[start:end]))
+
+    def describe_address(self, address: int) -> str:
+        """
+        Formats an address relative to the symbol covering it.
+
+        Args:
+            address: The memory address to describe.
+
+        Returns:
+            "NAME" or "NAME+offset" (offset in hex), or the bare hex address if
+            no symbol covers it.
+        """
+        index = bisect.bisect_right(self._addresses, address)
+        if index == 0:
+            return f"{address:04X}"
+        offset = address - self._addresses[index - 1]
+        name = self._names[index - 1]
+        return f"{name}+{offset:X}" if offset else name
+
+    def items(self) -> list[tuple[str, int]]:
+        """
+        Returns the (name, address) pairs of the relative symbols in address
+        order. Absolute symbols are listed by constants().
+        """
+        return list(zip(self._names, self._addresses))
+
+    def constants(self) -> list[tuple[str, int]]:
+        """
+        Returns the (name, value) pairs of the absolute symbols, ordered by value.
+        """
+        return sorted(((name, self._symbols[name]) for name in self._absolute),
+                      key=lambda entry: (entry[1], entry[0]))
+
+    def __len__(self) -> int:
+        return len(self._symbols)
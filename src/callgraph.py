@@ -0,0 +1,175 @@
+from .assembler.optab import OPTAB
+
+JSUB = OPTAB["JSUB"].opcode
+RSUB = OPTAB["RSUB"].opcode
+
+
+class CallGraphProfiler:
+    """
+    Attributes executed instructions to subroutines called with JSUB/RSUB.
+
+    Attach it with machine.attach(profiler). A shadow call stack follows
+    JSUB, which saves the return address in L, and RSUB, which jumps back
+    through L. Routines are identified by their entry address; the routine
+    running when profiling starts is the root. Instructions are counted per
+    call stack, and only at calls and returns, so ordinary instructions cost
+    one opcode check. Inclusive and exclusive counts per routine, folded
+    stacks for flame graph tools and callgrind output are derived from the
+    per-stack counts.
+    """
+
+    def __init__(self):
+        """
+        Initializes the profiler with an empty call graph.
+        """
+        # Call stack (tuple of routine entry addresses) -> instructions executed
+        # with that stack, excluding any callee.
+        self.stack_counts = {}
+        # (caller, callee) -> number of JSUBs.
+        self.call_counts = {}
+        # Return address of each active call, innermost last.
+        self._return_addresses = []
+        self._path = None
+
+    def run(self, machine, ticks):
+        """
+        Executes instructions on the machine, tracking calls and returns.
+
+        Args:
+            machine: The SICMachine being profiled.
+            ticks: An iterator yielding once per instruction to execute.
+        """
+        step = machine.cpu.step
+        registers = machine.registers
+        memory = machine.memory.buffer
+        stack_counts = self.stack_counts
+        call_counts = self.call_counts
+        returns = self._return_addresses
+        path = self._path if self._path is not None else (registers.PC,)
+        executed = 0
+        accounted = 0
+        try:
+            for _ in ticks:
+                pc = registers.PC
+                step()
+                executed += 1
+                opcode = memory[pc]
+                if opcode == JSUB:
+                    # The JSUB itself is charged to the caller.
+                    stack_counts[path] = stack_counts.get(path, 0) + executed - accounted
+                    accounted = executed
+                    callee = registers.PC
+                    edge = (path[-1], callee)
+                    call_counts[edge] = call_counts.get(edge, 0) + 1
+                    returns.append(registers.L)
+                    path += (callee,)
+                elif opcode == RSUB:
+                    # Unwind to the call this returns from. Routines that return
+                    # past their caller pop several frames; an RSUB to an address
+                    # no active call returns to is treated as a plain jump.
+                    target = registers.PC
+                    depth = len(returns) - 1
+                    while depth >= 0 and returns[depth] != target:
+                        depth -= 1
+                    if depth >= 0:
+                        stack_counts[path] = stack_counts.get(path, 0) + executed - accounted
+                        accounted = executed
+                        del returns[depth:]
+                        path = path[:depth + 1]
+        finally:
+            if executed > accounted:
+                stack_counts[path] = stack_counts.get(path, 0) + executed - accounted
+            self._path = path
+
+    @property
+    def total(self) -> int:
+        """The total number of instructions counted."""
+        return sum(self.stack_counts.values())
+
+    def routine_costs(self) -> dict[int, tuple[int, int]]:
+        """
+        Returns instruction counts per routine.
+
+        Returns:
+            A dict mapping routine entry address to (inclusive, exclusive).
+            Recursive routines are counted once per stack for inclusive cost.
+        """
+        inclusive = {}
+        exclusive = {}
+        for stack, count in self.stack_counts.items():
+            exclusive[stack[-1]] = exclusive.get(stack[-1], 0) + count
+            for routine in set(stack):
+                inclusive[routine] = inclusive.get(routine, 0) + count
+        return {routine: (inclusive[routine], exclusive.get(routine, 0)) for routine in inclusive}
+
+    def _edge_costs(self) -> dict[tuple[int, int], int]:
+        """Returns the inclusive cost of the calls along each caller/callee edge."""
+        costs = {}
+        for stack, count in self.stack_counts.items():
+            for edge in set(zip(stack, stack[1:])):
+                costs[edge] = costs.get(edge, 0) + count
+        return costs
+
+    @staticmethod
+    def _name(address: int, symtab) -> str:
+        """Names a routine by symbol if possible, otherwise by hex address."""
+        return symtab.describe_address(address) if symtab is not None else f"{address:04X}"
+
+    def folded_stacks(self, symtab=None) -> str:
+        """
+        Formats the profile as folded stacks ("MAIN;SORT;SWAP 42" per line),
+        the input format of flamegraph.pl and compatible tools.
+
+        Args:
+            symtab: Optional SymbolTable used to name routines.
+        """
+        lines = [
+            ";".join(self._name(routine, symtab) for routine in stack) + f" {count}"
+            for stack, count in sorted(self.stack_counts.items())
+        ]
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def callgrind(self, symtab=None) -> str:
+        """
+        Formats the profile in the callgrind format read by KCachegrind and
+        gprof2dot. Costs are instruction counts.
+
+        Args:
+            symtab: Optional SymbolTable used to name routines.
+        """
+        lines = ["# callgrind format", "version: 1", "creator: sic-callgraph", "events: Instructions", ""]
+        edge_costs = self._edge_costs()
+        for routine, (_, exclusive) in sorted(self.routine_costs().items()):
+            lines.append(f"fn={self._name(routine, symtab)}")
+            lines.append(f"0 {exclusive}")
+            for (caller, callee), calls in sorted(self.call_counts.items()):
+                if caller == routine:
+                    lines.append(f"cfn={self._name(callee, symtab)}")
+                    lines.append(f"calls={calls} 0")
+                    lines.append(f"0 {edge_costs.get((caller, callee), 0)}")
+            lines.append("")
+        return "\n".join(lines)
+
+    def report(self, symtab=None, limit: int = 10) -> str:
+        """
+        Formats the routines with the highest inclusive cost.
+
+        Args:
+            symtab: Optional SymbolTable used to name routines.
+            limit: The number of routines to list.
+
+        Returns:
+            The report text.
+        """
+        total = self.total
+        lines = [f"Instructions executed: {total}", ""]
+        lines.append(f"{'ROUTINE':<12} {'INCLUSIVE':>12} {'EXCLUSIVE':>12} {'CALLS':>8}")
+        calls = {}
+        for (_, callee), count in self.call_counts.items():
+            calls[callee] = calls.get(callee, 0) + count
+        costs = sorted(self.routine_costs().items(), key=lambda entry: (-entry[1][0], entry[0]))
+        for routine, (inclusive, exclusive) in costs[:limit]:
+            lines.append(
+                f"{self._name(routine, symtab):<12} {inclusive:>12} {exclusive:>12} {calls.get(routine, 0):>8}"
+            )
+        return "\n".join(lines)
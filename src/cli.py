@@ -0,0 +1,202 @@
+"""
+Command-line interface, run as ``python -m src``.
+
+    python -m src assemble PROGRAM.asm [-o PROGRAM.obj]
+    python -m src run PROGRAM [--max-steps N] [--input FILE] [--output FILE]
+                              [--load-address HEX] [--timeout SECONDS]
+                              [--profile] [--trace FILE]
+    python -m src serve (--unix PATH | --tcp [HOST:]PORT) [--workers N]
+
+PROGRAM may be SIC source or an object program. run exits with status 0 once
+the program halts, 1 on an emulation error and 3 if --max-steps or --timeout
+stopped it first. Only argparse is imported at
+startup; the machine, assembler, profiler and trace writer are imported by
+the subcommand that needs them.
+"""
+import argparse
+import sys
+
+# Beck's conventional device numbers for input and output.
+DEFAULT_INPUT_DEVICE = 0xF1
+DEFAULT_OUTPUT_DEVICE = 0x05
+
+# Exit statuses of the run command; argparse already uses 2 for usage errors.
+EXIT_HALTED = 0
+EXIT_ERROR = 1
+EXIT_LIMIT = 3
+
+
+def _hex(text: str) -> int:
+    """Parses a hexadecimal command-line value."""
+    return int(text, 16)
+
+
+def _is_object_program(lines: list[str]) -> bool:
+    """Recognizes an object program by its Header record."""
+    for line in lines:
+        line = line.strip()
+        if line:
+            header = line[7:19]
+            return line[0] == "H" and len(header) == 12 and all(c in "0123456789ABCDEFabcdef" for c in header)
+    return False
+
+
+def _read_lines(path: str) -> list[str]:
+    if path == "-":
+        return sys.stdin.read().splitlines()
+    with open(path) as file:
+        return file.read().splitlines()
+
+
+def _assemble_lines(lines: list[str]) -> str:
+    from .assembler.pass_two import assemble
+    from .assembler.macros import MacroProcessor
+
+    object_code, _ = assemble(lines, macro_processor=MacroProcessor())
+    return object_code
+
+
+def _command_assemble(args) -> int:
+    object_code = _assemble_lines(_read_lines(args.program))
+    if args.output == "-":
+        print(object_code)
+    else:
+        with open(args.output, "w") as file:
+            file.write(object_code + "\n")
+    return 0
+
+
+def _command_run(args) -> int:
+    from .machine import SICMachine
+    from .devices import StreamInputDevice, StreamOutputDevice
+    from .limits import ExecutionLimits, LimitExceeded, MAX_INSTRUCTIONS
+
+    lines = _read_lines(args.program)
+    object_code = "\n".join(lines) if _is_object_program(lines) else _assemble_lines(lines)
+
+    machine = SICMachine()
+    machine.load_object_code(object_code, args.load_address)
+
+    input_file = output_file = None
+    try:
+        if args.input is not None:
+            input_file = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+            machine.device_manager.add_device(args.input_device, StreamInputDevice(input_file))
+        output_file = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+        output = StreamOutputDevice(output_file)
+        machine.device_manager.add_device(args.output_device, output)
+
+        instrument = None
+        if args.profile:
+            from .profiler import ExecutionProfiler
+            instrument = ExecutionProfiler()
+        elif args.trace:
+            from .trace_file import TraceRecorder
+            instrument = TraceRecorder(args.trace)
+        if instrument is not None:
+            machine.attach(instrument)
+
+        status = EXIT_HALTED
+        stopped = None
+        try:
+            machine.run_limited(ExecutionLimits(max_instructions=args.max_steps, timeout=args.timeout))
+        except LimitExceeded as error:
+            option = "--max-steps" if error.limit == MAX_INSTRUCTIONS else "--timeout"
+            stopped = f"stopped after {option}={error.value} (PC={machine.registers.PC:04X})"
+            status = EXIT_LIMIT
+        except Exception as error:
+            print(f"error: {error} (PC={machine.registers.PC:04X})", file=sys.stderr)
+            status = EXIT_ERROR
+        finally:
+            output.flush()
+            if args.trace:
+                instrument.close()
+
+        if args.profile:
+            print(instrument.report(), file=sys.stderr)
+        if stopped:
+            print(stopped, file=sys.stderr)
+        if args.stats:
+            stats = machine.stats()
+            print(f"{stats.instructions} instructions in {stats.run_seconds:.3f}s "
+                  f"({stats.instructions_per_second:,.0f}/s)", file=sys.stderr)
+        return status
+    finally:
+        if input_file is not None and input_file is not sys.stdin.buffer:
+            input_file.close()
+        if output_file is not None and output_file is not sys.stdout.buffer:
+            output_file.close()
+
+
+def _command_serve(args) -> int:
+    import asyncio
+    from .service import ExecutionService
+
+    service = ExecutionService(args.workers, args.max_pending, args.max_steps, args.timeout)
+
+    async def serve():
+        if args.unix:
+            server = await service.start_unix(args.unix)
+        else:
+            host, _, port = args.tcp.rpartition(":")
+            server = await service.start_tcp(host or "127.0.0.1", int(port))
+        for sock in server.sockets:
+            print(f"listening on {sock.getsockname()}", file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser for all subcommands."""
+    parser = argparse.ArgumentParser(prog="python -m src", description="SIC assembler and emulator.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    assemble = commands.add_parser("assemble", help="Assemble SIC source into an object program.")
+    assemble.add_argument("program", help="Source file, or - for standard input.")
+    assemble.add_argument("-o", "--output", default="-", help="Object program file (default: stdout).")
+    assemble.set_defaults(handler=_command_assemble)
+
+    run = commands.add_parser("run", help="Assemble if needed, load and run a program.")
+    run.add_argument("program", help="Source or object program file, or - for standard input.")
+    run.add_argument("--max-steps", type=int, default=1_000_000,
+                     help="Stop after this many instructions, exiting with status 3 (default 1000000).")
+    run.add_argument("--timeout", type=float, metavar="SECONDS", help="Stop after this much wall-clock time, exiting with status 3.")
+    run.add_argument("--input", help="File read by the input device, or - for stdin.")
+    run.add_argument("--output", default="-", help="File written by the output device (default: stdout).")
+    run.add_argument("--load-address", type=_hex, help="Relocate the program to this hex address.")
+    run.add_argument("--input-device", type=_hex, default=DEFAULT_INPUT_DEVICE,
+                     help="Input device number in hex (default F1).")
+    run.add_argument("--output-device", type=_hex, default=DEFAULT_OUTPUT_DEVICE,
+                     help="Output device number in hex (default 05).")
+    run.add_argument("--stats", action="store_true", help="Print instruction count and speed to stderr.")
+    instruments = run.add_mutually_exclusive_group()
+    instruments.add_argument("--profile", action="store_true", help="Print an execution profile to stderr.")
+    instruments.add_argument("--trace", metavar="FILE", help="Record a binary instruction trace.")
+    run.set_defaults(handler=_command_run)
+
+    serve = commands.add_parser("serve", help="Run programs submitted over a local socket.")
+    address = serve.add_mutually_exclusive_group(required=True)
+    address.add_argument("--unix", metavar="PATH", help="Listen on a Unix domain socket.")
+    address.add_argument("--tcp", metavar="[HOST:]PORT", help="Listen on TCP (default host 127.0.0.1).")
+    serve.add_argument("--workers", type=int, help="Worker processes (default: CPU count).")
+    serve.add_argument("--max-pending", type=int,
+                       help="Requests in flight before reading stops (default: twice the workers).")
+    serve.add_argument("--max-steps", type=int, default=1_000_000,
+                       help="The most instructions any request may run (default 1000000).")
+    serve.add_argument("--timeout", type=float, metavar="SECONDS",
+                       help="The most wall-clock time any request may run.")
+    serve.set_defaults(handler=_command_serve)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
@@ -0,0 +1,126 @@
+from .memory import Memory
+
+
+def merge_bitmaps(bitmaps) -> bytearray:
+    """
+    Combines coverage bitmaps with a bitwise OR.
+
+    Each bitmap is converted to one big integer with int.from_bytes, so the
+    OR runs over whole machine words in C rather than byte by byte.
+
+    Args:
+        bitmaps: An iterable of equally sized bytes-like bitmaps.
+
+    Returns:
+        The merged bitmap (all zeros for no input).
+    """
+    merged = 0
+    size = Memory.SIZE
+    for bitmap in bitmaps:
+        size = len(bitmap)
+        merged |= int.from_bytes(bitmap, "little")
+    return bytearray(merged.to_bytes(size, "little"))
+
+
+class CoverageMap:
+    """
+    Records which instruction addresses a program executed.
+
+    Attach it with machine.attach(coverage). Each executed PC is marked in a
+    bytearray with one byte per memory address (1 = executed), costing a
+    single index store per instruction. Maps from many runs can be merged,
+    and a report lists covered and uncovered ranges by symbol.
+    """
+
+    def __init__(self, bitmap: bytes | None = None):
+        """
+        Initializes an empty map, or one loaded from a saved bitmap.
+
+        Args:
+            bitmap: Optional bitmap from to_bytes() of an earlier run.
+        """
+        self.bitmap = bytearray(bitmap) if bitmap is not None else bytearray(Memory.SIZE)
+
+    def run(self, machine, ticks):
+        """
+        Executes instructions on the machine, marking each executed address.
+
+        Args:
+            machine: The SICMachine being measured.
+            ticks: An iterator yielding once per instruction to execute.
+        """
+        step = machine.cpu.step
+        registers = machine.registers
+        bitmap = self.bitmap
+        for _ in ticks:
+            pc = registers.PC
+            step()
+            bitmap[pc] = 1
+
+    def is_covered(self, address: int) -> bool:
+        """Returns True if the instruction at address was executed."""
+        return self.bitmap[address] == 1
+
+    def covered_count(self, start: int = 0, end: int = Memory.SIZE) -> int:
+        """Returns the number of executed instruction addresses in [start, end)."""
+        return self.bitmap.count(1, start, end)
+
+    def merge(self, *others: "CoverageMap") -> "CoverageMap":
+        """
+        Returns a new map covering everything covered by this map or any other.
+        """
+        return CoverageMap(merge_bitmaps([self.bitmap] + [other.bitmap for other in others]))
+
+    def to_bytes(self) -> bytes:
+        """Returns the bitmap, e.g. for saving alongside a graded submission."""
+        return bytes(self.bitmap)
+
+    def ranges(self, start: int, end: int, instruction_size: int = 3) -> list[tuple[bool, int, int]]:
+        """
+        Splits a code area into runs of covered and uncovered instructions.
+
+        Args:
+            start: The address of the first instruction.
+            end: The address just past the code area.
+            instruction_size: The distance between instruction addresses.
+
+        Returns:
+            (covered, low, high) tuples with half-open byte ranges [low, high).
+        """
+        runs = []
+        bitmap = self.bitmap
+        for address in range(start, end, instruction_size):
+            covered = bitmap[address] == 1
+            if runs and runs[-1][0] == covered:
+                runs[-1][2] = address + instruction_size
+            else:
+                runs.append([covered, address, address + instruction_size])
+        return [tuple(run) for run in runs]
+
+    def report(self, start: int, end: int, symtab=None, instruction_size: int = 3) -> str:
+        """
+        Formats covered and uncovered ranges of a code area.
+
+        Args:
+            start: The address of the first instruction.
+            end: The address just past the code area.
+            symtab: Optional SymbolTable used to label range boundaries.
+            instruction_size: The distance between instruction addresses.
+
+        Returns:
+            The report text, starting with an overall summary line.
+        """
+        total = len(range(start, end, instruction_size))
+        covered = sum(1 for address in range(start, end, instruction_size) if self.bitmap[address])
+        percent = 100 * covered / total if total else 0.0
+        lines = [f"Covered {covered}/{total} instructions ({percent:.1f}%)"]
+        for is_covered, low, high in self.ranges(start, end, instruction_size):
+            status = "covered" if is_covered else "UNCOVERED"
+            line = f"{status:<9} {low:04X}-{high - 1:04X}"
+            if symtab is not None:
+                last = high - instruction_size
+                line += f"  {symtab.describe_address(low)}"
+                if last != low:
+                    line += f" .. {symtab.describe_address(last)}"
+            lines.append(line)
+        return "\n".join(lines)
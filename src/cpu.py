@@ -1,7 +1,19 @@
+from functools import lru_cache
+
 from .registers import Registers
 from .memory import Memory
 from .instruction import Instruction
 from .devices import DeviceManager
+from .assembler.optab import OPTAB
+
+# Opcode -> name of the CPU method that executes it, derived once from the shared OPTAB.
+# An instruction is dispatched only if the CPU defines a handler with that name.
+HANDLER_NAMES = {info.opcode: "_" + info.mnemonic.lower() for info in OPTAB.values()}
+
+# Decoded instructions are cached by word. The cache is bounded and evicts the
+# least recently used words, so programs touching many distinct words cannot
+# grow it without bound or push out the words of their hot loops.
+DECODE_CACHE_SIZE = 4096
 
 class CPU:
     """
@@ -21,19 +33,40 @@ class CPU:
         self.registers = registers
         self.memory = memory
         self.device_manager = device_manager
+        self._decode = lru_cache(maxsize=DECODE_CACHE_SIZE)(Instruction)
+        # Counters for SICMachine.stats(). The decode cache counts its own
+        # hits and misses; these are its counts at the last reset_counters().
+        self._decode_hits_base = 0
+        self._decode_misses_base = 0
+        self.device_bytes_in = 0
+        self.device_bytes_out = 0
         # Map opcodes to their handler methods.
         self.opcodes = {
-            0x00: self._lda,
-            0x0C: self._sta,
-            0x18: self._add,
-            0x1C: self._sub,
-            0x28: self._comp,
-            0x3C: self._j,
-            0x30: self._jeq,
-            0xD8: self._rd,
-            0xDC: self._wd,
-            0xE0: self._td,
-        } 
+            opcode: getattr(self, name)
+            for opcode, name in HANDLER_NAMES.items()
+            if hasattr(self, name)
+        }
+
+    def reset_counters(self):
+        """
+        Zeroes the statistics counters. The decode cache is kept: it is keyed
+        by instruction word, so its entries stay valid for any program.
+        """
+        info = self._decode.cache_info()
+        self._decode_hits_base = info.hits
+        self._decode_misses_base = info.misses
+        self.device_bytes_in = 0
+        self.device_bytes_out = 0
+
+    @property
+    def decode_hits(self) -> int:
+        """Fetches served by the decode cache since the counters were reset."""
+        return self._decode.cache_info().hits - self._decode_hits_base
+
+    @property
+    def decode_misses(self) -> int:
+        """Fetches that had to be decoded since the counters were reset."""
+        return self._decode.cache_info().misses - self._decode_misses_base
 
     def fetch(self) -> Instruction:
         """
@@ -42,7 +75,7 @@ class CPU:
         """
         instruction_address = self.registers.PC
         instruction_word = self.memory.read_word(instruction_address)
-        return Instruction(instruction_word)
+        return self._decode(instruction_word)
 
     def step(self):
         """
@@ -91,6 +124,49 @@ class CPU:
         effective_address = self._get_effective_address(instr)
         self.memory.write_word(effective_address, self.registers.A)
 
+    def _ldx(self, instr: Instruction):
+        """
+        Executes the LDX (Load Index Register) instruction.
+        Opcode: 0x04
+        """
+        effective_address = self._get_effective_address(instr)
+        self.registers.X = self.memory.read_word(effective_address)
+
+    def _stx(self, instr: Instruction):
+        """
+        Executes the STX (Store Index Register) instruction.
+        Opcode: 0x10
+        """
+        effective_address = self._get_effective_address(instr)
+        self.memory.write_word(effective_address, self.registers.X)
+
+    def _ldch(self, instr: Instruction):
+        """
+        Executes the LDCH (Load Character) instruction.
+        Opcode: 0x50
+        Loads a byte into the rightmost 8 bits of A.
+        """
+        effective_address = self._get_effective_address(instr)
+        byte = self.memory.read_byte(effective_address)
+        self.registers.A = (self.registers.A & 0xFFFF00) | byte
+
+    def _stch(self, instr: Instruction):
+        """
+        Executes the STCH (Store Character) instruction.
+        Opcode: 0x54
+        Stores the rightmost 8 bits of A.
+        """
+        effective_address = self._get_effective_address(instr)
+        self.memory.write_byte(effective_address, self.registers.A & 0xFF)
+
+    def _stsw(self, instr: Instruction):
+        """
+        Executes the STSW (Store Status Word) instruction.
+        Opcode: 0xE8
+        """
+        effective_address = self._get_effective_address(instr)
+        self.memory.write_word(effective_address, self.registers.SW)
+
     def _add(self, instr: Instruction):
         """
         Executes the ADD (Add to Accumulator) instruction.
@@ -109,6 +185,45 @@ class CPU:
         operand = self.memory.read_word(effective_address)
         self.registers.A -= operand
 
+    def _mul(self, instr: Instruction):
+        """
+        Executes the MUL (Multiply Accumulator) instruction.
+        Opcode: 0x20
+        """
+        effective_address = self._get_effective_address(instr)
+        operand = self.memory.read_word(effective_address)
+        self.registers.A *= operand
+
+    def _div(self, instr: Instruction):
+        """
+        Executes the DIV (Divide Accumulator) instruction.
+        Opcode: 0x24
+
+        Raises:
+            ZeroDivisionError: If the divisor is zero.
+        """
+        effective_address = self._get_effective_address(instr)
+        operand = self.memory.read_word(effective_address)
+        if operand == 0:
+            raise ZeroDivisionError(f"DIV by zero at address {effective_address:04X}.")
+        self.registers.A //= operand
+
+    def _and(self, instr: Instruction):
+        """
+        Executes the AND (Bitwise And) instruction.
+        Opcode: 0x40
+        """
+        effective_address = self._get_effective_address(instr)
+        self.registers.A &= self.memory.read_word(effective_address)
+
+    def _or(self, instr: Instruction):
+        """
+        Executes the OR (Bitwise Or) instruction.
+        Opcode: 0x44
+        """
+        effective_address = self._get_effective_address(instr)
+        self.registers.A |= self.memory.read_word(effective_address)
+
     def _comp(self, instr: Instruction):
         """
         Executes the COMP (Compare) instruction.
@@ -125,6 +240,23 @@ class CPU:
         else: # self.registers.A > operand
             self.registers.SW = ord('>')
 
+    def _tix(self, instr: Instruction):
+        """
+        Executes the TIX (Test and Increment Index) instruction.
+        Opcode: 0x2C
+        Increments X, then compares it with a word in memory and sets SW.
+        """
+        effective_address = self._get_effective_address(instr)
+        operand = self.memory.read_word(effective_address)
+        self.registers.X += 1
+
+        if self.registers.X < operand:
+            self.registers.SW = ord('<')
+        elif self.registers.X == operand:
+            self.registers.SW = ord('=')
+        else: # self.registers.X > operand
+            self.registers.SW = ord('>')
+
     def _j(self, instr: Instruction):
         """
         Executes the J (Jump) instruction.
@@ -143,6 +275,55 @@ class CPU:
             self.registers.PC = effective_address
         # If the condition is not met, the PC retains its incremented value from step().
 
+    def _jlt(self, instr: Instruction):
+        """
+        Executes the JLT (Jump if Less Than) instruction.
+        Opcode: 0x38
+        """
+        if self.registers.SW == ord('<'):
+            self.registers.PC = self._get_effective_address(instr)
+
+    def _jgt(self, instr: Instruction):
+        """
+        Executes the JGT (Jump if Greater Than) instruction.
+        Opcode: 0x34
+        """
+        if self.registers.SW == ord('>'):
+            self.registers.PC = self._get_effective_address(instr)
+
+    def _jsub(self, instr: Instruction):
+        """
+        Executes the JSUB (Jump to Subroutine) instruction.
+        Opcode: 0x48
+        Saves the return address in L before jumping.
+        """
+        effective_address = self._get_effective_address(instr)
+        self.registers.L = self.registers.PC
+        self.registers.PC = effective_address
+
+    def _rsub(self, instr: Instruction):
+        """
+        Executes the RSUB (Return from Subroutine) instruction.
+        Opcode: 0x4C
+        """
+        self.registers.PC = self.registers.L
+
+    def _ldl(self, instr: Instruction):
+        """
+        Executes the LDL (Load Linkage Register) instruction.
+        Opcode: 0x08
+        """
+        effective_address = self._get_effective_address(instr)
+        self.registers.L = self.memory.read_word(effective_address)
+
+    def _stl(self, instr: Instruction):
+        """
+        Executes the STL (Store Linkage Register) instruction.
+        Opcode: 0x14
+        """
+        effective_address = self._get_effective_address(instr)
+        self.memory.write_word(effective_address, self.registers.L)
+
     def _td(self, instr: Instruction):
         """
         Executes the TD (Test Device) instruction.
@@ -168,7 +349,11 @@ class CPU:
         device_id = effective_address & 0xFF
         device = self.device_manager.get_device(device_id) if self.device_manager else None
 
-        byte = device.read() if device else 0
+        if device:
+            byte = device.read()
+            self.device_bytes_in += 1
+        else:
+            byte = 0
         self.registers.A = (self.registers.A & 0xFFFF00) | (byte & 0xFF)
 
     def _wd(self, instr: Instruction):
@@ -183,3 +368,4 @@ class CPU:
 
         if device:
             device.write(self.registers.A & 0xFF)
+            self.device_bytes_out += 1
@@ -0,0 +1,169 @@
+from enum import Enum
+from typing import NamedTuple
+
+from .memory import Memory
+
+# Watchpoints are tracked per 256-byte page.
+PAGE_BITS = 8
+PAGE_COUNT = Memory.SIZE >> PAGE_BITS
+
+
+class StopReason(Enum):
+    """Why a debugged run stopped before using up its steps."""
+    BREAKPOINT = "breakpoint"
+    WATCHPOINT = "watchpoint"
+
+
+class StopEvent(NamedTuple):
+    """
+    Returned by SICMachine.run when the debugger stops execution.
+
+    address is the breakpoint address, or the watched byte that changed.
+    pc is the address of the instruction stopped at (breakpoint) or of the
+    instruction that performed the write (watchpoint).
+    """
+    reason: StopReason
+    address: int
+    pc: int
+
+
+class Debugger:
+    """
+    Breakpoints and memory watchpoints for a SICMachine.
+
+    Attach it with machine.attach(debugger). Breakpoints are a 32 KB table
+    with one byte per address, checked by indexing with the PC after each
+    instruction. Watchpoints stop when a write changes a watched byte. While
+    any watchpoint is set, the memory write methods are wrapped for the
+    duration of a run, but only writes landing on a page flagged as watched
+    pay for comparing old and new values.
+    """
+
+    def __init__(self):
+        """
+        Initializes the debugger with no breakpoints or watchpoints.
+        """
+        self.breakpoints = bytearray(Memory.SIZE)
+        self.watched_pages = bytearray(PAGE_COUNT)
+        self.watchpoints = set()
+        self._watch_hit = None
+        self._saved_writes = {}
+        # A breakpoint just stopped at is stepped over when the run resumes.
+        self._resume_pc = None
+
+    def add_breakpoint(self, address: int):
+        """Stops execution before the instruction at address runs."""
+        self.breakpoints[address] = 1
+
+    def remove_breakpoint(self, address: int):
+        """Removes the breakpoint at address."""
+        self.breakpoints[address] = 0
+
+    def add_watchpoint(self, address: int, length: int = 3):
+        """
+        Stops execution after an instruction changes any byte in a range.
+
+        Args:
+            address: The first watched byte.
+            length: The number of watched bytes (3 for a word).
+        """
+        for byte_address in range(address, address + length):
+            self.watchpoints.add(byte_address)
+            self.watched_pages[byte_address >> PAGE_BITS] = 1
+
+    def remove_watchpoint(self, address: int, length: int = 3):
+        """Removes the watchpoint covering a range."""
+        for byte_address in range(address, address + length):
+            self.watchpoints.discard(byte_address)
+        self._rebuild_pages()
+
+    def _rebuild_pages(self):
+        """Recomputes the watched-page flags from the remaining watchpoints."""
+        self.watched_pages[:] = bytes(PAGE_COUNT)
+        for byte_address in self.watchpoints:
+            self.watched_pages[byte_address >> PAGE_BITS] = 1
+
+    def _check_write(self, memory: Memory, address: int, new_bytes: tuple):
+        """Records the first watched byte whose value a write would change."""
+        for offset, new in enumerate(new_bytes):
+            byte_address = address + offset
+            if byte_address in self.watchpoints and memory.buffer[byte_address] != new:
+                if self._watch_hit is None:
+                    self._watch_hit = byte_address
+                return
+
+    def _install(self, memory: Memory):
+        """Wraps the memory's write methods with the page-filtered watch check."""
+        write_word = memory.write_word
+        write_byte = memory.write_byte
+        pages = self.watched_pages
+        page_mask = PAGE_COUNT - 1
+        check = self._check_write
+        # Keep any wrappers another tool installed so they can be restored.
+        self._saved_writes = {name: memory.__dict__.get(name) for name in ("write_word", "write_byte")}
+
+        def watched_write_word(address, value):
+            # Out-of-range addresses alias onto some page; that only costs a
+            # redundant check, and write_word still reports the bad address.
+            if pages[(address >> PAGE_BITS) & page_mask] or pages[((address + 2) >> PAGE_BITS) & page_mask]:
+                value &= 0xFFFFFF
+                check(memory, address, ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF))
+            write_word(address, value)
+
+        def watched_write_byte(address, value):
+            if pages[(address >> PAGE_BITS) & page_mask]:
+                check(memory, address, (value & 0xFF,))
+            write_byte(address, value)
+
+        memory.write_word = watched_write_word
+        memory.write_byte = watched_write_byte
+
+    def _uninstall(self, memory: Memory):
+        """Restores the write methods that were in place before _install."""
+        for name, previous in self._saved_writes.items():
+            if previous is None:
+                del memory.__dict__[name]
+            else:
+                setattr(memory, name, previous)
+
+    def run(self, machine, ticks) -> StopEvent | None:
+        """
+        Executes instructions until the ticks run out or a breakpoint or
+        watchpoint is hit.
+
+        Args:
+            machine: The SICMachine being debugged.
+            ticks: An iterator yielding once per instruction to execute.
+
+        Returns:
+            A StopEvent if execution stopped early, otherwise None.
+        """
+        step = machine.cpu.step
+        registers = machine.registers
+        breakpoints = self.breakpoints
+        size = Memory.SIZE
+
+        pc = registers.PC
+        resume_pc, self._resume_pc = self._resume_pc, None
+        if pc < size and breakpoints[pc] and pc != resume_pc:
+            self._resume_pc = pc
+            return StopEvent(StopReason.BREAKPOINT, pc, pc)
+
+        memory = machine.memory
+        watching = bool(self.watchpoints)
+        if watching:
+            self._install(memory)
+        self._watch_hit = None
+        try:
+            for _ in ticks:
+                step()
+                if self._watch_hit is not None:
+                    return StopEvent(StopReason.WATCHPOINT, self._watch_hit, pc)
+                pc = registers.PC
+                if pc < size and breakpoints[pc]:
+                    self._resume_pc = pc
+                    return StopEvent(StopReason.BREAKPOINT, pc, pc)
+        finally:
+            if watching:
+                self._uninstall(memory)
+        return None
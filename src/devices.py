@@ -1,4 +1,6 @@
 import io
+import struct
+from collections import deque
 
 class IODevice:
     """
@@ -8,6 +10,14 @@ class IODevice:
         """Returns True if the device is ready, False if busy."""
         return True
 
+    def ready(self) -> bool:
+        """
+        Returns what test() would, without side effects: it never blocks,
+        consumes input or shows up in a device log. Devices that cannot
+        tell without testing report True.
+        """
+        return True
+
     def reset(self):
         """Resets the device to its initial state."""
         pass
@@ -25,7 +35,7 @@ class ConsoleInputDevice(IODevice):
     Simulates terminal input.
     """
     def __init__(self):
-        self._buffer = []
+        self._buffer = deque()
 
     def set_input(self, data: str):
         """Pre-loads the input buffer with a string."""
@@ -35,14 +45,16 @@ class ConsoleInputDevice(IODevice):
         """Ready if there is data in the buffer."""
         return len(self._buffer) > 0
 
+    ready = test
+
     def reset(self):
         """Clears the input buffer."""
-        self._buffer = []
+        self._buffer = deque()
 
     def read(self) -> int:
         """Reads the next byte from the buffer."""
         if self._buffer:
-            return self._buffer.pop(0)
+            return self._buffer.popleft()
         return 0
 
 class ConsoleOutputDevice(IODevice):
@@ -105,22 +117,289 @@ class TapeDevice(FileBackedDevice):
         """Rewinds the tape to the beginning."""
         self.seek(0)
 
+class StreamInputDevice(IODevice):
+    """
+    Reads bytes lazily from a binary stream, such as a file or sys.stdin.buffer.
+    The device is ready while the stream has data left; testing it may block
+    until the next byte arrives.
+    """
+    def __init__(self, stream):
+        self._stream = stream
+        # The next byte, read ahead by test(); None if not read yet, -1 at EOF.
+        self._next = None
+
+    def _peek(self) -> int:
+        if self._next is None:
+            chunk = self._stream.read(1)
+            self._next = chunk[0] if chunk else -1
+        return self._next
+
+    def test(self) -> bool:
+        """Ready until the stream is exhausted."""
+        return self._peek() >= 0
+
+    def ready(self) -> bool:
+        """False only once the read-ahead byte has shown the stream exhausted."""
+        return self._next is None or self._next >= 0
+
+    def read(self) -> int:
+        """Reads the next byte, or 0 at end of stream."""
+        byte = self._peek()
+        if byte < 0:
+            return 0
+        self._next = None
+        return byte
+
+class StreamOutputDevice(IODevice):
+    """
+    Writes bytes to a binary stream as the program produces them. The stream
+    is flushed at each newline so output appears line by line while running.
+    """
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, value: int):
+        """Writes a byte, flushing after a newline."""
+        value &= 0xFF
+        self._stream.write(bytes((value,)))
+        if value == 0x0A:
+            self._stream.flush()
+
+    def flush(self):
+        """Flushes any buffered output."""
+        self._stream.flush()
+
+class ReplayDivergenceError(RuntimeError):
+    """
+    Raised when a program's device interactions differ from the recorded log.
+    """
+    pass
+
+class DeviceLog:
+    """
+    A compact, append-only log of device interactions.
+
+    Each entry is a packed 11-byte record: step number, device ID, operation
+    and the byte value (for TEST, 1 if the device was ready, 0 if busy).
+    """
+    RECORD = struct.Struct("<QBBB")
+    OP_TEST = 0
+    OP_READ = 1
+    OP_WRITE = 2
+
+    def __init__(self, data: bytes = b""):
+        """
+        Initializes the log, optionally from previously recorded data.
+
+        Args:
+            data: Packed records, e.g. from to_bytes() or a saved log file.
+
+        Raises:
+            ValueError: If data is not a whole number of records.
+        """
+        if len(data) % self.RECORD.size:
+            raise ValueError("Device log data is truncated.")
+        self._data = bytearray(data)
+
+    def append(self, step: int, device_id: int, op: int, value: int):
+        """Appends one interaction."""
+        self._data += self.RECORD.pack(step, device_id, op, value & 0xFF)
+
+    def __len__(self) -> int:
+        return len(self._data) // self.RECORD.size
+
+    def __iter__(self):
+        """Yields (step, device_id, op, value) tuples in recording order."""
+        return self.RECORD.iter_unpack(bytes(self._data))
+
+    def device_ids(self) -> set[int]:
+        """Returns the IDs of all devices that appear in the log."""
+        return {device_id for _, device_id, _, _ in self}
+
+    def to_bytes(self) -> bytes:
+        """Returns the packed log."""
+        return bytes(self._data)
+
+    def save(self, path):
+        """Writes the packed log to a file."""
+        with open(path, "wb") as file:
+            file.write(self._data)
+
+    @classmethod
+    def load(cls, path) -> "DeviceLog":
+        """Reads a log written by save()."""
+        with open(path, "rb") as file:
+            return cls(file.read())
+
+class RecordingDevice(IODevice):
+    """
+    Wraps a real device and logs every test, read and write on it. Any other
+    attribute, such as get_output() or set_input(), is the wrapped device's.
+    """
+    def __init__(self, device_id: int, device: IODevice, log: DeviceLog, clock):
+        self._device_id = device_id
+        self._device = device
+        self._log = log
+        self._clock = clock
+
+    def test(self) -> bool:
+        ready = self._device.test()
+        self._log.append(self._clock(), self._device_id, DeviceLog.OP_TEST, 1 if ready else 0)
+        return ready
+
+    def ready(self) -> bool:
+        """Asks the wrapped device without logging."""
+        return self._device.ready()
+
+    def reset(self):
+        self._device.reset()
+
+    def read(self) -> int:
+        value = self._device.read()
+        self._log.append(self._clock(), self._device_id, DeviceLog.OP_READ, value)
+        return value
+
+    def write(self, value: int):
+        self._device.write(value)
+        self._log.append(self._clock(), self._device_id, DeviceLog.OP_WRITE, value)
+
+    def __getattr__(self, name):
+        # Only reached for attributes the wrapper does not define.
+        if name == "_device":
+            raise AttributeError(name)
+        return getattr(self._device, name)
+
+class ReplayDevice(IODevice):
+    """
+    Stands in for a device during replay, answering from a recorded log.
+    All replay devices of a session share one cursor, so interactions must
+    occur in exactly the recorded order.
+    """
+    def __init__(self, device_id: int, session: "_ReplaySession"):
+        self._device_id = device_id
+        self._session = session
+
+    def test(self) -> bool:
+        return bool(self._session.next(self._device_id, DeviceLog.OP_TEST))
+
+    def read(self) -> int:
+        return self._session.next(self._device_id, DeviceLog.OP_READ)
+
+    def write(self, value: int):
+        recorded = self._session.next(self._device_id, DeviceLog.OP_WRITE)
+        if recorded != value & 0xFF:
+            raise ReplayDivergenceError(
+                f"Device {self._device_id:02X} was written {value & 0xFF:02X}, recorded {recorded:02X}."
+            )
+
+class _ReplaySession:
+    """The shared cursor over a log being replayed."""
+    _OP_NAMES = {DeviceLog.OP_TEST: "TD", DeviceLog.OP_READ: "RD", DeviceLog.OP_WRITE: "WD"}
+
+    def __init__(self, log: DeviceLog, clock):
+        self._entries = iter(log)
+        self._clock = clock
+
+    def next(self, device_id: int, op: int) -> int:
+        """Returns the recorded value of the next interaction after checking it matches."""
+        entry = next(self._entries, None)
+        if entry is None:
+            raise ReplayDivergenceError("Device log exhausted during replay.")
+        step, recorded_id, recorded_op, value = entry
+        if recorded_id != device_id or recorded_op != op:
+            raise ReplayDivergenceError(
+                f"Expected {self._OP_NAMES[recorded_op]} on device {recorded_id:02X} at step {step}, "
+                f"got {self._OP_NAMES[op]} on device {device_id:02X}."
+            )
+        if self._clock is not None and self._clock() != step:
+            raise ReplayDivergenceError(
+                f"{self._OP_NAMES[op]} on device {device_id:02X} recorded at step {step}, "
+                f"replayed at step {self._clock()}."
+            )
+        return value
+
 class DeviceManager:
     """
     Manages the collection of IO devices attached to the SIC machine.
+
+    In record mode every interaction with an attached device is logged; in
+    replay mode devices are answered from such a log without touching the
+    real devices. Either mode swaps the lookup table used by get_device, so
+    normal operation pays nothing for them.
     """
     def __init__(self):
+        # Devices that are attached, and the table get_device answers from.
+        self._attached = {}
         self._devices = {}
+        self._log = None
+        self._clock = None
 
     def add_device(self, device_id: int, device: IODevice):
         """Registers a device with a given 8-bit ID."""
-        self._devices[device_id & 0xFF] = device
+        device_id &= 0xFF
+        self._attached[device_id] = device
+        if self._log is not None:
+            device = RecordingDevice(device_id, device, self._log, self._clock)
+        self._devices[device_id] = device
 
     def reset(self):
-        """Resets all registered devices."""
-        for device in self._devices.values():
+        """
+        Leaves record or replay mode and resets all registered devices,
+        which stay attached.
+        """
+        self.stop()
+        for device in self._attached.values():
             device.reset()
 
     def get_device(self, device_id: int) -> IODevice:
         """Retrieves the device associated with the given ID, or None if not found."""
         return self._devices.get(device_id & 0xFF)
+
+    def start_recording(self, clock=None) -> DeviceLog:
+        """
+        Starts logging every interaction with the attached devices.
+
+        Args:
+            clock: A callable returning the current step number
+                (SICMachine.current_step). Steps are logged as 0 without one.
+
+        Returns:
+            The DeviceLog that receives the interactions.
+        """
+        self.stop()
+        self._log = DeviceLog()
+        self._clock = clock or (lambda: 0)
+        self._devices = {
+            device_id: RecordingDevice(device_id, device, self._log, self._clock)
+            for device_id, device in self._attached.items()
+        }
+        return self._log
+
+    def start_replay(self, log: DeviceLog, clock=None):
+        """
+        Answers device operations from a recorded log instead of the real devices.
+
+        Every device ID answers from the log, so touching a device that is
+        not in it, or in a different order, raises ReplayDivergenceError.
+
+        Args:
+            log: The log recorded by start_recording.
+            clock: A callable returning the current step number. If given, each
+                interaction must happen at the same step as when it was recorded.
+        """
+        self.stop()
+        session = _ReplaySession(log, clock)
+        self._devices = {device_id: ReplayDevice(device_id, session) for device_id in range(256)}
+
+    def stop(self) -> DeviceLog | None:
+        """
+        Leaves record or replay mode and restores the attached devices.
+
+        Returns:
+            The log that was being recorded, if any.
+        """
+        log = self._log
+        self._log = None
+        self._clock = None
+        self._devices = dict(self._attached)
+        return log
@@ -0,0 +1,57 @@
+from typing import NamedTuple
+
+MAX_INSTRUCTIONS = "max_instructions"
+TIMEOUT = "timeout"
+MAX_OUTPUT_BYTES = "max_output_bytes"
+MAX_INPUT_READS = "max_input_reads"
+
+
+class ExecutionLimits(NamedTuple):
+    """
+    Budgets for one SICMachine.run_limited() call; None means unlimited.
+
+    Only max_instructions is exact. The clock and the device counters are
+    checked every check_every instructions, so a run may overshoot the
+    timeout by the time that many instructions take, and the output and
+    input limits by at most check_every bytes.
+    """
+    max_instructions: int | None = None
+    timeout: float | None = None
+    max_output_bytes: int | None = None
+    max_input_reads: int | None = None
+    check_every: int = 1024
+
+
+class LimitExceeded(RuntimeError):
+    """
+    Raised when a run exceeds one of its ExecutionLimits.
+
+    Carries the state at the point the run was stopped: which limit was hit,
+    the usage counted during the run, and the machine's registers.
+    """
+
+    def __init__(self, limit: str, value, instructions: int, elapsed: float,
+                 output_bytes: int, input_reads: int, registers: dict):
+        self.limit = limit
+        self.value = value
+        self.instructions = instructions
+        self.elapsed = elapsed
+        self.output_bytes = output_bytes
+        self.input_reads = input_reads
+        self.registers = registers
+        super().__init__(
+            f"Limit {limit}={value} exceeded after {instructions} instructions "
+            f"in {elapsed:.3f}s (PC={registers['PC']:04X})."
+        )
+
+    def to_dict(self) -> dict:
+        """Returns the limit and partial state as plain data, e.g. for JSON."""
+        return {
+            "limit": self.limit,
+            "value": self.value,
+            "instructions": self.instructions,
+            "elapsed": self.elapsed,
+            "output_bytes": self.output_bytes,
+            "input_reads": self.input_reads,
+            "registers": self.registers,
+        }
@@ -0,0 +1,311 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .memory import Memory
+from .assembler.optab import OPTAB
+
+MASK = 0xFFFFFF
+LT, EQ, GT = ord('<'), ord('='), ord('>')
+
+# Why a lane stopped early. Lanes that fault stop; the others keep running.
+FAULT_NONE = 0
+FAULT_OPCODE = 1     # Unimplemented opcode.
+FAULT_DEVICE = 2     # TD/RD/WD: lanes have no devices.
+FAULT_ADDRESS = 3    # Fetch or operand outside memory.
+FAULT_DIVIDE = 4     # DIV by zero.
+
+# Opcode -> name of the executor method that runs it, as in the scalar CPU.
+HANDLER_NAMES = {info.opcode: "_" + info.mnemonic.lower() for info in OPTAB.values()}
+DEVICE_OPCODES = {OPTAB["TD"].opcode, OPTAB["RD"].opcode, OPTAB["WD"].opcode}
+
+
+class LockstepExecutor:
+    """
+    Runs one program on many independent machines ("lanes") at once.
+
+    Registers are NumPy int64 arrays with one element per lane and memory is
+    a lanes x 32768 uint8 array. Each step fetches and decodes the current
+    instruction of every running lane with array operations, then executes
+    it once per distinct opcode over all lanes sharing that opcode, so lanes
+    whose control flow diverges are grouped rather than serialized. When all
+    lanes run the same instruction, which is the common case for one program
+    over many inputs, a step is a single group.
+
+    Lanes stop when they reach the halt idiom (a J to itself) or fault;
+    faults are reported per lane instead of raised. Devices are not
+    available, so inputs and results are passed through memory.
+
+    Requires NumPy, which is otherwise not a dependency of the emulator.
+    """
+
+    def __init__(self, lanes: int, machine=None):
+        """
+        Creates the lanes, each a copy of a machine's memory and registers.
+
+        Args:
+            lanes: The number of machines to run.
+            machine: Optional SICMachine with the program loaded; every lane
+                starts from its state. Without one, lanes start zeroed.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("LockstepExecutor requires NumPy (pip install numpy).")
+        self.lanes = lanes
+        if machine is not None:
+            image = np.frombuffer(bytes(machine.memory.buffer), dtype=np.uint8)
+            self.memory = np.tile(image, (lanes, 1))
+            registers = machine.registers
+            initial = (registers.A, registers.X, registers.L, registers.PC, registers.SW)
+        else:
+            self.memory = np.zeros((lanes, Memory.SIZE), dtype=np.uint8)
+            initial = (0, 0, 0, 0, 0)
+        self.A, self.X, self.L, self.PC, self.SW = (
+            np.full(lanes, value, dtype=np.int64) for value in initial
+        )
+        self.running = np.ones(lanes, dtype=bool)
+        self.halted = np.zeros(lanes, dtype=bool)
+        self.faults = np.zeros(lanes, dtype=np.int8)
+        self.instructions_executed = np.zeros(lanes, dtype=np.int64)
+        self._handlers = {
+            opcode: getattr(self, name)
+            for opcode, name in HANDLER_NAMES.items()
+            if hasattr(self, name)
+        }
+
+    # --- Lane data access ---
+
+    def write_words(self, address: int, values):
+        """Writes one word per lane at address, e.g. a vector of inputs."""
+        values = np.asarray(values, dtype=np.int64) & MASK
+        self.memory[:, address] = values >> 16
+        self.memory[:, address + 1] = (values >> 8) & 0xFF
+        self.memory[:, address + 2] = values & 0xFF
+
+    def read_words(self, address: int):
+        """Returns the word at address in every lane."""
+        memory = self.memory
+        return ((memory[:, address].astype(np.int64) << 16)
+                | (memory[:, address + 1].astype(np.int64) << 8)
+                | memory[:, address + 2])
+
+    def to_machine(self, lane: int):
+        """Returns a SICMachine holding one lane's state, e.g. to debug it."""
+        from .machine import SICMachine
+
+        machine = SICMachine()
+        machine.memory.buffer[:] = self.memory[lane].tobytes()
+        registers = machine.registers
+        registers.A, registers.X, registers.L = int(self.A[lane]), int(self.X[lane]), int(self.L[lane])
+        registers.PC, registers.SW = int(self.PC[lane]), int(self.SW[lane])
+        machine.instructions_executed = int(self.instructions_executed[lane])
+        return machine
+
+    # --- Execution ---
+
+    def run(self, steps: int) -> int:
+        """
+        Steps all running lanes until steps are used up or every lane stopped.
+
+        Returns:
+            The number of steps taken.
+        """
+        for taken in range(steps):
+            if not self.step():
+                return taken
+        return steps
+
+    def step(self) -> int:
+        """
+        Executes one instruction in every running lane.
+
+        Returns:
+            The number of lanes that were running.
+        """
+        lanes = np.flatnonzero(self.running)
+        if lanes.size == 0:
+            return 0
+        pc = self.PC[lanes]
+        bad = pc > Memory.SIZE - 3
+        if bad.any():
+            # A failed fetch happens before the instruction is counted.
+            self._fault(lanes[bad], FAULT_ADDRESS, executed=False)
+            lanes, pc = lanes[~bad], pc[~bad]
+            if lanes.size == 0:
+                return 0
+
+        memory = self.memory
+        opcode = memory[lanes, pc]
+        second = memory[lanes, pc + 1].astype(np.int64)
+        address = ((second & 0x7F) << 8) | memory[lanes, pc + 2]
+        ea = np.where(second & 0x80, address + self.X[lanes], address)
+
+        self.PC[lanes] = pc + 3
+        self.instructions_executed[lanes] += 1
+
+        first = opcode[0]
+        if (opcode == first).all():
+            self._dispatch(int(first), lanes, ea)
+        else:
+            for value in np.unique(opcode):
+                selected = opcode == value
+                self._dispatch(int(value), lanes[selected], ea[selected])
+        return lanes.size
+
+    def _dispatch(self, opcode: int, lanes, ea):
+        handler = self._handlers.get(opcode)
+        if handler is not None:
+            handler(lanes, ea)
+        else:
+            self._fault(lanes, FAULT_DEVICE if opcode in DEVICE_OPCODES else FAULT_OPCODE)
+
+    def _fault(self, lanes, code: int, executed: bool = True):
+        """Stops lanes with a fault; the faulting instruction is not counted."""
+        self.running[lanes] = False
+        self.faults[lanes] = code
+        if executed:
+            self.instructions_executed[lanes] -= 1
+
+    def _checked(self, lanes, ea, width: int):
+        """
+        Faults lanes whose access of width bytes at ea leaves memory.
+
+        Returns:
+            (lanes, ea) for the lanes that may proceed.
+        """
+        bad = ea > Memory.SIZE - width
+        if bad.any():
+            self._fault(lanes[bad], FAULT_ADDRESS)
+            keep = ~bad
+            return lanes[keep], ea[keep]
+        return lanes, ea
+
+    def _read_word(self, lanes, ea):
+        memory = self.memory
+        return ((memory[lanes, ea].astype(np.int64) << 16)
+                | (memory[lanes, ea + 1].astype(np.int64) << 8)
+                | memory[lanes, ea + 2])
+
+    def _write_word(self, lanes, ea, values):
+        memory = self.memory
+        memory[lanes, ea] = (values >> 16) & 0xFF
+        memory[lanes, ea + 1] = (values >> 8) & 0xFF
+        memory[lanes, ea + 2] = values & 0xFF
+
+    def _operand(self, lanes, ea):
+        """Bounds-checks a word operand and reads it; returns (lanes, ea, word)."""
+        lanes, ea = self._checked(lanes, ea, 3)
+        return lanes, ea, self._read_word(lanes, ea)
+
+    @staticmethod
+    def _compare(left, right):
+        return np.where(left < right, LT, np.where(left == right, EQ, GT))
+
+    # --- Instruction handlers, vectorized over the lanes given ---
+
+    def _lda(self, lanes, ea):
+        lanes, _, word = self._operand(lanes, ea)
+        self.A[lanes] = word
+
+    def _ldx(self, lanes, ea):
+        lanes, _, word = self._operand(lanes, ea)
+        self.X[lanes] = word
+
+    def _ldl(self, lanes, ea):
+        lanes, _, word = self._operand(lanes, ea)
+        self.L[lanes] = word
+
+    def _sta(self, lanes, ea):
+        lanes, ea = self._checked(lanes, ea, 3)
+        self._write_word(lanes, ea, self.A[lanes])
+
+    def _stx(self, lanes, ea):
+        lanes, ea = self._checked(lanes, ea, 3)
+        self._write_word(lanes, ea, self.X[lanes])
+
+    def _stl(self, lanes, ea):
+        lanes, ea = self._checked(lanes, ea, 3)
+        self._write_word(lanes, ea, self.L[lanes])
+
+    def _stsw(self, lanes, ea):
+        lanes, ea = self._checked(lanes, ea, 3)
+        self._write_word(lanes, ea, self.SW[lanes])
+
+    def _ldch(self, lanes, ea):
+        lanes, ea = self._checked(lanes, ea, 1)
+        self.A[lanes] = (self.A[lanes] & 0xFFFF00) | self.memory[lanes, ea]
+
+    def _stch(self, lanes, ea):
+        lanes, ea = self._checked(lanes, ea, 1)
+        self.memory[lanes, ea] = self.A[lanes] & 0xFF
+
+    def _add(self, lanes, ea):
+        lanes, _, word = self._operand(lanes, ea)
+        self.A[lanes] = (self.A[lanes] + word) & MASK
+
+    def _sub(self, lanes, ea):
+        lanes, _, word = self._operand(lanes, ea)
+        self.A[lanes] = (self.A[lanes] - word) & MASK
+
+    def _mul(self, lanes, ea):
+        lanes, _, word = self._operand(lanes, ea)
+        self.A[lanes] = (self.A[lanes] * word) & MASK
+
+    def _div(self, lanes, ea):
+        lanes, _, word = self._operand(lanes, ea)
+        zero = word == 0
+        if zero.any():
+            self._fault(lanes[zero], FAULT_DIVIDE)
+            lanes, word = lanes[~zero], word[~zero]
+        self.A[lanes] //= word
+
+    def _and(self, lanes, ea):
+        lanes, _, word = self._operand(lanes, ea)
+        self.A[lanes] &= word
+
+    def _or(self, lanes, ea):
+        lanes, _, word = self._operand(lanes, ea)
+        self.A[lanes] |= word
+
+    def _comp(self, lanes, ea):
+        lanes, _, word = self._operand(lanes, ea)
+        self.SW[lanes] = self._compare(self.A[lanes], word)
+
+    def _tix(self, lanes, ea):
+        lanes, _, word = self._operand(lanes, ea)
+        x = (self.X[lanes] + 1) & MASK
+        self.X[lanes] = x
+        self.SW[lanes] = self._compare(x, word)
+
+    def _j(self, lanes, ea):
+        target = ea & MASK
+        # A J to itself is the halt idiom; such lanes stop instead of spinning.
+        halting = target == self.PC[lanes] - 3
+        self.PC[lanes] = target
+        if halting.any():
+            stopped = lanes[halting]
+            self.running[stopped] = False
+            self.halted[stopped] = True
+
+    def _jump_if(self, lanes, ea, status: int):
+        taken = self.SW[lanes] == status
+        self.PC[lanes[taken]] = ea[taken] & MASK
+
+    def _jeq(self, lanes, ea):
+        self._jump_if(lanes, ea, EQ)
+
+    def _jlt(self, lanes, ea):
+        self._jump_if(lanes, ea, LT)
+
+    def _jgt(self, lanes, ea):
+        self._jump_if(lanes, ea, GT)
+
+    def _jsub(self, lanes, ea):
+        self.L[lanes] = self.PC[lanes]
+        self.PC[lanes] = ea & MASK
+
+    def _rsub(self, lanes, ea):
+        self.PC[lanes] = self.L[lanes]
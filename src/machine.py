@@ -1,8 +1,22 @@
+from operator import length_hint
+from time import perf_counter
+
 from .memory import Memory
 from .registers import Registers
 from .cpu import CPU
 from .loader import Loader
 from .devices import DeviceManager
+from .metrics import MachineStats, write_prometheus
+from .limits import (
+    ExecutionLimits, LimitExceeded, MAX_INSTRUCTIONS, TIMEOUT, MAX_OUTPUT_BYTES, MAX_INPUT_READS
+)
+from .assembler.optab import OPTAB
+
+HALT_OPCODE = OPTAB["J"].opcode
+
+# Instructions per run() call between halt checks in run_limited(); chunks
+# grow from the first size up to ExecutionLimits.check_every.
+FIRST_CHUNK_STEPS = 64
 
 class SICMachine:
     """
@@ -19,18 +33,155 @@ class SICMachine:
         self.registers = Registers()
         self.device_manager = DeviceManager()
         self.cpu = CPU(self.registers, self.memory, self.device_manager)
+        # Optional instrument (e.g. a profiler) whose run loop replaces the plain one.
+        self.instrument = None
+        # Completed instructions, updated once at the end of each run.
+        self.instructions_executed = 0
+        # The tick iterator of the run in progress, used by current_step().
+        self._ticks = None
+        self._run_steps = 0
+        # Wall-clock time spent in run() and programs loaded, for stats().
+        self.run_seconds = 0.0
+        self.loads = 0
 
     def reset(self):
         """
-        Resets the machine to its initial state by re-initializing all components.
+        Resets the machine to its initial state in place: memory is zeroed,
+        registers and counters are cleared, any instrument is detached, any
+        memory wrappers (such as a MemoryAccessProfiler's) are removed and
+        the attached devices are reset but kept. No component is
+        reallocated, which is what makes pooled machines cheap to reuse.
         """
-        self.__init__()
+        self.memory.clear()
+        self.memory.unwrap()
+        self.registers.reset()
+        self.cpu.reset_counters()
+        self.device_manager.reset()
+        self.detach()
+        self.instructions_executed = 0
+        self.run_seconds = 0.0
+        self.loads = 0
 
     def step(self):
         """
-        Executes a single instruction cycle by calling the CPU's step method.
+        Executes a single instruction cycle, through the attached instrument if any.
+
+        Without an instrument the CPU is stepped directly, skipping run()'s
+        setup; the instruction is counted but its time is not added to
+        run_seconds.
+
+        Returns:
+            Whatever the attached instrument's run loop returns; otherwise None.
+        """
+        if self.instrument is not None:
+            return self.run(1)
+        # Counted first so current_step() numbers this instruction as run() does.
+        self.instructions_executed += 1
+        try:
+            self.cpu.step()
+        except BaseException:
+            self.instructions_executed -= 1
+            raise
+
+    def is_halted(self) -> bool:
+        """
+        Returns True if the PC is on the halt idiom, a J to itself. SIC has
+        no halt instruction, so this is how programs end.
+        """
+        pc = self.registers.PC
+        return pc <= self.memory.SIZE - 3 and self.memory.read_word(pc) == (HALT_OPCODE << 16) | pc
+
+    def run_limited(self, limits: ExecutionLimits):
+        """
+        Runs until the program halts, enforcing execution limits.
+
+        The plain run loop executes chunks of at most limits.check_every
+        instructions; the halt idiom, the clock and the device counters are
+        checked only between chunks, so a hostile infinite loop runs at full
+        speed until it is stopped. Chunks start small and double, so a short
+        program spins little once halted. The device limits are checked once
+        more after the program halts, as the last chunk may have gone over.
+
+        Returns:
+            True once the program has halted, or the attached instrument's
+            result if it stopped the run early, such as the Debugger's
+            StopEvent at a breakpoint. Calling again resumes the run.
+
+        Raises:
+            LimitExceeded: If a limit is exceeded. Usage is counted from the
+                start of this call.
+            ValueError: If limits.check_every is not positive.
+        """
+        if limits.check_every < 1:
+            raise ValueError(f"check_every must be positive, got {limits.check_every}.")
+        cpu = self.cpu
+        started = perf_counter()
+        deadline = None if limits.timeout is None else started + limits.timeout
+        executed_before = self.instructions_executed
+        output_before, input_before = cpu.device_bytes_out, cpu.device_bytes_in
+        remaining = limits.max_instructions
+        chunk = min(FIRST_CHUNK_STEPS, limits.check_every)
+        while True:
+            exceeded = None
+            if (limits.max_output_bytes is not None
+                    and cpu.device_bytes_out - output_before > limits.max_output_bytes):
+                exceeded = (MAX_OUTPUT_BYTES, limits.max_output_bytes)
+            elif (limits.max_input_reads is not None
+                  and cpu.device_bytes_in - input_before > limits.max_input_reads):
+                exceeded = (MAX_INPUT_READS, limits.max_input_reads)
+            elif self.is_halted():
+                return True
+            elif remaining is not None and remaining <= 0:
+                exceeded = (MAX_INSTRUCTIONS, limits.max_instructions)
+            elif deadline is not None and perf_counter() > deadline:
+                exceeded = (TIMEOUT, limits.timeout)
+            if exceeded is not None:
+                registers = self.registers
+                raise LimitExceeded(
+                    *exceeded,
+                    instructions=self.instructions_executed - executed_before,
+                    elapsed=perf_counter() - started,
+                    output_bytes=cpu.device_bytes_out - output_before,
+                    input_reads=cpu.device_bytes_in - input_before,
+                    registers={name: getattr(registers, name) for name in ("A", "X", "L", "PC", "SW")},
+                )
+            result = self.run(chunk if remaining is None else min(chunk, remaining))
+            if result is not None:
+                return result
+            if remaining is not None:
+                # An instrument may end a chunk early, so count what actually ran.
+                remaining = limits.max_instructions - (self.instructions_executed - executed_before)
+            chunk = min(chunk * 2, limits.check_every)
+
+    def current_step(self) -> int:
+        """
+        Returns the 1-based number of the instruction being executed, counted
+        over the machine's lifetime. Between runs it is the number of
+        instructions completed so far. This is cheap enough for device hooks
+        but is not meant to be called on every step.
+        """
+        if self._ticks is None:
+            return self.instructions_executed
+        return self.instructions_executed + self._run_steps - length_hint(self._ticks)
+
+    def record_devices(self):
+        """
+        Starts recording device I/O, stamped with instruction step numbers.
+
+        Returns:
+            The DeviceLog receiving the interactions; stop with device_manager.stop().
+        """
+        return self.device_manager.start_recording(clock=self.current_step)
+
+    def replay_devices(self, log):
+        """
+        Replays recorded device I/O. Each interaction must recur at the step
+        where it was recorded, otherwise ReplayDivergenceError is raised.
+
+        Args:
+            log: A DeviceLog from record_devices().
         """
-        self.cpu.step()
+        self.device_manager.start_replay(log, clock=self.current_step)
 
     def load_program(self, program: list[int], start_address: int):
         """
@@ -40,6 +191,7 @@ class SICMachine:
             program: A list of 24-bit integers representing the program.
             start_address: The memory address where loading should begin.
         """
+        self.loads += 1
         current_address = start_address
         for word in program:
             self.memory.write_word(current_address, word)
@@ -53,16 +205,111 @@ class SICMachine:
             object_code: A string containing the object code lines.
             load_address: Optional address to load the program at.
         """
+        self.loads += 1
         loader = Loader(self)
         loader.load(object_code, load_address)
 
+    def attach(self, instrument):
+        """
+        Attaches an instrument, such as an ExecutionProfiler, to the machine.
+        While attached, run() hands execution to the instrument's own run loop,
+        so the plain loop carries no instrumentation checks at all.
+
+        Args:
+            instrument: An object with a run(machine, ticks) method that executes
+                one instruction per item drawn from the ticks iterator.
+
+        Raises:
+            RuntimeError: If another instrument is already attached.
+        """
+        if self.instrument is not None:
+            raise RuntimeError("An instrument is already attached to this machine.")
+        self.instrument = instrument
+
+    def detach(self):
+        """
+        Detaches the current instrument, restoring the plain run loop. An
+        instrument that buffers its output, such as a Tracer, is flushed.
+
+        Returns:
+            The detached instrument, or None if there was none.
+        """
+        instrument = self.instrument
+        self.instrument = None
+        flush = getattr(instrument, "flush", None)
+        if flush is not None:
+            flush()
+        return instrument
+
     def run(self, steps: int = 100):
         """
         Runs the CPU's fetch-decode-execute cycle for a given number of steps.
         
         Args:
             steps: The maximum number of instructions to execute.
+
+        Returns:
+            Whatever the attached instrument's run loop returns, such as the
+            Debugger's StopEvent when a breakpoint is hit; otherwise None.
+
+        Raises:
+            ValueError: If steps is negative.
+        """
+        if steps < 0:
+            raise ValueError(f"Cannot run a negative number of steps: {steps}.")
+        # Run loops draw one tick per instruction. What is left of the iterator
+        # afterwards tells how many instructions ran, with no per-step counting.
+        ticks = iter(range(steps))
+        self._ticks = ticks
+        self._run_steps = steps
+        completed = False
+        result = None
+        started = perf_counter()
+        try:
+            if self.instrument is not None:
+                result = self.instrument.run(self, ticks)
+            else:
+                step = self.cpu.step
+                for _ in ticks:
+                    step()
+            completed = True
+        finally:
+            executed = steps - length_hint(ticks)
+            if not completed and executed:
+                # The instruction whose tick was drawn last raised instead of completing.
+                executed -= 1
+            self.instructions_executed += executed
+            self.run_seconds += perf_counter() - started
+            self._ticks = None
+        return result
+
+    def stats(self) -> MachineStats:
+        """
+        Returns a snapshot of the machine's counters. The counters are
+        updated once per run (or per I/O instruction or load), never per
+        step, so taking a snapshot is cheap and running is not slowed.
+        """
+        cpu = self.cpu
+        instructions = self.instructions_executed
+        seconds = self.run_seconds
+        return MachineStats(
+            instructions=instructions,
+            run_seconds=seconds,
+            instructions_per_second=instructions / seconds if seconds else 0.0,
+            device_bytes_in=cpu.device_bytes_in,
+            device_bytes_out=cpu.device_bytes_out,
+            loads=self.loads,
+            decode_cache_hits=cpu.decode_hits,
+            decode_cache_misses=cpu.decode_misses,
+        )
+
+    def write_prometheus(self, path, labels: dict | None = None):
+        """
+        Writes stats() as a Prometheus text-exposition file, atomically.
+
+        Args:
+            path: The destination file, conventionally ending in .prom.
+            labels: Optional labels added to every sample.
         """
-        for _ in range(steps):
-            self.step()
+        write_prometheus(self.stats(), path, labels)
 
@@ -15,6 +15,44 @@ class Memory:
         # It's an efficient way to represent a block of memory.
         self._memory = bytearray(self.SIZE)
 
+    def use_buffer(self, buffer):
+        """
+        Replaces the storage with another mutable buffer of SIZE bytes, such
+        as a private mmap of a program image. Earlier references to buffer
+        keep pointing at the old storage.
+
+        Raises:
+            ValueError: If the buffer is not SIZE bytes long.
+        """
+        if len(buffer) != self.SIZE:
+            raise ValueError(f"Memory buffer must be {self.SIZE} bytes, got {len(buffer)}.")
+        self._memory = buffer
+
+    def clear(self):
+        """
+        Sets every byte to 0 in place. The storage is kept, so references
+        to buffer stay valid, and zeroing it is a single slice assignment.
+        """
+        self._memory[:] = _ZEROS
+
+    def unwrap(self):
+        """
+        Removes any read or write methods installed on this instance by
+        tools such as MemoryAccessProfiler, restoring the plain class methods.
+        """
+        for name in ("read_word", "read_byte", "write_word", "write_byte"):
+            self.__dict__.pop(name, None)
+
+    @property
+    def buffer(self):
+        """
+        The underlying byte storage, a bytearray unless use_buffer() swapped
+        in another buffer. Intended for instrumentation that scans
+        memory on the hot path without the per-call bounds checks; callers
+        must not resize it.
+        """
+        return self._memory
+
     def read_byte(self, address):
         """
         Reads a single byte from the specified address.
@@ -109,3 +147,6 @@ class Memory:
         self._memory[address] = byte1
         self._memory[address + 1] = byte2
         self._memory[address + 2] = byte3
+
+# Source for Memory.clear().
+_ZEROS = bytes(Memory.SIZE)
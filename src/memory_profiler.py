@@ -0,0 +1,179 @@
+from .memory import Memory
+
+# Heatmap pages default to 256 bytes, matching the debugger's watch pages.
+PAGE_BITS = 8
+
+_METHODS = ("read_word", "read_byte", "write_word", "write_byte")
+
+
+class MemoryAccessProfiler:
+    """
+    Counts memory reads and writes per address to find hot data areas.
+
+    Unlike the execution profilers this is not a machine instrument: attach()
+    wraps the read/write methods of one Memory instance and detach() restores
+    them, so a detached profiler costs nothing. Instruction fetches go through
+    read_word and are counted as reads. Word accesses count once, at their
+    first byte.
+
+    With sample_every=N only every Nth call of each method is counted, and the
+    heatmaps scale the samples back up by N. Counters are kept per address
+    (like ExecutionProfiler.address_counts) and summed into pages or symbol
+    ranges when exported.
+    """
+
+    def __init__(self, sample_every: int = 1, page_bits: int = PAGE_BITS):
+        """
+        Initializes the profiler with zeroed counters.
+
+        Args:
+            sample_every: Count every Nth access per method; 1 counts all of them.
+            page_bits: log2 of the heatmap page size.
+
+        Raises:
+            ValueError: If sample_every is less than 1.
+        """
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be at least 1, got {sample_every}.")
+        self.sample_every = sample_every
+        self.page_bits = page_bits
+        self.read_counts = [0] * Memory.SIZE
+        self.write_counts = [0] * Memory.SIZE
+        self._memory = None
+        self._saved = {}
+
+    def reset(self):
+        """Clears all counters."""
+        self.read_counts[:] = [0] * Memory.SIZE
+        self.write_counts[:] = [0] * Memory.SIZE
+
+    def attach(self, memory: Memory):
+        """
+        Starts counting accesses to a Memory.
+
+        Raises:
+            RuntimeError: If the profiler is already attached.
+        """
+        if self._memory is not None:
+            raise RuntimeError("The memory access profiler is already attached.")
+        self._memory = memory
+        # Wrap whatever is current, so tools such as the debugger can stack.
+        self._saved = {name: memory.__dict__.get(name) for name in _METHODS}
+        memory.read_word = self._wrap(memory.read_word, self.read_counts)
+        memory.read_byte = self._wrap(memory.read_byte, self.read_counts)
+        memory.write_word = self._wrap(memory.write_word, self.write_counts)
+        memory.write_byte = self._wrap(memory.write_byte, self.write_counts)
+
+    def detach(self):
+        """
+        Stops counting and restores the memory's previous methods. Methods
+        already removed, e.g. by SICMachine.reset(), are left removed.
+        """
+        memory = self._memory
+        if memory is None:
+            return
+        for name, previous in self._saved.items():
+            if name not in memory.__dict__:
+                continue
+            if previous is None:
+                del memory.__dict__[name]
+            else:
+                setattr(memory, name, previous)
+        self._memory = None
+        self._saved = {}
+
+    def _wrap(self, method, counts):
+        """Returns method wrapped to count (a sample of) its calls by address."""
+        every = self.sample_every
+        # Counting after the call leaves out-of-range accesses to the method's
+        # own IndexError instead of the counter list's.
+        if every == 1:
+            def counted(address, *value):
+                result = method(address, *value)
+                counts[address] += 1
+                return result
+            return counted
+
+        remaining = every
+
+        def sampled(address, *value):
+            nonlocal remaining
+            result = method(address, *value)
+            remaining -= 1
+            if not remaining:
+                remaining = every
+                counts[address] += 1
+            return result
+        return sampled
+
+    def page_heatmap(self) -> list[tuple[int, int, int]]:
+        """
+        Returns estimated access counts for every page that was touched.
+
+        Returns:
+            (page_address, reads, writes) tuples in address order.
+        """
+        size = 1 << self.page_bits
+        scale = self.sample_every
+        reads, writes = self.read_counts, self.write_counts
+        heatmap = []
+        for page in range(0, Memory.SIZE, size):
+            page_reads = sum(reads[page:page + size])
+            page_writes = sum(writes[page:page + size])
+            if page_reads or page_writes:
+                heatmap.append((page, page_reads * scale, page_writes * scale))
+        return heatmap
+
+    def symbol_heatmap(self, symtab) -> list[tuple[str, int, int]]:
+        """
+        Returns estimated access counts per symbol, hottest first.
+
+        Each symbol owns the bytes from its address up to the next symbol's,
+        as in SymbolTable.symbol_at. Accesses below the first symbol are not
+        attributed.
+
+        Returns:
+            (symbol, reads, writes) tuples for symbols with any accesses.
+        """
+        scale = self.sample_every
+        reads, writes = self.read_counts, self.write_counts
+        symbols = symtab.items()
+        heatmap = []
+        for index, (name, address) in enumerate(symbols):
+            end = symbols[index + 1][1] if index + 1 < len(symbols) else Memory.SIZE
+            symbol_reads = sum(reads[address:end])
+            symbol_writes = sum(writes[address:end])
+            if symbol_reads or symbol_writes:
+                heatmap.append((name, symbol_reads * scale, symbol_writes * scale))
+        heatmap.sort(key=lambda entry: entry[1] + entry[2], reverse=True)
+        return heatmap
+
+    def report(self, symtab=None, width: int = 40) -> str:
+        """
+        Formats the page heatmap, followed by the symbol heatmap if a
+        SymbolTable is given.
+
+        Args:
+            symtab: Optional SymbolTable for the per-symbol section.
+            width: The length of the bar drawn for the hottest entry.
+
+        Returns:
+            The report text.
+        """
+        pages = self.page_heatmap()
+        lines = ["Memory accesses by page:", f"{'PAGE':<6} {'READS':>12} {'WRITES':>12}"]
+        lines.extend(self._rows([(f"{page:04X}", r, w) for page, r, w in pages], width))
+        if symtab is not None:
+            lines.extend(["", "Memory accesses by symbol:", f"{'SYMBOL':<6} {'READS':>12} {'WRITES':>12}"])
+            lines.extend(self._rows(self.symbol_heatmap(symtab), width))
+        return "\n".join(lines)
+
+    @staticmethod
+    def _rows(entries, width: int) -> list[str]:
+        """Formats (name, reads, writes) entries with bars scaled to the hottest."""
+        hottest = max((r + w for _, r, w in entries), default=0)
+        rows = []
+        for name, reads, writes in entries:
+            bar = "#" * max(1, round(width * (reads + writes) / hottest))
+            rows.append(f"{name:<6} {reads:>12} {writes:>12}  {bar}")
+        return rows
@@ -0,0 +1,105 @@
+import os
+from typing import NamedTuple
+
+
+class MachineStats(NamedTuple):
+    """
+    A snapshot of a SICMachine's counters, returned by SICMachine.stats().
+
+    run_seconds is wall-clock time spent inside run(); instructions_per_second
+    is measured over that time, so idle time between runs does not dilute it.
+    """
+    instructions: int
+    run_seconds: float
+    instructions_per_second: float
+    device_bytes_in: int
+    device_bytes_out: int
+    loads: int
+    decode_cache_hits: int
+    decode_cache_misses: int
+
+    @property
+    def decode_cache_hit_rate(self) -> float:
+        """The fraction of instruction fetches served by the decode cache."""
+        lookups = self.decode_cache_hits + self.decode_cache_misses
+        return self.decode_cache_hits / lookups if lookups else 0.0
+
+
+# (metric name, type, help text, value getter) in exposition order.
+_METRICS = (
+    ("sic_instructions_executed_total", "counter", "Instructions executed.",
+     lambda stats: stats.instructions),
+    ("sic_run_seconds_total", "counter", "Wall-clock seconds spent running instructions.",
+     lambda stats: stats.run_seconds),
+    ("sic_instructions_per_second", "gauge", "Instructions per second of run time.",
+     lambda stats: stats.instructions_per_second),
+    ("sic_device_bytes_in_total", "counter", "Bytes read from devices with RD.",
+     lambda stats: stats.device_bytes_in),
+    ("sic_device_bytes_out_total", "counter", "Bytes written to devices with WD.",
+     lambda stats: stats.device_bytes_out),
+    ("sic_loads_total", "counter", "Programs loaded into memory.",
+     lambda stats: stats.loads),
+    ("sic_decode_cache_hits_total", "counter", "Instruction fetches served by the decode cache.",
+     lambda stats: stats.decode_cache_hits),
+    ("sic_decode_cache_misses_total", "counter", "Instruction fetches that had to be decoded.",
+     lambda stats: stats.decode_cache_misses),
+    ("sic_decode_cache_hit_ratio", "gauge", "Fraction of fetches served by the decode cache.",
+     lambda stats: stats.decode_cache_hit_rate),
+)
+
+
+def _escape_label(value: str) -> str:
+    """Escapes a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_prometheus(stats: MachineStats, labels: dict | None = None) -> str:
+    """
+    Formats machine statistics in the Prometheus text exposition format.
+
+    Args:
+        stats: The snapshot to format.
+        labels: Optional labels added to every sample, e.g. {"machine": "3"}.
+
+    Returns:
+        The exposition text, ending with a newline.
+    """
+    label_text = ""
+    if labels:
+        label_text = "{" + ",".join(
+            f'{name}="{_escape_label(str(value))}"' for name, value in sorted(labels.items())
+        ) + "}"
+    lines = []
+    for name, kind, help_text, value in _METRICS:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"{name}{label_text} {value(stats)}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(stats: MachineStats, path, labels: dict | None = None):
+    """
+    Writes machine statistics to a file for the node exporter's textfile
+    collector. The file is written under a temporary name and renamed into
+    place, so a scrape never sees a partial file.
+
+    Args:
+        stats: The snapshot to write.
+        path: The destination, conventionally ending in .prom.
+        labels: Optional labels added to every sample.
+    """
+    # Imported here so that importing the machine stays cheap.
+    import tempfile
+
+    path = os.fspath(path)
+    directory = os.path.dirname(path) or "."
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".sic-metrics-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(format_prometheus(stats, labels))
+        # mkstemp creates the file private; the exporter may run as another user.
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
@@ -0,0 +1,70 @@
+from collections import deque
+from contextlib import contextmanager
+
+from .machine import SICMachine
+
+
+class MachinePool:
+    """
+    Hands out ready SICMachines and takes them back after an in-place reset.
+
+    Machines are created by a factory, which may also attach devices; since
+    SICMachine.reset() keeps devices attached, a returned machine comes back
+    with the same devices, reset. Idle machines are kept in a deque, whose
+    append and pop are atomic, so threads may share a pool.
+    """
+
+    def __init__(self, size: int = 0, max_idle: int | None = None, factory=SICMachine):
+        """
+        Args:
+            size: Machines to create up front.
+            max_idle: The most idle machines kept; machines released beyond
+                this are dropped. Unlimited if None.
+            factory: Callable returning a new machine.
+
+        Raises:
+            ValueError: If size or max_idle is negative.
+        """
+        if size < 0 or (max_idle is not None and max_idle < 0):
+            raise ValueError("Pool sizes must not be negative.")
+        self._factory = factory
+        self.max_idle = max_idle
+        self._idle = deque(factory() for _ in range(size))
+        # Machines created by the pool, and acquisitions served from idle ones.
+        self.created = size
+        self.reused = 0
+
+    def __len__(self) -> int:
+        """Returns the number of idle machines."""
+        return len(self._idle)
+
+    def acquire(self) -> SICMachine:
+        """Returns an idle machine, or a new one if none is idle."""
+        try:
+            machine = self._idle.pop()
+        except IndexError:
+            self.created += 1
+            return self._factory()
+        self.reused += 1
+        return machine
+
+    def release(self, machine: SICMachine):
+        """
+        Resets a machine in place and returns it to the pool.
+
+        The most recently released machine is handed out first, while its
+        memory is still warm in the CPU caches.
+        """
+        if self.max_idle is not None and len(self._idle) >= self.max_idle:
+            return
+        machine.reset()
+        self._idle.append(machine)
+
+    @contextmanager
+    def machine(self):
+        """Acquires a machine for the duration of a with block."""
+        machine = self.acquire()
+        try:
+            yield machine
+        finally:
+            self.release(machine)
@@ -0,0 +1,106 @@
+import heapq
+
+from .memory import Memory
+from .assembler.optab import MNEMONICS
+
+
+class ExecutionProfiler:
+    """
+    Counts instruction executions per opcode and per PC address.
+
+    Attach it to a SICMachine with machine.attach(profiler); run() then uses
+    the profiler's run loop. The counters are plain lists preallocated for all
+    256 opcodes and every memory address, so the hot path only does two
+    indexed increments per instruction and never allocates.
+    """
+
+    def __init__(self):
+        """
+        Initializes the profiler with zeroed counters.
+        """
+        self.opcode_counts = [0] * 256
+        self.address_counts = [0] * Memory.SIZE
+
+    def reset(self):
+        """Clears all counters."""
+        self.opcode_counts[:] = [0] * 256
+        self.address_counts[:] = [0] * Memory.SIZE
+
+    def run(self, machine, ticks):
+        """
+        Executes instructions on the machine, counting each one.
+
+        Args:
+            machine: The SICMachine being profiled.
+            ticks: An iterator yielding once per instruction to execute.
+        """
+        step = machine.cpu.step
+        registers = machine.registers
+        memory = machine.memory.buffer
+        opcode_counts = self.opcode_counts
+        address_counts = self.address_counts
+        for _ in ticks:
+            pc = registers.PC
+            step()
+            # Counted after the step so a faulting fetch reports the CPU's own
+            # error. The opcode byte only differs if the instruction overwrote itself.
+            address_counts[pc] += 1
+            opcode_counts[memory[pc]] += 1
+
+    @property
+    def total(self) -> int:
+        """The total number of instructions counted."""
+        return sum(self.opcode_counts)
+
+    def hot_spots(self, limit: int = 10) -> list[tuple[int, int]]:
+        """
+        Returns the most executed instruction addresses.
+
+        Args:
+            limit: The maximum number of entries to return.
+
+        Returns:
+            (address, count) pairs, highest count first; ties by ascending address.
+        """
+        top = heapq.nsmallest(
+            limit,
+            ((-count, address) for address, count in enumerate(self.address_counts) if count),
+        )
+        return [(address, -negative) for negative, address in top]
+
+    def opcode_profile(self) -> list[tuple[str, int]]:
+        """
+        Returns execution counts per instruction mnemonic.
+
+        Returns:
+            (mnemonic, count) pairs for every executed opcode, highest count first.
+            Opcodes that are not SIC instructions are shown as two hex digits.
+        """
+        profile = [
+            (MNEMONICS[opcode] or f"{opcode:02X}", count)
+            for opcode, count in enumerate(self.opcode_counts) if count
+        ]
+        profile.sort(key=lambda entry: -entry[1])
+        return profile
+
+    def report(self, symtab=None, limit: int = 10) -> str:
+        """
+        Formats a hot-spot report.
+
+        Args:
+            symtab: Optional SymbolTable used to annotate addresses as LABEL+offset.
+            limit: The number of hot spots to list.
+
+        Returns:
+            The report text.
+        """
+        total = self.total
+        lines = [f"Instructions executed: {total}", "", "Hot spots:"]
+        lines.append(f"{'ADDR':<6} {'COUNT':>12} {'%':>7}  SYMBOL")
+        for address, count in self.hot_spots(limit):
+            symbol = symtab.describe_address(address) if symtab is not None else ""
+            lines.append(f"{address:04X}   {count:>12} {100 * count / total:>6.2f}%  {symbol}")
+        lines.extend(["", "Opcodes:"])
+        for mnemonic, count in self.opcode_profile():
+            lines.append(f"{mnemonic:<6} {count:>12} {100 * count / total:>6.2f}%")
+        return "\n".join(lines)
@@ -24,6 +24,13 @@ class Registers:
         self._T = 0
         self._F = 0
 
+    def reset(self):
+        """
+        Sets all registers back to 0 in place.
+        """
+        self._A = self._X = self._L = self._PC = self._SW = 0
+        self._B = self._S = self._T = self._F = 0
+
     @property
     def A(self):
         return self._A
@@ -0,0 +1,367 @@
+import heapq
+from itertools import count
+from time import perf_counter
+from typing import NamedTuple
+
+from .assembler.optab import OPTAB
+
+TD = OPTAB["TD"].opcode
+JEQ = OPTAB["JEQ"].opcode
+
+# Scheduling policies.
+ROUND_ROBIN = "round_robin"
+PRIORITY = "priority"
+
+# Machine states.
+READY = "ready"
+PARKED = "parked"
+HALTED = "halted"
+FAILED = "failed"
+
+# Stride scheduling: a machine's pass advances by STRIDE / weight per quantum,
+# so over time each machine runs in proportion to its weight.
+STRIDE = 1 << 20
+
+
+class ScheduledStats(NamedTuple):
+    """
+    Per-machine scheduling statistics.
+
+    Latency is the time a machine waited, ready to run, before being given
+    its next quantum; time spent parked on a device is counted separately.
+    """
+    name: str
+    state: str
+    priority: int
+    quanta: int
+    instructions: int
+    run_seconds: float
+    wait_seconds: float
+    max_wait_seconds: float
+    parked_seconds: float
+    parks: int
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        return self.wait_seconds / self.quanta if self.quanta else 0.0
+
+
+class ScheduledMachine:
+    """A machine held by a Scheduler, with its scheduling state and counters."""
+
+    def __init__(self, machine, name: str, priority: int):
+        self.machine = machine
+        self.name = name
+        self.priority = priority
+        self.state = READY
+        self.error = None
+        # Stride-scheduling pass value and the device a parked machine waits on.
+        self.pass_value = 0
+        self.device_id = None
+        self.quanta = 0
+        self.instructions = 0
+        self.run_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.parked_seconds = 0.0
+        self.parks = 0
+        # When the machine last became ready, or was parked.
+        self.since = 0.0
+
+    def stats(self) -> ScheduledStats:
+        return ScheduledStats(
+            name=self.name,
+            state=self.state,
+            priority=self.priority,
+            quanta=self.quanta,
+            instructions=self.instructions,
+            run_seconds=self.run_seconds,
+            wait_seconds=self.wait_seconds,
+            max_wait_seconds=self.max_wait_seconds,
+            parked_seconds=self.parked_seconds,
+            parks=self.parks,
+        )
+
+
+def blocked_device(machine) -> int | None:
+    """
+    Returns the device a machine is polling, if it is in the SIC wait loop
+    (TD dev / JEQ back to the TD) and that device is busy; otherwise None.
+
+    The device is asked through ready(), not test(), so polling never blocks
+    on a stream, is never logged while recording and never consumes a
+    replay log; a replayed machine is not parked, its own TD answers.
+    """
+    memory = machine.memory
+    pc = machine.registers.PC
+    if pc > memory.SIZE - 3:
+        return None
+    word = memory.read_word(pc)
+    if word >> 16 == JEQ and pc >= 3 and word & 0x7FFF == pc - 3:
+        pc -= 3
+        word = memory.read_word(pc)
+    if word >> 16 != TD or word & 0x8000:
+        return None
+    device_id = word & 0xFF
+    device = machine.device_manager.get_device(device_id)
+    if device is None or device.ready():
+        return None
+    return device_id
+
+
+class Scheduler:
+    """
+    Multiplexes many SICMachines in one thread by time slicing.
+
+    Each turn gives one ready machine a quantum of instructions through its
+    plain run(n) loop, so a machine runs at full speed between switches.
+    Machines are taken round-robin, or under the priority policy by stride
+    scheduling, which shares instructions in proportion to priority without
+    starving low priorities.
+
+    A machine found in the TD/JEQ wait loop on a busy device is parked
+    instead of being given quanta to spin in, and becomes ready again when
+    the device tests ready (parked machines are polled about once per
+    round) or when wake() is called. Machines that halt or raise leave the
+    rotation; an exception is kept on the machine rather than propagated,
+    so one failing session does not stop the others.
+    """
+
+    def __init__(self, quantum: int = 1000, policy: str = ROUND_ROBIN, clock=perf_counter):
+        """
+        Args:
+            quantum: Instructions a machine runs per turn.
+            policy: ROUND_ROBIN or PRIORITY.
+            clock: Time source for the statistics, in seconds.
+
+        Raises:
+            ValueError: If quantum is not positive or policy is unknown.
+        """
+        if quantum < 1:
+            raise ValueError(f"Quantum must be positive, got {quantum}.")
+        if policy not in (ROUND_ROBIN, PRIORITY):
+            raise ValueError(f"Unknown scheduling policy: {policy!r}.")
+        self.quantum = quantum
+        self.policy = policy
+        self._clock = clock
+        self._machines = {}
+        # Ready machines as (pass value, sequence, entry); the sequence keeps
+        # equal passes in FIFO order, which makes equal weights round-robin.
+        self._ready = []
+        self._sequence = count()
+        # Default names; never reused, even after remove().
+        self._names = count()
+        self._parked = {}
+        self._pass = 0
+        self._turns_since_poll = 0
+
+    def add(self, machine, name: str | None = None, priority: int = 1) -> ScheduledMachine:
+        """
+        Adds a machine to the rotation, ready to run.
+
+        Args:
+            machine: The SICMachine, with its program loaded.
+            name: A unique name; defaults to the next unused sequence number.
+            priority: Relative share of instructions under the PRIORITY policy.
+
+        Returns:
+            The ScheduledMachine entry.
+
+        Raises:
+            ValueError: If the name is taken or priority is not positive.
+        """
+        if priority < 1:
+            raise ValueError(f"Priority must be positive, got {priority}.")
+        if name is None:
+            name = str(next(self._names))
+            while name in self._machines:
+                name = str(next(self._names))
+        if name in self._machines:
+            raise ValueError(f"A machine named {name!r} is already scheduled.")
+        entry = ScheduledMachine(machine, name, priority)
+        self._machines[name] = entry
+        entry.pass_value = self._pass
+        self._make_ready(entry, self._clock())
+        return entry
+
+    def remove(self, name: str) -> ScheduledMachine:
+        """
+        Removes a machine from the scheduler.
+
+        Raises:
+            KeyError: If no machine has that name.
+        """
+        entry = self._machines.pop(name)
+        self._parked.pop(name, None)
+        # A ready entry stays in the heap and is skipped when popped.
+        entry.state = None
+        return entry
+
+    def wake(self, name: str):
+        """Makes a parked machine ready, e.g. after feeding its input device."""
+        entry = self._parked.pop(name, None)
+        if entry is not None:
+            self._unpark(entry, self._clock())
+
+    def __len__(self) -> int:
+        return len(self._machines)
+
+    def __getitem__(self, name: str) -> ScheduledMachine:
+        return self._machines[name]
+
+    def _weight(self, entry) -> int:
+        return entry.priority if self.policy == PRIORITY else 1
+
+    def _make_ready(self, entry, now: float):
+        entry.state = READY
+        entry.since = now
+        heapq.heappush(self._ready, (entry.pass_value, next(self._sequence), entry))
+
+    def _park(self, entry, device_id: int, now: float):
+        entry.state = PARKED
+        entry.device_id = device_id
+        entry.since = now
+        entry.parks += 1
+        self._parked[entry.name] = entry
+
+    def _unpark(self, entry, now: float):
+        entry.parked_seconds += now - entry.since
+        entry.device_id = None
+        # Resume at the current pass, so time spent parked is not paid back
+        # as a burst of quanta ahead of everyone else.
+        entry.pass_value = max(entry.pass_value, self._pass)
+        self._make_ready(entry, now)
+
+    def poll(self) -> int:
+        """
+        Tests the devices of parked machines and readies those no longer blocked.
+
+        Returns:
+            The number of machines woken.
+        """
+        self._turns_since_poll = 0
+        if not self._parked:
+            return 0
+        now = self._clock()
+        woken = [entry for entry in self._parked.values() if blocked_device(entry.machine) is None]
+        for entry in woken:
+            del self._parked[entry.name]
+            self._unpark(entry, now)
+        return len(woken)
+
+    def _next_ready(self):
+        ready = self._ready
+        while ready:
+            pass_value, _, entry = heapq.heappop(ready)
+            if entry.state == READY:
+                self._pass = pass_value
+                return entry
+        return None
+
+    def run_once(self) -> ScheduledMachine | None:
+        """
+        Gives one quantum to the next ready machine.
+
+        Returns:
+            The machine that ran, or None if no machine is ready.
+        """
+        if self._parked and self._turns_since_poll >= len(self._ready):
+            self.poll()
+        entry = self._next_ready()
+        if entry is None:
+            return None
+        self._turns_since_poll += 1
+
+        machine = entry.machine
+        started = self._clock()
+        device_id = blocked_device(machine)
+        if device_id is not None:
+            # Already waiting on a busy device: park without using the quantum.
+            self._park(entry, device_id, started)
+            return entry
+        wait = started - entry.since
+        entry.wait_seconds += wait
+        if wait > entry.max_wait_seconds:
+            entry.max_wait_seconds = wait
+
+        executed = machine.instructions_executed
+        try:
+            machine.run(self.quantum)
+        except Exception as error:
+            entry.error = error
+            entry.state = FAILED
+        now = self._clock()
+        entry.quanta += 1
+        entry.instructions += machine.instructions_executed - executed
+        entry.run_seconds += now - started
+        entry.pass_value += STRIDE // self._weight(entry)
+
+        if entry.state == FAILED:
+            return entry
+        if machine.is_halted():
+            entry.state = HALTED
+            return entry
+        device_id = blocked_device(machine)
+        if device_id is not None:
+            self._park(entry, device_id, now)
+        else:
+            self._make_ready(entry, now)
+        return entry
+
+    def run(self, max_quanta: int | None = None) -> int:
+        """
+        Runs quanta until every machine has halted, failed or is parked on a
+        device that stays busy, or until max_quanta have run.
+
+        Returns:
+            The number of turns taken.
+        """
+        turns = 0
+        while max_quanta is None or turns < max_quanta:
+            if self.run_once() is None:
+                # Nothing ready; a parked machine may have become unblocked.
+                if not self.poll():
+                    break
+                continue
+            turns += 1
+        return turns
+
+    def stats(self) -> list[ScheduledStats]:
+        """Returns the statistics of every scheduled machine, in the order added."""
+        now = self._clock()
+        stats = []
+        for entry in self._machines.values():
+            snapshot = entry.stats()
+            if entry.state == PARKED:
+                snapshot = snapshot._replace(parked_seconds=entry.parked_seconds + now - entry.since)
+            stats.append(snapshot)
+        return stats
+
+    def fairness(self) -> float:
+        """
+        Returns Jain's fairness index of instructions per unit of weight over
+        the machines that are still runnable: 1.0 when every machine got
+        exactly its share, approaching 1/n when one machine got everything.
+        """
+        shares = [
+            entry.instructions / self._weight(entry)
+            for entry in self._machines.values()
+            if entry.state in (READY, PARKED)
+        ]
+        total = sum(shares)
+        if not total:
+            return 1.0
+        return total * total / (len(shares) * sum(share * share for share in shares))
+
+    def report(self) -> str:
+        """Returns a table of per-machine statistics and the fairness index."""
+        lines = [f"{'Machine':<16} {'State':<8} {'Pri':>4} {'Quanta':>8} {'Instructions':>13} "
+                 f"{'Mean wait ms':>13} {'Max wait ms':>12} {'Parked ms':>10}"]
+        for stats in self.stats():
+            lines.append(
+                f"{stats.name:<16} {stats.state:<8} {stats.priority:>4} {stats.quanta:>8} "
+                f"{stats.instructions:>13} {stats.mean_wait_seconds * 1000:>13.3f} "
+                f"{stats.max_wait_seconds * 1000:>12.3f} {stats.parked_seconds * 1000:>10.3f}"
+            )
+        lines.append(f"Fairness index: {self.fairness():.3f}")
+        return "\n".join(lines)
@@ -0,0 +1,256 @@
+"""
+Execution service: runs SIC programs submitted over a local socket on a
+pool of warm worker processes.
+
+Messages in both directions are frames: a 4-byte big-endian length followed
+by that many bytes of UTF-8 JSON. A request is
+
+    {"id": 1, "object_code": "H...", "input": "<base64>", "max_steps": 100000,
+     "timeout": 2.5, "max_output_bytes": 65536, "load_address": null}
+
+where only object_code is required and every limit is capped by the
+server's, so a client cannot ask for unbounded output or input. Each request gets exactly one response,
+
+    {"id": 1, "status": "halted" | "max_steps" | "limit" | "error",
+     "output": "<base64>", "instructions": 123, "registers": {"A": 0, ...},
+     "limit": "timeout", "error": "..."}
+
+carrying the request's id. Output is what the program wrote to device 05;
+input is read from device F1. A client may send further requests without
+waiting (pipelining); responses are sent as runs finish, so they can arrive
+out of order and are matched by id. When as many requests are in flight as
+the service allows, it stops reading from connections until a run finishes,
+which pushes back on clients through the socket buffers.
+"""
+import asyncio
+import base64
+import io
+import json
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+LENGTH = struct.Struct(">I")
+MAX_FRAME_SIZE = 16 * 2**20
+
+DEFAULT_MAX_STEPS = 1_000_000
+DEFAULT_MAX_OUTPUT_BYTES = 2**20
+# A run cannot usefully read more input than fits in a request frame.
+DEFAULT_MAX_INPUT_READS = MAX_FRAME_SIZE
+INPUT_DEVICE = 0xF1
+OUTPUT_DEVICE = 0x05
+
+STATUS_HALTED = "halted"
+STATUS_MAX_STEPS = "max_steps"
+STATUS_LIMIT = "limit"
+STATUS_ERROR = "error"
+
+
+class FrameError(ValueError):
+    """Raised when a peer sends a frame that cannot be accepted."""
+    pass
+
+
+async def read_frame(reader: asyncio.StreamReader, max_size: int = MAX_FRAME_SIZE):
+    """
+    Reads one frame and decodes its JSON body.
+
+    Returns:
+        The decoded message, or None if the peer closed the connection
+        between frames.
+
+    Raises:
+        FrameError: If the frame is larger than max_size.
+        asyncio.IncompleteReadError: If the connection closes mid-frame.
+    """
+    try:
+        header = await reader.readexactly(LENGTH.size)
+    except asyncio.IncompleteReadError as error:
+        if not error.partial:
+            return None
+        raise
+    (size,) = LENGTH.unpack(header)
+    if size > max_size:
+        raise FrameError(f"Frame of {size} bytes exceeds the limit of {max_size}.")
+    return json.loads(await reader.readexactly(size))
+
+
+def encode_frame(message) -> bytes:
+    """Encodes a message as a length-prefixed JSON frame."""
+    body = json.dumps(message, separators=(",", ":")).encode()
+    return LENGTH.pack(len(body)) + body
+
+
+# --- Worker side ---
+
+# The machines of a worker process, created on its first request and reused.
+_pool = None
+
+
+def _capped(request: dict, key: str, cap):
+    """Returns the request's limit for key, no larger than the server's cap."""
+    value = request.get(key)
+    if value is None:
+        return cap
+    return value if cap is None else min(value, cap)
+
+
+def execute(request: dict, max_steps_limit: int = DEFAULT_MAX_STEPS, timeout_limit: float | None = None,
+            max_output_bytes_limit: int | None = DEFAULT_MAX_OUTPUT_BYTES,
+            max_input_reads_limit: int | None = DEFAULT_MAX_INPUT_READS) -> dict:
+    """
+    Runs one request on a pooled machine and builds its response. Runs in a
+    worker process; exceeded limits and errors in the program or the request
+    become responses. Each *_limit caps the request's own limit; None leaves
+    it uncapped.
+    """
+    global _pool
+    from .pool import MachinePool
+    from .devices import StreamInputDevice, StreamOutputDevice
+    from .limits import ExecutionLimits, LimitExceeded, MAX_INSTRUCTIONS
+
+    if _pool is None:
+        _pool = MachinePool()
+    response = {"id": request.get("id")}
+    output = io.BytesIO()
+    with _pool.machine() as machine:
+        try:
+            limits = ExecutionLimits(
+                max_instructions=_capped(request, "max_steps", max_steps_limit),
+                timeout=_capped(request, "timeout", timeout_limit),
+                max_output_bytes=_capped(request, "max_output_bytes", max_output_bytes_limit),
+                max_input_reads=_capped(request, "max_input_reads", max_input_reads_limit),
+            )
+            data = base64.b64decode(request.get("input", ""), validate=True)
+            machine.load_object_code(request["object_code"], request.get("load_address"))
+            devices = machine.device_manager
+            devices.add_device(INPUT_DEVICE, StreamInputDevice(io.BytesIO(data)))
+            devices.add_device(OUTPUT_DEVICE, StreamOutputDevice(output))
+            machine.run_limited(limits)
+            response["status"] = STATUS_HALTED
+        except LimitExceeded as error:
+            if error.limit == MAX_INSTRUCTIONS:
+                response["status"] = STATUS_MAX_STEPS
+            else:
+                response["status"] = STATUS_LIMIT
+                response["limit"] = error.limit
+        except Exception as error:
+            response["status"] = STATUS_ERROR
+            response["error"] = f"{type(error).__name__}: {error}"
+        registers = machine.registers
+        response["output"] = base64.b64encode(output.getvalue()).decode()
+        response["instructions"] = machine.instructions_executed
+        response["registers"] = {name: getattr(registers, name) for name in ("A", "X", "L", "PC", "SW")}
+    return response
+
+
+# --- Server side ---
+
+class ExecutionService:
+    """
+    Accepts connections and runs their requests on a worker pool.
+
+    Worker processes stay up between requests and keep their machines in a
+    MachinePool, so a request pays for neither interpreter startup nor
+    machine construction.
+    """
+
+    def __init__(self, workers: int | None = None, max_pending: int | None = None,
+                 max_steps: int = DEFAULT_MAX_STEPS, timeout: float | None = None, executor=None,
+                 max_output_bytes: int | None = DEFAULT_MAX_OUTPUT_BYTES,
+                 max_input_reads: int | None = DEFAULT_MAX_INPUT_READS):
+        """
+        Args:
+            workers: Worker processes; defaults to the CPU count.
+            max_pending: Requests in flight across all connections before the
+                service stops reading; defaults to twice the workers.
+            max_steps: The most instructions any request may run.
+            timeout: The most seconds any request may run, if limited.
+            executor: An existing concurrent.futures executor to run requests
+                on instead of a new process pool.
+            max_output_bytes: The most bytes any request may write, if limited.
+            max_input_reads: The most bytes any request may read, if limited.
+        """
+        self._owns_executor = executor is None
+        self._executor = executor or ProcessPoolExecutor(max_workers=workers)
+        if max_pending is None:
+            max_pending = 2 * (workers or os.cpu_count() or 1)
+        self._slots = asyncio.Semaphore(max_pending)
+        self.max_steps = max_steps
+        self.timeout = timeout
+        self.max_output_bytes = max_output_bytes
+        self.max_input_reads = max_input_reads
+        self.requests = 0
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serves one connection until the client closes it or sends a bad frame."""
+        loop = asyncio.get_running_loop()
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def respond(message):
+            async with write_lock:
+                writer.write(encode_frame(message))
+                await writer.drain()
+
+        async def run(request):
+            try:
+                try:
+                    response = await loop.run_in_executor(self._executor, execute, request,
+                                                          self.max_steps, self.timeout,
+                                                          self.max_output_bytes, self.max_input_reads)
+                except Exception as error:
+                    # The worker itself failed, e.g. the process pool broke.
+                    response = {"id": request.get("id"), "status": STATUS_ERROR,
+                                "error": f"{type(error).__name__}: {error}"}
+                await respond(response)
+            except ConnectionError:
+                pass
+            finally:
+                self._slots.release()
+
+        try:
+            while True:
+                try:
+                    request = await read_frame(reader)
+                except (ValueError, asyncio.IncompleteReadError) as error:
+                    if not isinstance(error, asyncio.IncompleteReadError):
+                        await respond({"id": None, "status": STATUS_ERROR, "error": str(error)})
+                    break
+                if request is None:
+                    break
+                if not isinstance(request, dict) or "object_code" not in request:
+                    request_id = request.get("id") if isinstance(request, dict) else None
+                    await respond({"id": request_id, "status": STATUS_ERROR,
+                                   "error": "Request must be an object with object_code."})
+                    continue
+                # Wait for a free slot before reading on, so a saturated pool
+                # leaves further requests unread in the socket.
+                await self._slots.acquire()
+                self.requests += 1
+                task = asyncio.create_task(run(request))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """Starts listening on a Unix domain socket."""
+        return await asyncio.start_unix_server(self.handle_connection, path)
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        """Starts listening on a TCP port, by default an ephemeral one on localhost."""
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    def close(self):
+        """Shuts down the worker pool if the service created it."""
+        if self._owns_executor:
+            self._executor.shutdown()
@@ -0,0 +1,136 @@
+import mmap
+import os
+import struct
+from multiprocessing import shared_memory
+
+from .memory import Memory
+
+# An image is the machine's memory followed by a trailer with the registers.
+# Memory comes first so it starts on a page boundary and can be mapped alone.
+_TRAILER = struct.Struct(">4s5I")
+IMAGE_MAGIC = b"SICI"
+IMAGE_SIZE = Memory.SIZE + _TRAILER.size
+
+# Where Linux exposes POSIX shared memory segments as files.
+_SHM_DIRECTORY = "/dev/shm"
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    """
+    Attaches to an existing segment without registering it with the
+    resource tracker, which would otherwise unlink the segment when an
+    unrelated worker process exits while the publisher still owns it.
+
+    Python < 3.13 cannot skip the registration. Workers started through
+    multiprocessing share the publisher's tracker, for which registering
+    again is harmless, so on those versions workers should be started that
+    way rather than independently.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedProgramImage:
+    """
+    A loaded program's memory and registers, published once in shared memory
+    for worker processes that run the same program.
+
+    The publisher calls publish() after loading the program and passes the
+    image's name to the workers. Each worker calls attach() and then either
+    load_into(), which initializes a machine with a single buffer copy, or
+    map_into(), which runs the machine directly over a private copy-on-write
+    mapping, so pages the program never writes stay shared between workers.
+    Either way the object code is parsed and loaded only once.
+    """
+
+    def __init__(self, segment: shared_memory.SharedMemory, owner: bool):
+        self._segment = segment
+        self._owner = owner
+
+    @classmethod
+    def publish(cls, machine, name: str | None = None) -> "SharedProgramImage":
+        """
+        Copies a machine's memory and registers into a new shared segment.
+
+        Args:
+            machine: The SICMachine with the program loaded.
+            name: Optional segment name; the system picks one if None.
+
+        Returns:
+            The image, owned by the caller, who must unlink() it when the
+            workers are done (or use it as a context manager).
+        """
+        segment = shared_memory.SharedMemory(name=name, create=True, size=IMAGE_SIZE)
+        registers = machine.registers
+        segment.buf[:Memory.SIZE] = machine.memory.buffer
+        _TRAILER.pack_into(segment.buf, Memory.SIZE, IMAGE_MAGIC,
+                           registers.A, registers.X, registers.L, registers.PC, registers.SW)
+        return cls(segment, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedProgramImage":
+        """
+        Attaches to an image published by another process.
+
+        Raises:
+            FileNotFoundError: If no segment has that name.
+            ValueError: If the segment does not hold a program image.
+        """
+        segment = _attach_untracked(name)
+        if segment.size < IMAGE_SIZE or _TRAILER.unpack_from(segment.buf, Memory.SIZE)[0] != IMAGE_MAGIC:
+            segment.close()
+            raise ValueError(f"Shared memory segment {name!r} is not a SIC program image.")
+        return cls(segment, owner=False)
+
+    @property
+    def name(self) -> str:
+        """The segment name to pass to attach()."""
+        return self._segment.name
+
+    def _set_registers(self, machine):
+        _, a, x, l, pc, sw = _TRAILER.unpack_from(self._segment.buf, Memory.SIZE)
+        registers = machine.registers
+        registers.A, registers.X, registers.L, registers.PC, registers.SW = a, x, l, pc, sw
+
+    def load_into(self, machine):
+        """Initializes a machine's memory and registers from the image with one copy."""
+        machine.memory.buffer[:] = self._segment.buf[:Memory.SIZE]
+        self._set_registers(machine)
+
+    def map_into(self, machine):
+        """
+        Points a machine's memory at a private copy-on-write mapping of the
+        image. Writes stay private to the machine; unwritten pages are
+        shared with every other process mapping the image.
+
+        Raises:
+            OSError: If the platform does not expose shared memory segments
+                as files, as Linux does under /dev/shm.
+        """
+        path = os.path.join(_SHM_DIRECTORY, self._segment.name.lstrip("/"))
+        with open(path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), Memory.SIZE, access=mmap.ACCESS_COPY)
+        machine.memory.use_buffer(mapping)
+        self._set_registers(machine)
+
+    def close(self):
+        """Detaches this process from the image."""
+        self._segment.close()
+
+    def unlink(self):
+        """Detaches and destroys the image; only the publisher may do this."""
+        if not self._owner:
+            raise RuntimeError("Only the publishing process may unlink a program image.")
+        self._segment.close()
+        self._segment.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
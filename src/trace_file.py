@@ -0,0 +1,237 @@
+import bisect
+import mmap
+import queue
+import struct
+import threading
+from typing import NamedTuple
+
+# File layout: a 16-byte header followed by fixed-width little-endian records.
+MAGIC = b"SICTRC01"
+HEADER = struct.Struct("<8sII")
+# step number, PC, instruction word, A, X, SW (registers after execution).
+RECORD = struct.Struct("<QIIIII")
+
+
+class BinaryTraceRecord(NamedTuple):
+    """
+    One executed instruction read back from a binary trace file.
+    """
+    step: int
+    pc: int
+    word: int
+    a: int
+    x: int
+    sw: int
+
+
+class TraceRecorder:
+    """
+    Records every executed instruction into a compact binary trace file.
+
+    Attach it to a SICMachine with machine.attach(recorder). Each instruction
+    is packed into a fixed-width record in a preallocated bytearray. Full
+    buffers are handed to a background writer thread, which writes them to
+    disk and returns them for reuse, so the run loop never waits on I/O unless
+    every buffer is in flight. flush(), which SICMachine.detach() calls,
+    makes everything recorded so far readable; close() also finishes the file.
+    """
+
+    def __init__(self, path, buffer_records: int = 16384, buffers: int = 4):
+        """
+        Opens the trace file and starts the writer thread.
+
+        Args:
+            path: The trace file to create.
+            buffer_records: The number of records held by each buffer.
+            buffers: The number of buffers cycling between the run loop and the writer.
+        """
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, RECORD.size, 0))
+        self._buffer_size = buffer_records * RECORD.size
+        self._free = queue.Queue()
+        for _ in range(buffers - 1):
+            self._free.put(bytearray(self._buffer_size))
+        self._full = queue.Queue()
+        self._buffer = bytearray(self._buffer_size)
+        self._offset = 0
+        self._error = None
+        self.steps = 0
+        self._writer = threading.Thread(target=self._write_loop, name="sic-trace-writer", daemon=True)
+        self._writer.start()
+
+    def _write_loop(self):
+        """Writes full buffers until the None sentinel arrives."""
+        while True:
+            item = self._full.get()
+            if item is None:
+                self._full.task_done()
+                return
+            buffer, length = item
+            try:
+                if self._error is None:
+                    self._file.write(memoryview(buffer)[:length])
+            except OSError as error:
+                self._error = error
+            self._free.put(buffer)
+            self._full.task_done()
+
+    def run(self, machine, ticks):
+        """
+        Executes instructions on the machine, recording each one.
+
+        Args:
+            machine: The SICMachine being recorded.
+            ticks: An iterator yielding once per instruction to execute.
+        """
+        step = machine.cpu.step
+        registers = machine.registers
+        read_word = machine.memory.read_word
+        pack_into = RECORD.pack_into
+        record_size = RECORD.size
+        buffer_size = self._buffer_size
+        buffer = self._buffer
+        offset = self._offset
+        step_number = self.steps
+        try:
+            for _ in ticks:
+                pc = registers.PC
+                word = read_word(pc)
+                step()
+                step_number += 1
+                pack_into(buffer, offset, step_number, pc, word, registers.A, registers.X, registers.SW)
+                offset += record_size
+                if offset == buffer_size:
+                    self._full.put((buffer, offset))
+                    buffer = self._free.get()
+                    offset = 0
+        finally:
+            self._buffer = buffer
+            self._offset = offset
+            self.steps = step_number
+
+    def flush(self):
+        """
+        Hands the partly filled buffer to the writer and waits until every
+        record so far is written to the file. Recording can continue.
+
+        Raises:
+            OSError: If the writer thread failed to write a buffer.
+        """
+        if self._writer.is_alive():
+            if self._offset:
+                self._full.put((self._buffer, self._offset))
+                self._buffer = self._free.get()
+                self._offset = 0
+            self._full.join()
+            self._file.flush()
+        if self._error is not None:
+            raise self._error
+
+    def close(self):
+        """
+        Writes the remaining records, stops the writer thread and closes the file.
+
+        Raises:
+            OSError: If the writer thread failed to write a buffer.
+        """
+        if self._writer.is_alive():
+            if self._offset:
+                self._full.put((self._buffer, self._offset))
+                self._offset = 0
+            self._full.put(None)
+            self._writer.join()
+            self._file.close()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class TraceReader:
+    """
+    Reads a binary trace file through a read-only memory map.
+
+    Records can be iterated, indexed by position, or looked up by step number
+    without loading the file into memory.
+    """
+
+    def __init__(self, path):
+        """
+        Opens and validates a trace file.
+
+        Args:
+            path: The trace file written by TraceRecorder.
+
+        Raises:
+            ValueError: If the file is not a SIC trace file.
+        """
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size:
+            self._map.close()
+            raise ValueError("File is too short to be a SIC trace.")
+        magic, record_size, _ = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or record_size != RECORD.size:
+            self._map.close()
+            raise ValueError("Not a SIC trace file.")
+        self._count = (len(self._map) - HEADER.size) // RECORD.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> BinaryTraceRecord:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Trace record index out of range.")
+        return BinaryTraceRecord._make(RECORD.unpack_from(self._map, HEADER.size + index * RECORD.size))
+
+    def __iter__(self):
+        end = HEADER.size + self._count * RECORD.size
+        view = memoryview(self._map)[HEADER.size:end]
+        try:
+            for fields in RECORD.iter_unpack(view):
+                yield BinaryTraceRecord._make(fields)
+        finally:
+            view.release()
+
+    def find_step(self, step: int) -> BinaryTraceRecord:
+        """
+        Looks up the record of a given step number.
+
+        Args:
+            step: The step number to find.
+
+        Returns:
+            The matching record.
+
+        Raises:
+            KeyError: If the step is not in the trace.
+        """
+        # Steps are ascending; usually contiguous, so try direct indexing first.
+        if self._count:
+            index = step - self[0].step
+            if 0 <= index < self._count:
+                record = self[index]
+                if record.step == step:
+                    return record
+        index = bisect.bisect_left(self, step, key=lambda record: record.step)
+        if index < self._count:
+            record = self[index]
+            if record.step == step:
+                return record
+        raise KeyError(step)
+
+    def close(self):
+        """Unmaps the file."""
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
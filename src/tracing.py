@@ -0,0 +1,201 @@
+from collections import deque
+from typing import NamedTuple
+
+from .assembler.disassembler import disassemble_word
+
+# Registers compared before and after each traced instruction.
+TRACED_REGISTERS = ("A", "X", "L", "SW")
+
+
+class TraceRecord(NamedTuple):
+    """
+    One executed instruction.
+
+    changes holds (register, old_value, new_value) for every register in
+    TRACED_REGISTERS that the instruction modified.
+    """
+    step: int
+    pc: int
+    word: int
+    effective_address: int
+    changes: tuple
+
+    @property
+    def opcode(self) -> int:
+        return self.word >> 16
+
+
+def format_record(record: TraceRecord) -> str:
+    """
+    Formats a trace record as a single line of text.
+
+    Args:
+        record: The record to format.
+
+    Returns:
+        e.g. "     12 1003 ADD 1050        EA=1050 A:000010->000035"
+    """
+    changes = " ".join(f"{name}:{old:06X}->{new:06X}" for name, old, new in record.changes)
+    text = f"{record.step:>7} {record.pc:04X} {disassemble_word(record.word):<15} EA={record.effective_address:04X}"
+    return f"{text} {changes}" if changes else text
+
+
+class TraceSink:
+    """
+    Base class for trace destinations. Records arrive in batches.
+    """
+
+    def write(self, records: list[TraceRecord]):
+        """Receives a batch of trace records."""
+        pass
+
+    def close(self):
+        """Releases any resources held by the sink."""
+        pass
+
+
+class CallbackSink(TraceSink):
+    """
+    Passes each batch to a callable.
+    """
+
+    def __init__(self, callback):
+        """
+        Args:
+            callback: Called with each list of TraceRecords.
+        """
+        self.callback = callback
+
+    def write(self, records: list[TraceRecord]):
+        """Calls the callback with the batch."""
+        self.callback(records)
+
+
+class FileSink(TraceSink):
+    """
+    Writes records as formatted text lines to a file.
+    """
+
+    def __init__(self, file):
+        """
+        Args:
+            file: A path, or an open text file. Files opened from a path are
+                closed by close(); file objects passed in are left open.
+        """
+        if isinstance(file, (str, bytes)) or hasattr(file, "__fspath__"):
+            self._file = open(file, "w")
+            self._owns_file = True
+        else:
+            self._file = file
+            self._owns_file = False
+
+    def write(self, records: list[TraceRecord]):
+        """Writes one line per record in a single call."""
+        self._file.write("".join(format_record(record) + "\n" for record in records))
+
+    def close(self):
+        """Flushes the file, closing it if it was opened from a path."""
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class RingBufferSink(TraceSink):
+    """
+    Keeps only the most recent records in memory.
+    """
+
+    def __init__(self, capacity: int = 10000):
+        """
+        Args:
+            capacity: The number of records retained.
+        """
+        self._records = deque(maxlen=capacity)
+
+    def write(self, records: list[TraceRecord]):
+        """Appends the batch, discarding the oldest records beyond capacity."""
+        self._records.extend(records)
+
+    @property
+    def records(self) -> list[TraceRecord]:
+        """The retained records, oldest first."""
+        return list(self._records)
+
+
+class Tracer:
+    """
+    Records every executed instruction and streams the records to a sink.
+
+    Attach it to a SICMachine with machine.attach(tracer). The tracer runs its
+    own instrumented loop, so CPU.step and the untraced run loop stay free of
+    tracing checks. Records are buffered and handed to the sink in batches:
+    when a batch fills, on flush() or close(), and when the tracer is
+    detached from the machine. A run ending does not flush, so stepping one
+    instruction at a time still writes full batches.
+    """
+
+    def __init__(self, sink: TraceSink, batch_size: int = 1024):
+        """
+        Initializes the tracer.
+
+        Args:
+            sink: Where batches of TraceRecords are written.
+            batch_size: The number of records collected before a batch is written.
+        """
+        self.sink = sink
+        self.batch_size = batch_size
+        self.steps = 0
+        self._batch = []
+
+    def run(self, machine, ticks):
+        """
+        Executes instructions on the machine, recording each one.
+
+        Args:
+            machine: The SICMachine being traced.
+            ticks: An iterator yielding once per instruction to execute.
+        """
+        step = machine.cpu.step
+        registers = machine.registers
+        read_word = machine.memory.read_word
+        batch = self._batch
+        batch_size = self.batch_size
+        step_number = self.steps
+        try:
+            for _ in ticks:
+                pc = registers.PC
+                word = read_word(pc)
+                before = (registers.A, registers.X, registers.L, registers.SW)
+                step()
+                after = (registers.A, registers.X, registers.L, registers.SW)
+
+                effective_address = word & 0x7FFF
+                if word & 0x8000:
+                    effective_address += before[1]
+                changes = ()
+                if before != after:
+                    changes = tuple(
+                        (name, old, new)
+                        for name, old, new in zip(TRACED_REGISTERS, before, after)
+                        if old != new
+                    )
+
+                step_number += 1
+                batch.append(TraceRecord(step_number, pc, word, effective_address, changes))
+                if len(batch) >= batch_size:
+                    self.sink.write(batch)
+                    batch = self._batch = []
+        finally:
+            self.steps = step_number
+
+    def flush(self):
+        """Writes any buffered records to the sink."""
+        if self._batch:
+            self.sink.write(self._batch)
+            self._batch = []
+
+    def close(self):
+        """Flushes buffered records and closes the sink."""
+        self.flush()
+        self.sink.close()
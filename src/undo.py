@@ -0,0 +1,152 @@
+import struct
+
+# Opcodes that write memory, and how many bytes each writes.
+STORE_WIDTHS = {
+    0x0C: 3,  # STA
+    0x10: 3,  # STX
+    0x14: 3,  # STL
+    0x54: 1,  # STCH
+    0xE8: 3,  # STSW
+}
+
+# Previous A, X, L, PC, SW; address and count of overwritten bytes; the bytes.
+ENTRY = struct.Struct("<5IIB3s")
+NO_ADDRESS = 0xFFFFFFFF
+
+
+class UndoLog:
+    """
+    A bounded log that lets a SICMachine step backwards without re-execution.
+
+    Attach it with machine.attach(undo_log). For every executed instruction
+    it stores the previous register values and any memory bytes the
+    instruction overwrote as one packed 28-byte entry in a fixed-capacity
+    ring buffer, so memory use is capacity * 28 bytes however long the run.
+    Once full, the oldest entries are overwritten. Device I/O cannot be undone.
+    """
+
+    def __init__(self, capacity: int = 65536):
+        """
+        Allocates the ring buffer.
+
+        Args:
+            capacity: The number of instructions that can be undone.
+        """
+        self.capacity = capacity
+        self._entries = bytearray(capacity * ENTRY.size)
+        self._head = 0
+        self._count = 0
+        self.machine = None
+
+    @property
+    def memory_size(self) -> int:
+        """The number of bytes used by the ring buffer."""
+        return len(self._entries)
+
+    def __len__(self) -> int:
+        """The number of instructions that can currently be undone."""
+        return self._count
+
+    def clear(self):
+        """Discards all entries."""
+        self._head = 0
+        self._count = 0
+
+    def run(self, machine, ticks):
+        """
+        Executes instructions on the machine, logging how to undo each one.
+
+        Args:
+            machine: The SICMachine being run.
+            ticks: An iterator yielding once per instruction to execute.
+        """
+        self.machine = machine
+        step = machine.cpu.step
+        registers = machine.registers
+        memory = machine.memory.buffer
+        entries = self._entries
+        pack_into = ENTRY.pack_into
+        entry_size = ENTRY.size
+        capacity = self.capacity
+        store_widths = STORE_WIDTHS
+        head = self._head
+        count = self._count
+        try:
+            for _ in ticks:
+                pc = registers.PC
+                x = registers.X
+                # A word that does not fit is left for the CPU's fetch to report.
+                opcode = memory[pc] if pc + 2 < len(memory) else None
+                width = store_widths.get(opcode)
+                if width:
+                    word = (memory[pc + 1] << 8) | memory[pc + 2]
+                    address = word & 0x7FFF
+                    if word & 0x8000:
+                        address += x
+                    old = bytes(memory[address:address + width])
+                else:
+                    address = NO_ADDRESS
+                    old = b""
+                a, l, sw = registers.A, registers.L, registers.SW
+
+                step()
+
+                pack_into(entries, head * entry_size, a, x, l, pc, sw, address, len(old), old)
+                head += 1
+                if head == capacity:
+                    head = 0
+                if count < capacity:
+                    count += 1
+        finally:
+            self._head = head
+            self._count = count
+
+    def step_back(self, steps: int = 1) -> int:
+        """
+        Restores the state from before the most recent instructions.
+
+        Args:
+            steps: The number of instructions to undo.
+
+        Returns:
+            The number actually undone, limited by what the log holds.
+        """
+        undone = 0
+        while undone < steps and self._count:
+            self._undo_one()
+            undone += 1
+        return undone
+
+    def run_back_to(self, pc: int) -> bool:
+        """
+        Undoes instructions until the machine is about to execute address pc.
+
+        Args:
+            pc: The instruction address to rewind to.
+
+        Returns:
+            True if that state was reached; False if the log ran out first
+            (the machine is then at the oldest state still logged).
+        """
+        while self._count:
+            self._undo_one()
+            if self.machine.registers.PC == pc:
+                return True
+        return False
+
+    def _undo_one(self):
+        """Restores registers and memory from the newest entry and drops it."""
+        self._head = (self._head - 1) % self.capacity
+        self._count -= 1
+        a, x, l, pc, sw, address, length, old = ENTRY.unpack_from(self._entries, self._head * ENTRY.size)
+
+        machine = self.machine
+        registers = machine.registers
+        registers.A = a
+        registers.X = x
+        registers.L = l
+        registers.PC = pc
+        registers.SW = sw
+        if length:
+            machine.memory.buffer[address:address + length] = old[:length]
+        machine.instructions_executed -= 1
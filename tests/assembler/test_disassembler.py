@@ -0,0 +1,54 @@
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+from src.assembler.disassembler import disassemble, disassemble_word
+from src.assembler.pass_two import assemble
+from src.memory import Memory
+
+class TestDisassembler(unittest.TestCase):
+    """
+    Test suite for the instruction disassembler.
+    """
+
+    def test_disassemble_word(self):
+        """
+        Tests rendering of plain, indexed and operand-less instructions.
+        """
+        self.assertEqual(disassemble_word(0x001050), "LDA 1050")
+        self.assertEqual(disassemble_word(0x549039), "STCH 1039,X")
+        self.assertEqual(disassemble_word(0x4C0000), "RSUB")
+
+    def test_unknown_opcode_is_rendered_as_word(self):
+        """
+        Tests that data words are shown as WORD constants.
+        """
+        self.assertEqual(disassemble_word(0xFFFFFF), "WORD 16777215")
+
+    def test_word_constants_reassemble(self):
+        """
+        Tests that a disassembled data word assembles back to the same bytes.
+        """
+        for word in (0xFFFFFF, 0x010203, 0xFC0000):
+            source = ["DATA    START   0", f"        {disassemble_word(word)}", "        END"]
+            object_code, _ = assemble(source)
+            self.assertIn(f"T00000003{word:06X}", object_code)
+
+    def test_disassemble_memory(self):
+        """
+        Tests disassembling consecutive words from memory.
+        """
+        memory = Memory()
+        memory.write_word(0x1000, 0x001006)
+        memory.write_word(0x1003, 0x3C1000)
+        self.assertEqual(disassemble(memory, 0x1000, 2), [
+            (0x1000, 0x001006, "LDA 1006"),
+            (0x1003, 0x3C1000, "J 1000"),
+        ])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+from src.assembler.expressions import (
+    ExpressionEvaluator, UndefinedSymbolError, parse_expression
+)
+from src.assembler.symtab import SymbolTable
+
+class CountingSymbolTable(SymbolTable):
+    """A SymbolTable that counts symbol lookups."""
+
+    lookups = 0
+
+    def get_address(self, label):
+        self.lookups += 1
+        return super().get_address(label)
+
+class TestExpressions(unittest.TestCase):
+    """
+    Test suite for the assembler expression parser and evaluator.
+    """
+
+    def setUp(self):
+        self.symtab = SymbolTable()
+        self.symtab.add_symbol("TABLE", 0x1000)
+        self.symtab.add_symbol("N", 4, absolute=True)
+        self.evaluator = ExpressionEvaluator(self.symtab)
+
+    def test_constants(self):
+        """
+        Tests literal arithmetic with the usual precedence.
+        """
+        self.assertEqual(self.evaluator.evaluate("4096"), 4096)
+        self.assertEqual(self.evaluator.evaluate("2+3*4"), 14)
+        self.assertEqual(self.evaluator.evaluate("(2+3)*4"), 20)
+        self.assertEqual(self.evaluator.evaluate("-7/2"), -3)
+
+    def test_symbols(self):
+        """
+        Tests expressions that reference symbols, in any case.
+        """
+        self.assertEqual(self.evaluator.evaluate("TABLE+3*N"), 0x100C)
+        self.assertEqual(self.evaluator.evaluate("table-n"), 0x0FFC)
+
+    def test_location_counter(self):
+        """
+        Tests that '*' is the location counter in operand position and a
+        multiplication between operands.
+        """
+        self.assertEqual(self.evaluator.evaluate("*", 0x2000), 0x2000)
+        self.assertEqual(self.evaluator.evaluate("*-TABLE", 0x1010), 0x10)
+        self.assertEqual(self.evaluator.evaluate("N*N", 0x2000), 16)
+        with self.assertRaises(ValueError):
+            self.evaluator.evaluate("*")
+
+    def test_undefined_symbol(self):
+        """
+        Tests that a missing symbol raises UndefinedSymbolError naming it.
+        """
+        with self.assertRaises(UndefinedSymbolError) as context:
+            self.evaluator.evaluate("TABLE+LATER")
+        self.assertEqual(context.exception.symbol, "LATER")
+
+    def test_malformed_expressions(self):
+        """
+        Tests that syntax errors raise ValueError.
+        """
+        for text in ["", "1+", "(1", "1 2", "A$B", "4/0"]:
+            with self.assertRaises(ValueError, msg=text):
+                self.evaluator.evaluate(text)
+
+    def test_parsed_form_is_cached(self):
+        """
+        Tests that an operand string is parsed once.
+        """
+        self.assertIs(parse_expression("TABLE+3*N"), parse_expression("TABLE+3*N"))
+        self.assertEqual(parse_expression("TABLE+3*N").symbols, frozenset({"TABLE", "N"}))
+
+    def test_failed_evaluation_is_not_cached(self):
+        """
+        Tests that an expression is evaluated again once its symbols are defined.
+        """
+        with self.assertRaises(UndefinedSymbolError):
+            self.evaluator.evaluate("TABLE+LEN")
+        self.symtab.add_symbol("LEN", 6)
+        self.assertEqual(self.evaluator.evaluate("TABLE+LEN"), 0x1006)
+
+    def test_cached_values_survive_new_symbols(self):
+        """
+        Tests that defining further labels does not invalidate cached values.
+        """
+        symtab = CountingSymbolTable()
+        symtab.add_symbol("TABLE", 0x1000)
+        evaluator = ExpressionEvaluator(symtab)
+        self.assertEqual(evaluator.evaluate("TABLE+3"), 0x1003)
+        for index in range(10):
+            symtab.add_symbol(f"L{index}", 0x1010 + 3 * index)
+            self.assertEqual(evaluator.evaluate("TABLE+3"), 0x1003)
+        self.assertEqual(symtab.lookups, 1)
+
+    def test_relocation(self):
+        """
+        Tests counting the net relative terms of an expression.
+        """
+        self.symtab.add_symbol("LAST", 0x1009)
+        relocation = lambda text: parse_expression(text).relocation(self.symtab)
+        self.assertEqual(relocation("42"), 0)
+        self.assertEqual(relocation("N*3"), 0)
+        self.assertEqual(relocation("TABLE+3*N"), 1)
+        self.assertEqual(relocation("LAST-TABLE"), 0)
+        self.assertEqual(relocation("*-TABLE"), 0)
+        self.assertEqual(relocation("TABLE+LAST"), 2)
+        with self.assertRaises(ValueError):
+            relocation("TABLE*2")
+        with self.assertRaises(UndefinedSymbolError):
+            relocation("LATER")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+from src.assembler.macros import MacroProcessor, split_arguments
+from src.assembler.pass_one import PassOne
+
+class TestMacroProcessor(unittest.TestCase):
+    """
+    Test suite for the macro processor.
+    """
+
+    def setUp(self):
+        self.processor = MacroProcessor()
+
+    def expand(self, source):
+        return [line.split() for line in self.processor.expand(source)]
+
+    def test_positional_parameters(self):
+        """
+        Tests expansion with positional arguments.
+        """
+        source = [
+            "STORE   MACRO   &VAL,&DEST",
+            "        LDA     &VAL",
+            "        STA     &DEST",
+            "        MEND",
+            "        STORE   FIVE,ALPHA",
+        ]
+        self.assertEqual(self.expand(source), [["LDA", "FIVE"], ["STA", "ALPHA"]])
+
+    def test_keyword_parameters_and_defaults(self):
+        """
+        Tests keyword arguments in any order and default values.
+        """
+        source = [
+            "RDBUFF  MACRO   &INDEV=F1,&BUFADR=BUFFER",
+            "        TD      =X'&INDEV'",
+            "        STCH    &BUFADR,X",
+            "        MEND",
+            "        RDBUFF  &BUFADR=RECORD",
+            "        RDBUFF  BUFADR=DATA,&INDEV=05",
+        ]
+        self.assertEqual(self.expand(source), [
+            ["TD", "=X'F1'"], ["STCH", "RECORD,X"],
+            ["TD", "=X'05'"], ["STCH", "DATA,X"],
+        ])
+
+    def test_invocation_label_is_kept(self):
+        """
+        Tests that a label on the invocation labels the expansion.
+        """
+        source = [
+            "INC     MACRO   &V",
+            "        LDA     &V",
+            "        MEND",
+            "LOOP    INC     COUNT",
+        ]
+        self.assertEqual(self.expand(source), [["LOOP"], ["LDA", "COUNT"]])
+
+    def test_nested_definition(self):
+        """
+        Tests that an inner macro is defined when the outer one is expanded.
+        """
+        source = [
+            "MKLOAD  MACRO   &NAME,&SRC",
+            "&NAME   MACRO",
+            "        LDA     &SRC",
+            "        MEND",
+            "        MEND",
+            "        MKLOAD  LDFIVE,FIVE",
+            "        LDFIVE",
+        ]
+        self.assertEqual(self.expand(source), [["LDA", "FIVE"]])
+
+    def test_macro_invoking_macro(self):
+        """
+        Tests that invocations inside a body are expanded too.
+        """
+        source = [
+            "INNER   MACRO   &V",
+            "        ADD     &V",
+            "        MEND",
+            "OUTER   MACRO   &V",
+            "        INNER   &V",
+            "        INNER   ONE",
+            "        MEND",
+            "        OUTER   TWO",
+        ]
+        self.assertEqual(self.expand(source), [["ADD", "TWO"], ["ADD", "ONE"]])
+
+    def test_repeated_invocations_are_memoized(self):
+        """
+        Tests that identical invocations are substituted only once.
+        """
+        source = ["INC     MACRO   &V", "        ADD     &V", "        MEND"]
+        source += ["        INC     ONE"] * 100 + ["        INC     TWO"]
+        expanded = self.expand(source)
+        self.assertEqual(len(expanded), 101)
+        self.assertEqual(self.processor.misses, 2)
+        self.assertEqual(self.processor.hits, 99)
+
+    def test_redefinition_replaces_cached_expansion(self):
+        """
+        Tests that a redefined macro never reuses the old expansion.
+        """
+        source = [
+            "M       MACRO", "        LDA     A", "        MEND",
+            "        M",
+            "M       MACRO", "        LDA     B", "        MEND",
+            "        M",
+        ]
+        self.assertEqual(self.expand(source), [["LDA", "A"], ["LDA", "B"]])
+
+    def test_errors(self):
+        """
+        Tests error reporting for malformed definitions and invocations.
+        """
+        with self.assertRaisesRegex(ValueError, "missing MEND"):
+            self.expand(["M       MACRO", "        LDA     A"])
+        with self.assertRaisesRegex(ValueError, "Too many arguments"):
+            self.expand(["N       MACRO   &A", "        MEND", "        N       1,2"])
+        with self.assertRaisesRegex(ValueError, "nested too deeply"):
+            self.expand(["R       MACRO", "        R", "        MEND", "        R"])
+
+    def test_split_arguments_respects_quotes(self):
+        """
+        Tests that commas inside quoted literals do not split arguments.
+        """
+        self.assertEqual(split_arguments("F1,C'A,B',,X"), ["F1", "C'A,B'", "", "X"])
+        self.assertEqual(split_arguments(None), [])
+
+    def test_streams_into_pass_one(self):
+        """
+        Tests that PassOne assembles the expanded source.
+        """
+        source = [
+            "COPY    START   1000",
+            "COPYW   MACRO   &FROM,&TO",
+            "        LDA     &FROM",
+            "        STA     &TO",
+            "        MEND",
+            "FIRST   COPYW   ALPHA,BETA",
+            "        COPYW   BETA,ALPHA",
+            "ALPHA   WORD    1",
+            "BETA    RESW    1",
+            "        END     FIRST",
+        ]
+        symtab, result = PassOne(macro_processor=self.processor).run(source)
+        self.assertEqual(symtab.get_address("FIRST"), 0x1000)
+        self.assertEqual(symtab.get_address("ALPHA"), 0x100C)
+        self.assertEqual(result.program_length, 18)
+
+if __name__ == '__main__':
+    unittest.main()
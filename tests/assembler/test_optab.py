@@ -6,7 +6,7 @@ import os
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 sys.path.insert(0, project_root)
 
-from src.assembler.optab import OpcodeTable
+from src.assembler.optab import OpcodeTable, OPTAB, MNEMONICS, OPERAND_MEMORY, OPERAND_NONE
 
 class TestOpcodeTable(unittest.TestCase):
     """
@@ -45,5 +45,41 @@ class TestOpcodeTable(unittest.TestCase):
         self.assertFalse(self.optab.is_mnemonic("SUBTRACT"))
         self.assertFalse(self.optab.is_mnemonic("JUMP"))
 
+    def test_lookup_is_case_insensitive(self):
+        """
+        Tests that lower-case mnemonics are still recognized.
+        """
+        self.assertEqual(self.optab.get_opcode("lda"), 0x00)
+        self.assertTrue(self.optab.is_mnemonic("Comp"))
+
+    def test_opcode_metadata(self):
+        """
+        Tests that each entry records format, operand kind and length.
+        """
+        info = self.optab.get_info("STCH")
+        self.assertEqual(info.opcode, 0x54)
+        self.assertEqual(info.format, 3)
+        self.assertEqual(info.operand, OPERAND_MEMORY)
+        self.assertEqual(info.length, 3)
+        self.assertEqual(self.optab.get_info("RSUB").operand, OPERAND_NONE)
+
+    def test_reverse_lookup(self):
+        """
+        Tests the opcode -> mnemonic reverse table.
+        """
+        self.assertEqual(len(MNEMONICS), 256)
+        self.assertEqual(self.optab.get_mnemonic(0x4C), "RSUB")
+        self.assertIsNone(self.optab.get_mnemonic(0xFF))
+        for mnemonic, info in OPTAB.items():
+            self.assertEqual(MNEMONICS[info.opcode], mnemonic)
+
+    def test_table_is_shared_and_read_only(self):
+        """
+        Tests that all instances share one immutable table.
+        """
+        self.assertIs(OpcodeTable()._opcodes, OpcodeTable()._opcodes)
+        with self.assertRaises(TypeError):
+            OPTAB["NEW"] = None
+
 if __name__ == '__main__':
     unittest.main()
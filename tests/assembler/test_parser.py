@@ -27,5 +27,61 @@ class TestLineParser(unittest.TestCase):
         self.assertEqual(mnemonic, "STA")
         self.assertEqual(operand, "BUFFER,X")
 
+    def test_parse_line_without_label(self):
+        """
+        Tests that a line starting with whitespace has no label.
+        """
+        self.assertEqual(self.parser.parse("        RSUB"), (None, "RSUB", None))
+        self.assertEqual(self.parser.parse("\tLDA\tALPHA\n"), (None, "LDA", "ALPHA"))
+
+    def test_parse_label_only_line(self):
+        """
+        Tests that a line holding only a label is parsed.
+        """
+        self.assertEqual(self.parser.parse("ALPHA"), ("ALPHA", None, None))
+
+    def test_parse_empty_and_comment_lines(self):
+        """
+        Tests that empty lines and comment lines yield no fields.
+        """
+        for line in ["", "   ", "\n", ". COMMENT", "    . INDENTED COMMENT"]:
+            self.assertEqual(self.parser.parse(line), (None, None, None))
+
+    def test_trailing_comment_is_ignored(self):
+        """
+        Tests that text after the operand field is ignored.
+        """
+        line = "LOOP   STA   BUFFER,X   STORE THE NEXT WORD"
+        self.assertEqual(self.parser.parse(line), ("LOOP", "STA", "BUFFER,X"))
+
+    def test_quoted_operand_with_spaces(self):
+        """
+        Tests that a quoted literal keeps its embedded spaces.
+        """
+        line = "EOF     BYTE    C'EOF  '   END OF FILE"
+        self.assertEqual(self.parser.parse(line), ("EOF", "BYTE", "C'EOF  '"))
+
+    def test_unterminated_quote_falls_back_to_token(self):
+        """
+        Tests that an unterminated quote is returned as a plain token.
+        """
+        line = "EOF     BYTE    C'EOF  COMMENT"
+        self.assertEqual(self.parser.parse(line), ("EOF", "BYTE", "C'EOF"))
+
+    def test_fixed_column_layout(self):
+        """
+        Tests parsing with the fixed-column Beck source layout.
+        """
+        parser = LineParser(fixed_columns=True)
+        self.assertEqual(
+            parser.parse("EOF      BYTE     C'EOF  '          CONSTANT"),
+            ("EOF", "BYTE", "C'EOF  '"),
+        )
+        self.assertEqual(
+            parser.parse("         LDA      BUFFER,X"),
+            (None, "LDA", "BUFFER,X"),
+        )
+        self.assertEqual(parser.parse(".        COMMENT"), (None, None, None))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
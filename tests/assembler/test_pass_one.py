@@ -113,6 +113,58 @@ class TestPassOne(unittest.TestCase):
         self.assertEqual(symtab.get_address("FIRST"), 0x2000)
         self.assertEqual(symtab.get_address("BETA"), 0x2003)
 
+    def test_accepts_line_generator(self):
+        """
+        Tests that source lines can be streamed from a generator.
+        """
+        source = (line for line in [
+            "COPY    START   1000",
+            "",
+            "FIRST   LDA     FIVE",
+            "FIVE    WORD    5",
+            "        END     FIRST",
+        ])
+        symtab, result = self.pass_one.run(source)
+        self.assertEqual(result.program_length, 6)
+        self.assertEqual(symtab.get_address("FIVE"), 0x1003)
+
+    def test_quoted_byte_operand_with_spaces(self):
+        """
+        Tests that a character constant containing spaces is sized correctly.
+        """
+        source = [
+            "COPY    START   1000",
+            "EOF     BYTE    C'EOF  '",
+            "NEXT    RESB    1",
+            "        END     COPY",
+        ]
+        symtab, result = self.pass_one.run(source)
+        self.assertEqual(symtab.get_address("NEXT"), 0x1005)
+        self.assertEqual(result.program_length, 6)
+
+
+    def test_equ_symbols_are_absolute_or_relative(self):
+        """
+        Tests that EQU constants are absolute and EQU addresses relative.
+        """
+        source = [
+            "COPY    START   1000",
+            "FIRST   LDA     LAST",
+            "SIZE    EQU     LAST-FIRST",
+            "N       EQU     10",
+            "HERE    EQU     *",
+            "ALIAS   EQU     FIRST+N",
+            "LAST    WORD    0",
+            "        END     FIRST",
+        ]
+        symtab, _ = self.pass_one.run(source)
+        self.assertEqual(symtab.get_address("SIZE"), 3)
+        self.assertEqual([name for name in ("SIZE", "N", "HERE", "ALIAS") if symtab.is_absolute(name)],
+                         ["SIZE", "N"])
+        self.assertEqual(symtab.symbol_at(0x100A), "ALIAS")
+        with self.assertRaises(ValueError):
+            self.pass_one.run(["COPY    START   1000", "A       WORD    0",
+                               "BAD     EQU     A+A", "        END     COPY"])
 
 if __name__ == '__main__':
     unittest.main()
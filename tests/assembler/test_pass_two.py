@@ -0,0 +1,132 @@
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+from src.assembler.pass_two import assemble
+from src.assembler.macros import MacroProcessor
+from src.machine import SICMachine
+
+SOURCE = [
+    "COPY    START   1000",
+    "FIRST   LDA     FIVE",
+    "        STA     ALPHA,X",
+    "        RSUB",
+    "FIVE    WORD    5",
+    "NEG     WORD    -1",
+    "PTR     WORD    ALPHA",
+    "EOF     BYTE    C'EOF  '",
+    "ALPHA   RESW    1",
+    "BUFFER  RESB    4",
+    "        BYTE    X'F1'",
+    "        END     FIRST",
+]
+
+class TestPassTwo(unittest.TestCase):
+    """
+    Test suite for Pass Two of the SIC Assembler.
+    """
+
+    def test_object_program_records(self):
+        """
+        Tests the header, text, modification and end records.
+        """
+        object_code, symtab = assemble(SOURCE)
+        self.assertEqual(object_code.splitlines(), [
+            "HCOPY  00100000001F",
+            "T001000170010090C90174C0000000005FFFFFF001017454F462020",
+            "T00101E01F1",
+            "M00100006+COPY",
+            "M00100306+COPY",
+            "M00100F06+COPY",
+            "E001000",
+        ])
+        self.assertEqual(symtab.get_address("ALPHA"), 0x1017)
+
+    def test_long_code_is_split_into_text_records(self):
+        """
+        Tests that a Text record never holds more than 30 bytes.
+        """
+        source = ["LONG    START   0"] + ["        WORD    7"] * 12 + ["        END     LONG"]
+        object_code, _ = assemble(source)
+        text = [line for line in object_code.splitlines() if line.startswith("T")]
+        self.assertEqual([line[7:9] for line in text], ["1E", "06"])
+        self.assertEqual(text[1][1:7], "00001E")
+
+    def test_relocated_program_runs(self):
+        """
+        Tests that a program loaded at another address has its operands relocated.
+        """
+        source = [
+            "PROG    START   1000",
+            "        LDA     FIVE",
+            "        ADD     FIVE",
+            "        STA     SUM",
+            "FIVE    WORD    5",
+            "SUM     RESW    1",
+            "        END     PROG",
+        ]
+        object_code, _ = assemble(source)
+        machine = SICMachine()
+        machine.load_object_code(object_code, 0x3000)
+        self.assertEqual(machine.registers.PC, 0x3000)
+        machine.run(steps=3)
+        self.assertEqual(machine.memory.read_word(0x300C), 10)
+
+    def test_absolute_operands_are_not_relocated(self):
+        """
+        Tests that differences and EQU constants keep their values when the
+        program is loaded at another address, while addresses move.
+        """
+        source = [
+            "PROG    START   1000",
+            "FIRST   LDA     N",
+            "N       EQU     10",
+            "SIZE    WORD    LAST-FIRST",
+            "COUNT   WORD    N",
+            "PTR     WORD    FIRST+N",
+            "LAST    WORD    *",
+            "        END     FIRST",
+        ]
+        object_code, _ = assemble(source)
+        self.assertEqual([record for record in object_code.splitlines() if record[0] == "M"],
+                         ["M00100906+PROG", "M00100C06+PROG"])
+        machine = SICMachine()
+        machine.load_object_code(object_code, 0x2000)
+        self.assertEqual(machine.memory.read_word(0x2000), 0x00000A)
+        self.assertEqual(machine.memory.read_word(0x2003), 0x0C)
+        self.assertEqual(machine.memory.read_word(0x2006), 10)
+        self.assertEqual(machine.memory.read_word(0x2009), 0x200A)
+        self.assertEqual(machine.memory.read_word(0x200C), 0x200C)
+
+    def test_macros_are_expanded(self):
+        """
+        Tests assembling a source that uses a macro.
+        """
+        source = [
+            "PROG    START   0",
+            "INC     MACRO   &V",
+            "        LDA     &V",
+            "        ADD     ONE",
+            "        STA     &V",
+            "        MEND",
+            "        INC     COUNT",
+            "ONE     WORD    1",
+            "COUNT   WORD    0",
+            "        END     PROG",
+        ]
+        object_code, _ = assemble(source, macro_processor=MacroProcessor())
+        self.assertIn("T0000000F00000C1800090C000C000001000000", object_code)
+
+    def test_undefined_symbol_raises_error(self):
+        """
+        Tests that an operand naming an undefined symbol is rejected.
+        """
+        with self.assertRaisesRegex(ValueError, "Invalid operand 'MISSING'"):
+            assemble(["        LDA     MISSING", "        END"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -46,5 +46,90 @@ class TestSymbolTable(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.symtab.add_symbol("DUPE", 0x4000)
 
+    def test_lookup_is_case_insensitive(self):
+        """
+        Tests that symbols are found regardless of the spelling used.
+        """
+        self.symtab.add_symbol("Loop", 0x1000)
+        self.assertTrue(self.symtab.has_symbol("LOOP"))
+        self.assertEqual(self.symtab.get_address("loop"), 0x1000)
+        with self.assertRaises(ValueError):
+            self.symtab.add_symbol("LOOP", 0x2000)
+
+    def test_symbol_at_address(self):
+        """
+        Tests that the symbol covering an address is found.
+        """
+        self.symtab.add_symbol("FIRST", 0x1000)
+        self.symtab.add_symbol("LOOP", 0x1006)
+        self.symtab.add_symbol("DATA", 0x1020)
+
+        self.assertIsNone(self.symtab.symbol_at(0x0FFF))
+        self.assertEqual(self.symtab.symbol_at(0x1000), "FIRST")
+        self.assertEqual(self.symtab.symbol_at(0x1005), "FIRST")
+        self.assertEqual(self.symtab.symbol_at(0x1006), "LOOP")
+        self.assertEqual(self.symtab.symbol_at(0x7FFF), "DATA")
+
+    def test_symbol_at_prefers_last_defined_at_same_address(self):
+        """
+        Tests that of several symbols at one address the last defined is reported.
+        """
+        self.symtab.add_symbol("COPY", 0x1000)
+        self.symtab.add_symbol("FIRST", 0x1000)
+        self.assertEqual(self.symtab.symbol_at(0x1001), "FIRST")
+
+    def test_symbols_in_range(self):
+        """
+        Tests listing symbols within a half-open address range.
+        """
+        self.symtab.add_symbol("C", 0x1020)
+        self.symtab.add_symbol("A", 0x1000)
+        self.symtab.add_symbol("B", 0x1010)
+        self.assertEqual(self.symtab.symbols_in_range(0x1000, 0x1020), [("A", 0x1000), ("B", 0x1010)])
+        self.assertEqual(self.symtab.symbols_in_range(0x1011, 0x1100), [("C", 0x1020)])
+        self.assertEqual(self.symtab.symbols_in_range(0x2000, 0x3000), [])
+
+    def test_add_symbols_in_bulk(self):
+        """
+        Tests that bulk insertion keeps the address index sorted.
+        """
+        self.symtab.add_symbol("MID", 0x2000)
+        self.symtab.add_symbols([("HIGH", 0x3000), ("LOW", 0x1000)])
+        self.assertEqual(self.symtab.items(), [("LOW", 0x1000), ("MID", 0x2000), ("HIGH", 0x3000)])
+        self.assertEqual(len(self.symtab), 3)
+
+    def test_add_symbols_rejects_duplicates_atomically(self):
+        """
+        Tests that a duplicate in a bulk insert adds nothing.
+        """
+        self.symtab.add_symbol("A", 0x1000)
+        with self.assertRaises(ValueError):
+            self.symtab.add_symbols([("B", 0x1003), ("a", 0x1006)])
+        self.assertFalse(self.symtab.has_symbol("B"))
+
+    def test_describe_address(self):
+        """
+        Tests symbolic formatting of addresses.
+        """
+        self.symtab.add_symbol("LOOP", 0x1000)
+        self.assertEqual(self.symtab.describe_address(0x1000), "LOOP")
+        self.assertEqual(self.symtab.describe_address(0x100C), "LOOP+C")
+        self.assertEqual(self.symtab.describe_address(0x0010), "0010")
+
+    def test_absolute_symbols_are_not_in_address_index(self):
+        """
+        Tests that constants are never reported as the symbol at an address.
+        """
+        self.symtab.add_symbol("LOOP", 0x1000)
+        self.symtab.add_symbol("SIZE", 0x1003, absolute=True)
+        self.assertTrue(self.symtab.is_absolute("size"))
+        self.assertFalse(self.symtab.is_absolute("LOOP"))
+        self.assertEqual(self.symtab.get_address("SIZE"), 0x1003)
+        self.assertEqual(self.symtab.symbol_at(0x1003), "LOOP")
+        self.assertEqual(self.symtab.describe_address(0x1003), "LOOP+3")
+        self.assertEqual(self.symtab.items(), [("LOOP", 0x1000)])
+        self.assertEqual(self.symtab.constants(), [("SIZE", 0x1003)])
+        self.assertEqual(len(self.symtab), 2)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from benchmarks.workloads import arithmetic_loop, table_copy, device_echo, bubble_sort
+from benchmarks.bench_emulator import Result, measure, compare, save_baseline, load_baseline
+from benchmarks.generate import generate_source, generate_object_program
+from src.assembler.pass_one import PassOne
+from src.machine import SICMachine
+
+class TestBenchmarkWorkloads(unittest.TestCase):
+    """
+    Test suite checking that the benchmark workloads compute the right results.
+    """
+
+    def check(self, workload):
+        machine = workload.build()
+        workload.execute(machine, chunk=64)
+        self.assertEqual(machine.registers.PC, workload.halt)
+        self.assertTrue(workload.verify(machine), workload.name)
+        return machine
+
+    def test_arithmetic_loop(self):
+        self.check(arithmetic_loop(50))
+
+    def test_table_copy(self):
+        self.check(table_copy(length=40, passes=2))
+
+    def test_device_echo(self):
+        self.check(device_echo(30))
+
+    def test_bubble_sort(self):
+        self.check(bubble_sort(25))
+
+    def test_wrong_result_is_detected(self):
+        """
+        Tests that verification fails if the program did not run to completion.
+        """
+        workload = bubble_sort(25)
+        self.assertFalse(workload.verify(workload.build()))
+
+class TestBenchmarkRunner(unittest.TestCase):
+    """
+    Test suite for measurement and baseline comparison.
+    """
+
+    def test_measure(self):
+        result = measure(arithmetic_loop(20), repeat=3, warmup=1)
+        self.assertEqual(result.name, "arithmetic_loop")
+        self.assertGreater(result.median_ips, 0)
+
+    def test_baseline_round_trip_and_threshold(self):
+        results = [Result("a", 100, 1000.0, 5.0), Result("b", 100, 850.0, 5.0)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            save_baseline(path, [Result("a", 100, 1000.0, 5.0), Result("b", 100, 1000.0, 5.0)])
+            baseline = load_baseline(path)
+        self.assertEqual(baseline, {"a": 1000.0, "b": 1000.0})
+        self.assertEqual(compare(results, baseline, threshold=0.10), ["b"])
+        self.assertEqual(compare(results, baseline, threshold=0.20), [])
+
+class TestGenerators(unittest.TestCase):
+    """
+    Test suite for the synthetic source and object program generators.
+    """
+
+    def test_generated_source_assembles(self):
+        source = generate_source(500, symbol_count=40, seed=3)
+        self.assertEqual(len(source), 500)
+        self.assertEqual(source, generate_source(500, symbol_count=40, seed=3))
+        symtab, result = PassOne().run(source)
+        self.assertEqual(len(symtab), 41)  # 40 labels plus the program name
+        self.assertGreater(result.program_length, 0)
+
+    def test_generated_object_program_loads(self):
+        object_code = generate_object_program(2000, record_bytes=20, modification_count=50)
+        records = object_code.splitlines()
+        self.assertEqual(sum(record[0] == "T" for record in records), 2000)
+        self.assertEqual(sum(record[0] == "M" for record in records), 50)
+        machine = SICMachine()
+        machine.load_object_code(object_code, 0x2000)
+        self.assertEqual(machine.registers.PC, 0x2000)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.machine import SICMachine
+from src.callgraph import CallGraphProfiler
+from src.assembler.symtab import SymbolTable
+
+# MAIN calls OUTER, which saves L, calls INNER and returns.
+NESTED_PROGRAM = [
+    0x481006, # 1000: MAIN  JSUB  OUTER
+    0x3C1003, # 1003: HALT  J     HALT
+    0x141015, # 1006: OUTER STL   SAVE
+    0x481012, # 1009:       JSUB  INNER
+    0x081015, # 100C:       LDL   SAVE
+    0x4C0000, # 100F:       RSUB
+    0x4C0000, # 1012: INNER RSUB
+]
+
+class TestCallGraphProfiler(unittest.TestCase):
+    """
+    Test suite for the JSUB/RSUB call-graph profiler.
+    """
+
+    def setUp(self):
+        self.machine = SICMachine()
+        self.machine.load_program(NESTED_PROGRAM, 0x1000)
+        self.machine.registers.PC = 0x1000
+        self.profiler = CallGraphProfiler()
+        self.machine.attach(self.profiler)
+        self.symtab = SymbolTable()
+        self.symtab.add_symbols([
+            ("MAIN", 0x1000), ("HALT", 0x1003), ("OUTER", 0x1006), ("INNER", 0x1012), ("SAVE", 0x1015),
+        ])
+
+    def test_counts_per_stack(self):
+        """
+        Tests that instructions are charged to the stack they ran on.
+        """
+        self.machine.run(steps=8)
+        self.assertEqual(self.profiler.stack_counts, {
+            (0x1000,): 3,
+            (0x1000, 0x1006): 4,
+            (0x1000, 0x1006, 0x1012): 1,
+        })
+        self.assertEqual(self.profiler.total, 8)
+
+    def test_inclusive_and_exclusive_costs(self):
+        """
+        Tests per-routine inclusive and exclusive counts.
+        """
+        self.machine.run(steps=8)
+        costs = self.profiler.routine_costs()
+        self.assertEqual(costs[0x1000], (8, 3))
+        self.assertEqual(costs[0x1006], (5, 4))
+        self.assertEqual(costs[0x1012], (1, 1))
+
+    def test_stack_survives_between_runs(self):
+        """
+        Tests that stepping one instruction at a time gives the same profile.
+        """
+        for _ in range(8):
+            self.machine.step()
+        self.assertEqual(self.profiler.routine_costs()[0x1006], (5, 4))
+
+    def test_folded_stacks(self):
+        """
+        Tests the flame graph input format.
+        """
+        self.machine.run(steps=8)
+        self.assertEqual(
+            self.profiler.folded_stacks(self.symtab),
+            "MAIN 3\nMAIN;OUTER 4\nMAIN;OUTER;INNER 1\n",
+        )
+
+    def test_callgrind_output(self):
+        """
+        Tests the callgrind function and call records.
+        """
+        self.machine.run(steps=8)
+        output = self.profiler.callgrind(self.symtab)
+        self.assertIn("events: Instructions", output)
+        self.assertIn("fn=OUTER\n0 4\ncfn=INNER\ncalls=1 0\n0 1\n", output)
+        self.assertIn("fn=MAIN\n0 3\ncfn=OUTER\ncalls=1 0\n0 5\n", output)
+
+    def test_report(self):
+        """
+        Tests that the report lists routines by inclusive cost.
+        """
+        self.machine.run(steps=8)
+        lines = self.profiler.report(self.symtab).splitlines()
+        self.assertEqual(lines[0], "Instructions executed: 8")
+        self.assertTrue(lines[3].startswith("MAIN"))
+        self.assertTrue(lines[4].startswith("OUTER"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import sys
+import os
+import io
+import tempfile
+from contextlib import redirect_stderr
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.cli import main, EXIT_LIMIT
+
+ECHO_SOURCE = """\
+ECHO    START   1000
+LOOP    TD      241
+        JEQ     DONE
+        RD      241
+        WD      5
+        J       LOOP
+DONE    J       DONE
+        END     ECHO
+"""
+
+class TestCLI(unittest.TestCase):
+    """
+    Test suite for the python -m src command-line interface.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name, content=None):
+        path = os.path.join(self.directory.name, name)
+        if content is not None:
+            with open(path, "w") as file:
+                file.write(content)
+        return path
+
+    def read(self, path):
+        with open(path, "rb") as file:
+            return file.read()
+
+    def test_run_source_echoes_input(self):
+        """
+        Tests assembling and running a source program with file I/O.
+        """
+        source = self.path("echo.asm", ECHO_SOURCE)
+        input_path = self.path("in.txt", "hello\n")
+        output_path = self.path("out.txt")
+        status = main(["run", source, "--input", input_path, "--output", output_path])
+        self.assertEqual(status, 0)
+        self.assertEqual(self.read(output_path), b"hello\n")
+
+    def test_assemble_then_run_relocated_object(self):
+        """
+        Tests the assemble subcommand and running its output at another address.
+        """
+        object_path = self.path("echo.obj")
+        self.assertEqual(main(["assemble", self.path("echo.asm", ECHO_SOURCE), "-o", object_path]), 0)
+        self.assertTrue(self.read(object_path).startswith(b"HECHO  001000"))
+
+        output_path = self.path("out.txt")
+        status = main(["run", object_path, "--load-address", "3000",
+                       "--input", self.path("in.txt", "abc"), "--output", output_path])
+        self.assertEqual(status, 0)
+        self.assertEqual(self.read(output_path), b"abc")
+
+    def test_max_steps_is_reported(self):
+        """
+        Tests that a program still running at --max-steps is stopped with a note.
+        """
+        source = self.path("spin.asm", "SPIN    START   0\nLOOP    LDA     LOOP\n        J       LOOP\n        END     SPIN\n")
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            status = main(["run", source, "--max-steps", "100", "--output", self.path("out.txt"), "--stats"])
+        self.assertEqual(status, EXIT_LIMIT)
+        self.assertIn("stopped after --max-steps=100", stderr.getvalue())
+        self.assertIn("100 instructions", stderr.getvalue())
+
+    def test_timeout_is_reported(self):
+        """
+        Tests that an infinite loop is stopped by --timeout.
+        """
+        source = self.path("spin.asm", "SPIN    START   0\nLOOP    LDA     LOOP\n        J       LOOP\n        END     SPIN\n")
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            status = main(["run", source, "--max-steps", "1000000000", "--timeout", "0.05",
+                           "--output", self.path("out.txt")])
+        self.assertEqual(status, EXIT_LIMIT)
+        self.assertIn("stopped after --timeout=0.05", stderr.getvalue())
+
+    def test_runtime_error_sets_status(self):
+        """
+        Tests that an emulation error is reported with a non-zero status.
+        """
+        object_path = self.path("bad.obj", "HBAD   000000000003\nT00000003FF0000\nE000000\n")
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            status = main(["run", object_path, "--output", self.path("out.txt")])
+        self.assertEqual(status, 1)
+        self.assertIn("not implemented", stderr.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
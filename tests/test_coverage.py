@@ -0,0 +1,92 @@
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.machine import SICMachine
+from src.coverage import CoverageMap, merge_bitmaps
+from src.assembler.symtab import SymbolTable
+
+# If A equals ZERO, spin at DONE; otherwise spin at OTHER.
+BRANCH_PROGRAM = [
+    0x281012, # 1000: START COMP  ZERO
+    0x30100C, # 1003:       JEQ   DONE
+    0x3C1009, # 1006:       J     OTHER
+    0x3C1009, # 1009: OTHER J     OTHER
+    0x3C100C, # 100C: DONE  J     DONE
+    0x3C100F, # 100F: DEAD  J     DEAD
+]
+
+class TestCoverage(unittest.TestCase):
+    """
+    Test suite for executed-address coverage.
+    """
+
+    def run_with(self, a_value):
+        machine = SICMachine()
+        machine.load_program(BRANCH_PROGRAM, 0x1000)
+        machine.registers.A = a_value
+        machine.registers.PC = 0x1000
+        coverage = CoverageMap()
+        machine.attach(coverage)
+        machine.run(steps=5)
+        return coverage
+
+    def symtab(self):
+        symtab = SymbolTable()
+        symtab.add_symbols([("START", 0x1000), ("OTHER", 0x1009), ("DONE", 0x100C), ("DEAD", 0x100F)])
+        return symtab
+
+    def test_marks_executed_addresses(self):
+        """
+        Tests that exactly the executed instructions are marked.
+        """
+        coverage = self.run_with(0)
+        self.assertTrue(coverage.is_covered(0x1000))
+        self.assertTrue(coverage.is_covered(0x100C))
+        self.assertFalse(coverage.is_covered(0x1006))
+        self.assertEqual(coverage.covered_count(), 3)
+
+    def test_merge_combines_runs(self):
+        """
+        Tests that merging ORs the maps of different runs.
+        """
+        merged = self.run_with(0).merge(self.run_with(1))
+        self.assertEqual(merged.covered_count(), 5)
+        self.assertFalse(merged.is_covered(0x100F))
+
+    def test_merge_bitmaps(self):
+        """
+        Tests the bitmap-level merge helper.
+        """
+        self.assertEqual(merge_bitmaps([b"\x01\x00\x00", b"\x00\x00\x01"]), bytearray(b"\x01\x00\x01"))
+        self.assertEqual(len(merge_bitmaps([])), 32768)
+
+    def test_ranges_and_report(self):
+        """
+        Tests covered/uncovered ranges and their symbolic report.
+        """
+        coverage = self.run_with(0)
+        self.assertEqual(coverage.ranges(0x1000, 0x1012), [
+            (True, 0x1000, 0x1006),
+            (False, 0x1006, 0x100C),
+            (True, 0x100C, 0x100F),
+            (False, 0x100F, 0x1012),
+        ])
+        report = coverage.report(0x1000, 0x1012, self.symtab())
+        self.assertIn("Covered 3/6 instructions (50.0%)", report)
+        self.assertIn("UNCOVERED 1006-100B  START+6 .. OTHER", report)
+        self.assertIn("UNCOVERED 100F-1011  DEAD", report)
+
+    def test_round_trip_through_bytes(self):
+        """
+        Tests that a saved bitmap reloads identically.
+        """
+        coverage = self.run_with(1)
+        self.assertEqual(CoverageMap(coverage.to_bytes()).covered_count(), coverage.covered_count())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,7 @@ import os
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
-from src.cpu import CPU
+from src.cpu import CPU, DECODE_CACHE_SIZE
 from src.memory import Memory
 from src.registers import Registers
 from src.instruction import Instruction
@@ -218,5 +218,203 @@ class TestCPU(unittest.TestCase):
         self.assertEqual(self.registers.PC, start_pc + 3, "JEQ should not jump when SW is not '='.")
 
 
+    def test_step_executes_jsub_and_rsub_instructions(self):
+        """
+        Tests that JSUB saves the return address in L and RSUB returns to it.
+        Opcodes are 0x48 (JSUB) and 0x4C (RSUB).
+        """
+        self.registers.PC = 0x1000
+        self.memory.write_word(0x1000, 0x482000) # JSUB 0x2000
+        self.memory.write_word(0x2000, 0x4C0000) # RSUB
+        self.cpu.step()
+        self.assertEqual(self.registers.PC, 0x2000)
+        self.assertEqual(self.registers.L, 0x1003, "JSUB should save the return address in L.")
+        self.cpu.step()
+        self.assertEqual(self.registers.PC, 0x1003, "RSUB should return to the address in L.")
+
+    def test_step_executes_ldl_and_stl_instructions(self):
+        """
+        Tests that STL and LDL move the L register to and from memory.
+        Opcodes are 0x14 (STL) and 0x08 (LDL).
+        """
+        self.registers.L = 0x123456
+        self.registers.PC = 0x1000
+        self.memory.write_word(0x1000, 0x143000) # STL 0x3000
+        self.memory.write_word(0x1003, 0x083003) # LDL 0x3003
+        self.memory.write_word(0x3003, 0x000042)
+        self.cpu.step()
+        self.assertEqual(self.memory.read_word(0x3000), 0x123456)
+        self.cpu.step()
+        self.assertEqual(self.registers.L, 0x42)
+
+    def test_step_executes_index_register_instructions(self):
+        """
+        Tests LDX, TIX and STX.
+        Opcodes are 0x04 (LDX), 0x2C (TIX) and 0x10 (STX).
+        """
+        self.registers.PC = 0x1000
+        self.memory.write_word(0x1000, 0x042000) # LDX 0x2000
+        self.memory.write_word(0x1003, 0x2C2003) # TIX 0x2003
+        self.memory.write_word(0x1006, 0x102006) # STX 0x2006
+        self.memory.write_word(0x2000, 4)
+        self.memory.write_word(0x2003, 5)
+        self.cpu.step()
+        self.assertEqual(self.registers.X, 4)
+        self.cpu.step()
+        self.assertEqual(self.registers.X, 5)
+        self.assertEqual(self.registers.SW, ord('='), "TIX should compare the incremented X.")
+        self.cpu.step()
+        self.assertEqual(self.memory.read_word(0x2006), 5)
+
+    def test_step_executes_character_instructions(self):
+        """
+        Tests that LDCH and STCH move only the rightmost byte of A.
+        Opcodes are 0x50 (LDCH) and 0x54 (STCH).
+        """
+        self.registers.A = 0x123456
+        self.registers.X = 1
+        self.registers.PC = 0x1000
+        self.memory.write_word(0x1000, 0x50A000) # LDCH 0x2000,X
+        self.memory.write_word(0x1003, 0x542005) # STCH 0x2005
+        self.memory.write_word(0x2000, 0x00AB00)
+        self.cpu.step()
+        self.assertEqual(self.registers.A, 0x1234AB)
+        self.cpu.step()
+        self.assertEqual(self.memory.read_word(0x2003), 0x0000AB)
+
+    def test_step_executes_arithmetic_and_logic_instructions(self):
+        """
+        Tests MUL, DIV, AND and OR against a word in memory.
+        """
+        self.memory.write_word(0x2000, 6)
+        for word, start, expected in [
+            (0x202000, 7, 42),          # MUL
+            (0x242000, 45, 7),          # DIV
+            (0x402000, 0xFF, 6),        # AND
+            (0x442000, 0x10, 0x16),     # OR
+        ]:
+            self.registers.A = start
+            self.registers.PC = 0x1000
+            self.memory.write_word(0x1000, word)
+            self.cpu.step()
+            self.assertEqual(self.registers.A, expected, f"{word:06X}")
+
+    def test_div_by_zero_raises(self):
+        """
+        Tests that DIV by a zero word raises ZeroDivisionError.
+        """
+        self.registers.PC = 0x1000
+        self.memory.write_word(0x1000, 0x242000) # DIV 0x2000
+        with self.assertRaises(ZeroDivisionError):
+            self.cpu.step()
+
+    def test_div_by_zero_leaves_accumulator(self):
+        """
+        Tests that a faulting DIV does not change A or SW.
+        """
+        self.registers.A = 45
+        self.registers.SW = ord('<')
+        self.registers.PC = 0x1000
+        self.memory.write_word(0x1000, 0x242000) # DIV 0x2000
+        with self.assertRaises(ZeroDivisionError):
+            self.cpu.step()
+        self.assertEqual((self.registers.A, self.registers.SW), (45, ord('<')))
+
+    def test_arithmetic_results_are_masked_and_truncated(self):
+        """
+        Tests that MUL keeps the low 24 bits and DIV truncates.
+        """
+        self.registers.PC = 0x1000
+        self.memory.write_word(0x1000, 0x202000) # MUL 0x2000
+        self.memory.write_word(0x1003, 0x242003) # DIV 0x2003
+        self.memory.write_word(0x2000, 0x1000)
+        self.memory.write_word(0x2003, 2)
+        self.registers.A = 0x1001
+        self.cpu.step()
+        self.assertEqual(self.registers.A, 0x001000)
+        self.registers.A = 7
+        self.cpu.step()
+        self.assertEqual(self.registers.A, 3)
+
+    def test_only_comparisons_set_the_condition_code(self):
+        """
+        Tests that loads, stores and arithmetic leave SW unchanged.
+        """
+        self.memory.write_word(0x2000, 6)
+        for word in (0x042000, 0x102003, 0x502000, 0x542003, 0x202000,
+                     0x242000, 0x402000, 0x442000):
+            self.registers.SW = ord('=')
+            self.registers.A = 12
+            self.registers.PC = 0x1000
+            self.memory.write_word(0x1000, word)
+            self.cpu.step()
+            self.assertEqual(self.registers.SW, ord('='), f"{word:06X}")
+
+    def test_tix_compares_incremented_index(self):
+        """
+        Tests each TIX outcome, including X wrapping around at 24 bits.
+        """
+        self.memory.write_word(0x1000, 0x2C2000) # TIX 0x2000
+        self.memory.write_word(0x2000, 5)
+        for start, expected, status in [
+            (3, 4, '<'), (4, 5, '='), (5, 6, '>'), (0xFFFFFF, 0, '<'),
+        ]:
+            self.registers.X = start
+            self.registers.PC = 0x1000
+            self.cpu.step()
+            self.assertEqual((self.registers.X, self.registers.SW), (expected, ord(status)), f"X={start:06X}")
+
+    def test_stch_writes_only_the_low_byte(self):
+        """
+        Tests that STCH stores A's rightmost byte and leaves its neighbours.
+        """
+        self.registers.A = 0xFFFF7E
+        self.registers.PC = 0x1000
+        self.memory.write_word(0x1000, 0x542001) # STCH 0x2001
+        self.memory.write_word(0x2000, 0x112233)
+        self.memory.write_byte(0x2003, 0x44)
+        self.cpu.step()
+        self.assertEqual(self.memory.read_word(0x2000), 0x117E33)
+        self.assertEqual(self.memory.read_byte(0x2003), 0x44)
+
+    def test_decode_cache_keeps_hot_words(self):
+        """
+        Tests that streaming more distinct words than the decode cache holds
+        does not evict a word that keeps being fetched.
+        """
+        self.memory.write_word(0x1000, 0x001000) # the hot word
+        distinct = DECODE_CACHE_SIZE + 100
+        for value in range(1, distinct + 1):
+            self.registers.PC = 0x1000
+            self.cpu.fetch()
+            self.memory.write_word(0x2000, 0x040000 + value)
+            self.registers.PC = 0x2000
+            self.cpu.fetch()
+        self.assertEqual(self.cpu.decode_misses, 1 + distinct)
+        self.assertEqual(self.cpu.decode_hits, distinct - 1)
+
+        self.cpu.reset_counters()
+        self.assertEqual((self.cpu.decode_hits, self.cpu.decode_misses), (0, 0))
+
+    def test_step_executes_jlt_jgt_and_stsw_instructions(self):
+        """
+        Tests the conditional jumps on '<' and '>' and storing SW.
+        Opcodes are 0x38 (JLT), 0x34 (JGT) and 0xE8 (STSW).
+        """
+        for word, status, taken in [
+            (0x385000, '<', True), (0x385000, '>', False),
+            (0x345000, '>', True), (0x345000, '=', False),
+        ]:
+            self.registers.SW = ord(status)
+            self.registers.PC = 0x1000
+            self.memory.write_word(0x1000, word)
+            self.cpu.step()
+            self.assertEqual(self.registers.PC, 0x5000 if taken else 0x1003)
+
+        self.registers.PC = 0x1000
+        self.memory.write_word(0x1000, 0xE82000) # STSW 0x2000
+        self.cpu.step()
+        self.assertEqual(self.memory.read_word(0x2000), ord('='))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.machine import SICMachine
+from src.debugger import Debugger, StopEvent, StopReason
+
+# Counts COUNT up forever.
+COUNTER_PROGRAM = [
+    0x001012, # 1000: LOOP  LDA   COUNT
+    0x181015, # 1003:       ADD   ONE
+    0x0C1012, # 1006:       STA   COUNT
+    0x0C1018, # 1009:       STA   SHADOW
+    0x3C1000, # 100C:       J     LOOP
+]
+
+class TestDebugger(unittest.TestCase):
+    """
+    Test suite for breakpoints and watchpoints.
+    """
+
+    def setUp(self):
+        self.machine = SICMachine()
+        self.machine.load_program(COUNTER_PROGRAM, 0x1000)
+        self.machine.memory.write_word(0x1015, 1)  # ONE
+        self.machine.registers.PC = 0x1000
+        self.debugger = Debugger()
+        self.machine.attach(self.debugger)
+
+    def test_breakpoint_stops_before_instruction(self):
+        """
+        Tests that execution stops with the PC at the breakpoint.
+        """
+        self.debugger.add_breakpoint(0x1006)
+        event = self.machine.run(steps=100)
+
+        self.assertEqual(event, StopEvent(StopReason.BREAKPOINT, 0x1006, 0x1006))
+        self.assertEqual(self.machine.registers.PC, 0x1006)
+        self.assertEqual(self.machine.instructions_executed, 2)
+
+    def test_resume_steps_over_current_breakpoint(self):
+        """
+        Tests that running again continues past the breakpoint just hit.
+        """
+        self.debugger.add_breakpoint(0x1006)
+        self.machine.run(steps=100)
+        event = self.machine.run(steps=100)
+
+        self.assertEqual(event.reason, StopReason.BREAKPOINT)
+        self.assertEqual(self.machine.instructions_executed, 7)
+        self.assertEqual(self.machine.memory.read_word(0x1012), 1)
+
+    def test_breakpoint_at_start_stops_immediately(self):
+        """
+        Tests that a breakpoint at the entry PC stops before anything runs.
+        """
+        self.debugger.add_breakpoint(0x1000)
+        event = self.machine.run(steps=100)
+        self.assertEqual(event.address, 0x1000)
+        self.assertEqual(self.machine.instructions_executed, 0)
+
+    def test_watchpoint_stops_after_changing_write(self):
+        """
+        Tests that a write changing a watched word stops the run.
+        """
+        self.debugger.add_watchpoint(0x1018)
+        event = self.machine.run(steps=100)
+
+        self.assertEqual(event, StopEvent(StopReason.WATCHPOINT, 0x101A, 0x1009))
+        self.assertEqual(self.machine.memory.read_word(0x1018), 1)
+        self.assertEqual(self.machine.registers.PC, 0x100C)
+
+    def test_unchanged_write_does_not_trigger(self):
+        """
+        Tests that rewriting the same value is not reported.
+        """
+        self.debugger.add_watchpoint(0x1015)
+        self.machine.memory.write_word(0x1009, 0x0C1015)  # STA ONE
+        self.machine.memory.write_word(0x1012, 0)          # COUNT starts at 0, so STA ONE writes 1
+        self.assertIsNone(self.machine.run(steps=4))
+
+    def test_no_stop_without_hits(self):
+        """
+        Tests that the run completes normally and memory methods are restored.
+        """
+        self.debugger.add_watchpoint(0x2000)
+        self.assertIsNone(self.machine.run(steps=50))
+        self.assertNotIn("write_word", vars(self.machine.memory))
+
+    def test_removed_points_no_longer_stop(self):
+        """
+        Tests removal of breakpoints and watchpoints.
+        """
+        self.debugger.add_breakpoint(0x1006)
+        self.debugger.add_watchpoint(0x1018)
+        self.debugger.remove_breakpoint(0x1006)
+        self.debugger.remove_watchpoint(0x1018)
+        self.assertIsNone(self.machine.run(steps=50))
+        self.assertEqual(sum(self.debugger.watched_pages), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.machine import SICMachine
+from src.devices import (
+    ConsoleInputDevice, ConsoleOutputDevice, DeviceLog, ReplayDivergenceError
+)
+
+# Echoes bytes from device F1 to device 05, polling F1 until it is ready.
+ECHO_PROGRAM = [
+    0xE000F1, # 1000: LOOP  TD    F1
+    0x301000, # 1003:       JEQ   LOOP
+    0xD800F1, # 1006:       RD    F1
+    0xDC0005, # 1009:       WD    05
+    0x3C1000, # 100C:       J     LOOP
+]
+
+class TestDeviceRecordReplay(unittest.TestCase):
+    """
+    Test suite for recording and replaying device I/O.
+    """
+
+    def make_machine(self):
+        machine = SICMachine()
+        machine.load_program(ECHO_PROGRAM, 0x1000)
+        machine.registers.PC = 0x1000
+        return machine
+
+    def record_run(self, steps=14):
+        machine = self.make_machine()
+        keyboard = ConsoleInputDevice()
+        keyboard.set_input("HI")
+        screen = ConsoleOutputDevice()
+        machine.device_manager.add_device(0xF1, keyboard)
+        machine.device_manager.add_device(0x05, screen)
+        log = machine.record_devices()
+        machine.run(steps)
+        machine.device_manager.stop()
+        return machine, screen, log
+
+    def test_recording_logs_every_interaction(self):
+        """
+        Tests that tests, reads and writes are logged with step numbers.
+        """
+        _, screen, log = self.record_run()
+        self.assertEqual(screen.get_output(), "HI")
+        self.assertEqual(list(log)[:3], [
+            (1, 0xF1, DeviceLog.OP_TEST, 1),
+            (3, 0xF1, DeviceLog.OP_READ, ord('H')),
+            (4, 0x05, DeviceLog.OP_WRITE, ord('H')),
+        ])
+        # Two echoed bytes, then polling a drained keyboard.
+        self.assertEqual(list(log)[-1], (13, 0xF1, DeviceLog.OP_TEST, 0))
+
+    def test_replay_reproduces_run_without_devices(self):
+        """
+        Tests that a replayed run reaches the same state with no devices attached.
+        """
+        recorded, _, log = self.record_run()
+        machine = self.make_machine()
+        machine.replay_devices(log)
+        machine.run(14)
+        self.assertEqual(machine.registers.A, recorded.registers.A)
+        self.assertEqual(machine.registers.PC, recorded.registers.PC)
+        self.assertEqual(machine.registers.SW, recorded.registers.SW)
+
+    def test_replay_detects_divergence(self):
+        """
+        Tests that a program deviating from the log is reported.
+        """
+        _, _, log = self.record_run()
+        machine = self.make_machine()
+        machine.memory.write_word(0x1009, 0xDC0006)  # WD 06 instead of 05
+        machine.replay_devices(log)
+        with self.assertRaises(ReplayDivergenceError):
+            machine.run(14)
+
+    def test_replay_rejects_unlogged_device(self):
+        """
+        Tests that touching a device absent from the log is a divergence.
+        """
+        _, _, log = self.record_run()
+        machine = self.make_machine()
+        machine.memory.write_word(0x1009, 0xDC0006)  # WD 06 instead of 05
+        machine.device_manager.start_replay(log)
+        with self.assertRaisesRegex(ReplayDivergenceError, "got WD on device 06"):
+            machine.run(14)
+        self.assertEqual(machine.instructions_executed, 3)
+
+    def test_recording_forwards_device_api(self):
+        """
+        Tests that a device wrapped for recording keeps its own methods.
+        """
+        machine = self.make_machine()
+        machine.device_manager.add_device(0xF1, ConsoleInputDevice())
+        machine.device_manager.add_device(0x05, ConsoleOutputDevice())
+        machine.record_devices()
+        machine.device_manager.get_device(0xF1).set_input("OK")
+        machine.run(9)
+        self.assertEqual(machine.device_manager.get_device(0x05).get_output(), "OK")
+
+    def test_replay_detects_exhausted_log(self):
+        """
+        Tests that running past the end of the log is reported.
+        """
+        _, _, log = self.record_run()
+        machine = self.make_machine()
+        machine.replay_devices(log)
+        with self.assertRaises(ReplayDivergenceError):
+            machine.run(20)
+
+    def test_log_round_trips_through_file(self):
+        """
+        Tests saving and loading a device log.
+        """
+        _, _, log = self.record_run()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "devices.log")
+            log.save(path)
+            loaded = DeviceLog.load(path)
+        self.assertEqual(list(loaded), list(log))
+        self.assertEqual(len(loaded.to_bytes()), len(log) * DeviceLog.RECORD.size)
+
+    def test_stop_restores_real_devices(self):
+        """
+        Tests that leaving record mode hands back the attached devices.
+        """
+        machine, screen, _ = self.record_run()
+        self.assertIs(machine.device_manager.get_device(0x05), screen)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.machine import SICMachine
+from src.assembler.pass_two import assemble
+from src.devices import ConsoleInputDevice, ConsoleOutputDevice
+from src.debugger import Debugger, StopReason
+from src.limits import (
+    ExecutionLimits, LimitExceeded, MAX_INSTRUCTIONS, TIMEOUT, MAX_OUTPUT_BYTES, MAX_INPUT_READS
+)
+
+SPIN_SOURCE = [
+    "SPIN    START   1000",
+    "LOOP    LDA     LOOP",
+    "        J       LOOP",
+    "        END     SPIN",
+]
+
+WRITER_SOURCE = [
+    "WRITER  START   1000",
+    "LOOP    WD      5",
+    "        J       LOOP",
+    "        END     WRITER",
+]
+
+READER_SOURCE = [
+    "READER  START   1000",
+    "LOOP    RD      241",
+    "        J       LOOP",
+    "        END     READER",
+]
+
+BURST_SOURCE = [
+    "BURST   START   1000",
+    "        WD      5",
+    "        WD      5",
+    "        WD      5",
+    "        WD      5",
+    "        WD      5",
+    "HALT    J       HALT",
+    "        END     BURST",
+]
+
+COUNT_SOURCE = [
+    "COUNT   START   1000",
+    "        LDX     ZERO",
+    "LOOP    TIX     TEN",
+    "        JLT     LOOP",
+    "HALT    J       HALT",
+    "ZERO    WORD    0",
+    "TEN     WORD    10",
+    "        END     COUNT",
+]
+
+def load(source):
+    machine = SICMachine()
+    machine.load_object_code(assemble(source)[0])
+    return machine
+
+class TestExecutionLimits(unittest.TestCase):
+    """
+    Test suite for SICMachine.run_limited.
+    """
+
+    def test_halting_program_returns(self):
+        """
+        Tests that a program halting within its limits completes.
+        """
+        machine = load(COUNT_SOURCE)
+        self.assertTrue(machine.run_limited(ExecutionLimits(max_instructions=1000, timeout=5)))
+        self.assertTrue(machine.is_halted())
+        self.assertEqual(machine.registers.X, 10)
+
+    def test_instruction_limit_is_exact(self):
+        """
+        Tests that max_instructions stops after exactly that many instructions.
+        """
+        machine = load(SPIN_SOURCE)
+        with self.assertRaises(LimitExceeded) as context:
+            machine.run_limited(ExecutionLimits(max_instructions=5001, check_every=100))
+        error = context.exception
+        self.assertEqual((error.limit, error.value), (MAX_INSTRUCTIONS, 5001))
+        self.assertEqual(error.instructions, 5001)
+        self.assertEqual(machine.instructions_executed, 5001)
+        self.assertEqual(error.registers["PC"], 0x1003)
+        self.assertEqual(error.to_dict()["instructions"], 5001)
+
+    def test_limit_reached_on_halt_is_not_exceeded(self):
+        """
+        Tests that halting on the last allowed instruction is a success.
+        """
+        machine = load(COUNT_SOURCE)
+        self.assertTrue(machine.run_limited(ExecutionLimits(max_instructions=1 + 2 * 10)))
+
+    def test_timeout_stops_infinite_loop(self):
+        """
+        Tests that the wall-clock limit stops a program that never halts.
+        """
+        machine = load(SPIN_SOURCE)
+        with self.assertRaises(LimitExceeded) as context:
+            machine.run_limited(ExecutionLimits(timeout=0.05))
+        error = context.exception
+        self.assertEqual(error.limit, TIMEOUT)
+        self.assertGreaterEqual(error.elapsed, 0.05)
+        self.assertGreater(error.instructions, 0)
+
+    def test_output_limit(self):
+        """
+        Tests that output is stopped within check_every bytes of the limit.
+        """
+        machine = load(WRITER_SOURCE)
+        screen = ConsoleOutputDevice()
+        machine.device_manager.add_device(0x05, screen)
+        with self.assertRaises(LimitExceeded) as context:
+            machine.run_limited(ExecutionLimits(max_output_bytes=100, check_every=64))
+        error = context.exception
+        self.assertEqual(error.limit, MAX_OUTPUT_BYTES)
+        self.assertGreater(error.output_bytes, 100)
+        self.assertLessEqual(error.output_bytes, 100 + 64)
+        self.assertEqual(len(screen.get_output()), error.output_bytes)
+
+    def test_output_limit_checked_after_halt(self):
+        """
+        Tests that output written in the chunk that halts still counts.
+        """
+        machine = load(BURST_SOURCE)
+        machine.device_manager.add_device(0x05, ConsoleOutputDevice())
+        with self.assertRaises(LimitExceeded) as context:
+            machine.run_limited(ExecutionLimits(max_output_bytes=3))
+        self.assertTrue(machine.is_halted())
+        self.assertEqual((context.exception.limit, context.exception.output_bytes), (MAX_OUTPUT_BYTES, 5))
+
+    def test_instrument_stop_is_returned(self):
+        """
+        Tests that a debugger breakpoint ends the run with its StopEvent and
+        that the instruction budget counts only what ran.
+        """
+        machine = load(COUNT_SOURCE)
+        debugger = Debugger()
+        debugger.add_breakpoint(0x1006)
+        machine.attach(debugger)
+        limits = ExecutionLimits(max_instructions=1 + 2 * 10)
+
+        event = machine.run_limited(limits)
+        self.assertEqual((event.reason, event.address), (StopReason.BREAKPOINT, 0x1006))
+        self.assertEqual(machine.instructions_executed, 2)
+        # Each resumption stops at the loop's breakpoint again.
+        while event is not True:
+            self.assertEqual(event.reason, StopReason.BREAKPOINT)
+            event = machine.run_limited(limits)
+        self.assertEqual(machine.registers.X, 10)
+
+    def test_input_limit(self):
+        """
+        Tests that input reads are limited.
+        """
+        machine = load(READER_SOURCE)
+        keyboard = ConsoleInputDevice()
+        keyboard.set_input("x" * 1000)
+        machine.device_manager.add_device(0xF1, keyboard)
+        with self.assertRaises(LimitExceeded) as context:
+            machine.run_limited(ExecutionLimits(max_input_reads=10, check_every=32))
+        self.assertEqual(context.exception.limit, MAX_INPUT_READS)
+        self.assertLessEqual(context.exception.input_reads, 10 + 32)
+
+    def test_invalid_check_interval(self):
+        """
+        Tests that check_every must be positive.
+        """
+        with self.assertRaises(ValueError):
+            load(SPIN_SOURCE).run_limited(ExecutionLimits(check_every=0))
+
+if __name__ == '__main__':
+    unittest.main()
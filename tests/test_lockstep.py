@@ -0,0 +1,121 @@
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from src.machine import SICMachine
+from src.assembler.pass_two import assemble
+from src.lockstep import LockstepExecutor, FAULT_NONE, FAULT_DIVIDE, FAULT_DEVICE
+
+# Computes RESULT = INPUT / DIVISOR, or INPUT * 2 if INPUT is below LIMIT,
+# then sums 1..INPUT-ish via TIX so lanes run for different lengths.
+SOURCE = [
+    "PROG    START   1000",
+    "        LDA     INPUT",
+    "        COMP    LIMIT",
+    "        JLT     SMALL",
+    "        DIV     DIVISOR",
+    "        J       STORE",
+    "SMALL   MUL     TWO",
+    "STORE   STA     RESULT",
+    "        LDX     ZERO",
+    "LOOP    TIX     COUNT",
+    "        JLT     LOOP",
+    "        STX     RESULT2",
+    "HALT    J       HALT",
+    "ZERO    WORD    0",
+    "TWO     WORD    2",
+    "LIMIT   WORD    100",
+    "DIVISOR WORD    7",
+    "INPUT   WORD    0",
+    "COUNT   WORD    0",
+    "RESULT  WORD    0",
+    "RESULT2 WORD    0",
+    "        END     PROG",
+]
+
+@unittest.skipUnless(numpy, "NumPy is not installed")
+class TestLockstepExecutor(unittest.TestCase):
+    """
+    Test suite comparing the lockstep executor with the scalar machine.
+    """
+
+    def setUp(self):
+        object_code, self.symtab = assemble(SOURCE)
+        self.machine = SICMachine()
+        self.machine.load_object_code(object_code)
+
+    def address(self, name):
+        return self.symtab.get_address(name)
+
+    def scalar(self, value, count):
+        machine = SICMachine()
+        machine.memory.buffer[:] = self.machine.memory.buffer
+        machine.registers.PC = self.machine.registers.PC
+        machine.memory.write_word(self.address("INPUT"), value)
+        machine.memory.write_word(self.address("COUNT"), count)
+        halt = self.address("HALT")
+        while machine.registers.PC != halt:
+            machine.step()
+        machine.step()  # the halting J itself
+        return machine
+
+    def test_lanes_match_scalar_runs(self):
+        """
+        Tests that diverging lanes produce the same results as scalar machines.
+        """
+        inputs = [5, 150, 99, 700, 0, 101]
+        counts = [1, 3, 10, 2, 7, 5]
+        executor = LockstepExecutor(len(inputs), self.machine)
+        executor.write_words(self.address("INPUT"), inputs)
+        executor.write_words(self.address("COUNT"), counts)
+        executor.run(1000)
+
+        self.assertTrue(executor.halted.all())
+        self.assertTrue((executor.faults == FAULT_NONE).all())
+        for lane, (value, count) in enumerate(zip(inputs, counts)):
+            expected = self.scalar(value, count)
+            self.assertEqual(int(executor.read_words(self.address("RESULT"))[lane]),
+                             expected.memory.read_word(self.address("RESULT")))
+            self.assertEqual(int(executor.read_words(self.address("RESULT2"))[lane]), count)
+            self.assertEqual(int(executor.instructions_executed[lane]), expected.instructions_executed)
+            lane_machine = executor.to_machine(lane)
+            self.assertEqual(lane_machine.registers.A, expected.registers.A)
+            self.assertEqual(lane_machine.registers.SW, expected.registers.SW)
+
+    def test_faulting_lane_stops_alone(self):
+        """
+        Tests that a division by zero stops only the lane it happens in.
+        """
+        executor = LockstepExecutor(2, self.machine)
+        executor.write_words(self.address("INPUT"), [500, 500])
+        executor.write_words(self.address("COUNT"), [1, 1])
+        executor.memory[0, self.address("DIVISOR"):self.address("DIVISOR") + 3] = 0
+        executor.run(1000)
+
+        self.assertEqual(int(executor.faults[0]), FAULT_DIVIDE)
+        self.assertFalse(executor.halted[0])
+        self.assertEqual(int(executor.instructions_executed[0]), 3)
+        self.assertTrue(executor.halted[1])
+
+    def test_device_instructions_fault(self):
+        """
+        Tests that lanes reaching device I/O fault instead of running it.
+        """
+        machine = SICMachine()
+        machine.memory.write_word(0, 0xE000F1)  # TD F1
+        executor = LockstepExecutor(3, machine)
+        self.assertEqual(executor.run(10), 1)
+        self.assertTrue((executor.faults == FAULT_DEVICE).all())
+        self.assertTrue((executor.instructions_executed == 0).all())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
 from src.machine import SICMachine
+from src.devices import ConsoleInputDevice, ConsoleOutputDevice
 
 class TestMachine(unittest.TestCase):
     """
@@ -98,6 +99,76 @@ class TestMachine(unittest.TestCase):
         self.assertEqual(self.machine.registers.A, five)
         self.assertEqual(self.machine.registers.PC, program_start + 3)
 
+    def test_instructions_executed_counter(self):
+        """Tests that completed instructions are counted across runs and steps."""
+        self.machine.memory.write_word(0x1000, 0x3C1000) # J 1000
+        self.machine.registers.PC = 0x1000
+
+        self.machine.run(steps=5)
+        self.machine.step()
+        self.assertEqual(self.machine.instructions_executed, 6)
+        self.assertEqual(self.machine.current_step(), 6)
+
+    def test_failed_instruction_is_not_counted(self):
+        """Tests that an instruction that raises is not counted as executed."""
+        self.machine.memory.write_word(0x1000, 0x00100C) # LDA
+        self.machine.memory.write_word(0x1003, 0xFF0000) # unimplemented
+        self.machine.registers.PC = 0x1000
+
+        with self.assertRaises(NotImplementedError):
+            self.machine.run(steps=10)
+        self.assertEqual(self.machine.instructions_executed, 1)
+
+    def test_failed_step_is_not_counted(self):
+        """Tests that step() counts like run(1) when the instruction raises."""
+        self.machine.memory.write_word(0x1000, 0xFF0000) # unimplemented
+        self.machine.registers.PC = 0x1000
+
+        with self.assertRaises(NotImplementedError):
+            self.machine.step()
+        self.assertEqual(self.machine.instructions_executed, 0)
+
+    def test_negative_steps_are_rejected(self):
+        """Tests that run() refuses a negative step count and counts nothing."""
+        with self.assertRaises(ValueError):
+            self.machine.run(-3)
+        self.machine.run(0)
+        self.assertEqual(self.machine.instructions_executed, 0)
+        self.assertEqual(self.machine.stats().instructions, 0)
+
+    def test_stats_snapshot(self):
+        """Tests the counters reported by stats()."""
+        console_in = ConsoleInputDevice()
+        console_in.set_input("hi")
+        self.machine.device_manager.add_device(0xF1, console_in)
+        self.machine.device_manager.add_device(0x05, ConsoleOutputDevice())
+        self.machine.load_program([
+            0xD800F1, # 1000: LOOP RD  F1
+            0xDC0005, # 1003:      WD  05
+            0x3C1000, # 1006:      J   LOOP
+        ], 0x1000)
+        self.machine.registers.PC = 0x1000
+
+        self.machine.run(steps=6)
+        stats = self.machine.stats()
+        self.assertEqual(stats.instructions, 6)
+        self.assertEqual(stats.device_bytes_in, 2)
+        self.assertEqual(stats.device_bytes_out, 2)
+        self.assertEqual(stats.loads, 1)
+        self.assertEqual((stats.decode_cache_hits, stats.decode_cache_misses), (3, 3))
+        self.assertEqual(stats.decode_cache_hit_rate, 0.5)
+        self.assertGreater(stats.run_seconds, 0)
+        self.assertGreater(stats.instructions_per_second, 0)
+
+    def test_is_halted(self):
+        """Tests detection of the halt idiom, a J to itself."""
+        self.machine.registers.PC = 0x100
+        self.assertFalse(self.machine.is_halted())
+        self.machine.memory.write_word(0x100, 0x3C0100)  # J 0100
+        self.assertTrue(self.machine.is_halted())
+        self.machine.registers.PC = self.machine.memory.SIZE - 1
+        self.assertFalse(self.machine.is_halted())
+
     def test_reset_machine(self):
         """Tests that the reset method clears the machine state."""
         # Modify the state
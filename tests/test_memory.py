@@ -171,5 +171,16 @@ class TestMemory(unittest.TestCase):
         self.assertEqual(read_value, expected_value, "Value should be masked to 8 bits upon writing.")
 
 
+    def test_clear_zeroes_in_place(self):
+        """
+        Tests that clear zeroes memory without replacing the buffer.
+        """
+        buffer = self.memory.buffer
+        self.memory.write_word(0x100, 0xABCDEF)
+        self.memory.write_byte(self.memory.SIZE - 1, 0x7F)
+        self.memory.clear()
+        self.assertIs(self.memory.buffer, buffer)
+        self.assertEqual(buffer, bytearray(self.memory.SIZE))
+
 if __name__ == '__main__':
     unittest.main()
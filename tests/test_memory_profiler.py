@@ -0,0 +1,98 @@
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.machine import SICMachine
+from src.memory_profiler import MemoryAccessProfiler
+from src.debugger import Debugger
+from src.assembler.symtab import SymbolTable
+
+# Copies DATA to OUT forever.
+COPY_PROGRAM = [
+    0x001009, # 1000: LOOP LDA  DATA
+    0x0C2000, # 1003:      STA  OUT
+    0x3C1000, # 1006:      J    LOOP
+    0x000005, # 1009: DATA WORD 5
+]
+
+class TestMemoryAccessProfiler(unittest.TestCase):
+    """
+    Test suite for the memory access heatmap.
+    """
+
+    def setUp(self):
+        self.machine = SICMachine()
+        self.machine.load_program(COPY_PROGRAM, 0x1000)
+        self.machine.registers.PC = 0x1000
+
+    def symtab(self):
+        symtab = SymbolTable()
+        symtab.add_symbols([("LOOP", 0x1000), ("DATA", 0x1009), ("OUT", 0x2000)])
+        return symtab
+
+    def test_full_count_heatmaps(self):
+        """
+        Tests per-page and per-symbol counts, including instruction fetches.
+        """
+        profiler = MemoryAccessProfiler()
+        profiler.attach(self.machine.memory)
+        self.machine.run(steps=9)
+        profiler.detach()
+        self.assertEqual(profiler.page_heatmap(), [(0x1000, 12, 0), (0x2000, 0, 3)])
+        self.assertEqual(profiler.symbol_heatmap(self.symtab()), [("LOOP", 9, 0), ("DATA", 3, 0), ("OUT", 0, 3)])
+        report = profiler.report(self.symtab())
+        self.assertIn("1000", report)
+        self.assertIn("OUT", report)
+
+    def test_sampling_scales_estimates(self):
+        """
+        Tests that sampled counts are scaled back up by the sampling period.
+        """
+        profiler = MemoryAccessProfiler(sample_every=3)
+        profiler.attach(self.machine.memory)
+        self.machine.run(steps=9)
+        profiler.detach()
+        self.assertEqual(profiler.page_heatmap(), [(0x1000, 12, 0), (0x2000, 0, 3)])
+        self.assertEqual(sum(profiler.read_counts), 4)
+
+    def test_detach_restores_memory(self):
+        """
+        Tests that a detached profiler leaves no wrappers or counts behind.
+        """
+        profiler = MemoryAccessProfiler()
+        profiler.attach(self.machine.memory)
+        with self.assertRaises(RuntimeError):
+            profiler.attach(self.machine.memory)
+        profiler.detach()
+        self.assertNotIn("read_word", vars(self.machine.memory))
+        self.machine.run(steps=3)
+        self.assertEqual(profiler.page_heatmap(), [])
+
+    def test_stacks_with_debugger_watchpoints(self):
+        """
+        Tests that a debugger run with watchpoints keeps the profiler installed.
+        """
+        profiler = MemoryAccessProfiler()
+        profiler.attach(self.machine.memory)
+        debugger = Debugger()
+        debugger.add_watchpoint(0x3000)
+        self.machine.attach(debugger)
+        self.machine.run(steps=3)
+        self.machine.detach()
+        self.machine.run(steps=3)
+        profiler.detach()
+        self.assertEqual(sum(profiler.write_counts), 2)
+
+    def test_rejects_bad_sampling_period(self):
+        """
+        Tests that the sampling period must be positive.
+        """
+        with self.assertRaises(ValueError):
+            MemoryAccessProfiler(sample_every=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.machine import SICMachine
+from src.metrics import MachineStats, format_prometheus
+
+STATS = MachineStats(
+    instructions=100, run_seconds=0.5, instructions_per_second=200.0,
+    device_bytes_in=3, device_bytes_out=4, loads=1,
+    decode_cache_hits=90, decode_cache_misses=10,
+)
+
+class TestMetrics(unittest.TestCase):
+    """
+    Test suite for the Prometheus metrics export.
+    """
+
+    def test_format_prometheus(self):
+        """
+        Tests the exposition text, including HELP/TYPE lines and labels.
+        """
+        text = format_prometheus(STATS, labels={"machine": 'a"b'})
+        self.assertIn("# TYPE sic_instructions_executed_total counter\n", text)
+        self.assertIn('sic_instructions_executed_total{machine="a\\"b"} 100\n', text)
+        self.assertIn('sic_decode_cache_hit_ratio{machine="a\\"b"} 0.9\n', text)
+        self.assertTrue(text.endswith("\n"))
+
+    def test_machine_writes_prometheus_file(self):
+        """
+        Tests that the machine writes the file in place with no leftovers.
+        """
+        machine = SICMachine()
+        machine.memory.write_word(0, 0x3C0000) # J 0
+        machine.run(steps=10)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sic.prom")
+            machine.write_prometheus(path)
+            machine.write_prometheus(path)
+            self.assertEqual(os.listdir(directory), ["sic.prom"])
+            with open(path) as file:
+                self.assertIn("sic_instructions_executed_total 10\n", file.read())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.machine import SICMachine
+from src.devices import ConsoleInputDevice, ConsoleOutputDevice
+from src.pool import MachinePool
+from src.memory_profiler import MemoryAccessProfiler
+
+def console_machine():
+    machine = SICMachine()
+    machine.device_manager.add_device(0xF1, ConsoleInputDevice())
+    machine.device_manager.add_device(0x05, ConsoleOutputDevice())
+    return machine
+
+class TestMachinePool(unittest.TestCase):
+    """
+    Test suite for MachinePool and in-place machine reset.
+    """
+
+    def test_reset_is_in_place_and_keeps_devices(self):
+        """
+        Tests that reset clears state without reallocating or dropping devices.
+        """
+        machine = console_machine()
+        memory, registers, cpu = machine.memory, machine.registers, machine.cpu
+        keyboard = machine.device_manager.get_device(0xF1)
+        keyboard.set_input("x")
+        machine.device_manager.get_device(0x05).write(ord("y"))
+        machine.load_program([0x00100C, 0x3C0003], 0)  # LDA 100C / J 0003
+        machine.memory.write_word(0x100C, 7)
+        machine.run(3)
+        machine.attach(object())
+
+        machine.reset()
+        self.assertIs(machine.memory, memory)
+        self.assertIs(machine.registers, registers)
+        self.assertIs(machine.cpu, cpu)
+        self.assertEqual(machine.memory.buffer, bytearray(memory.SIZE))
+        self.assertEqual((registers.A, registers.PC), (0, 0))
+        self.assertIsNone(machine.instrument)
+        self.assertIs(machine.device_manager.get_device(0xF1), keyboard)
+        self.assertFalse(keyboard.test())
+        self.assertEqual(machine.device_manager.get_device(0x05).get_output(), "")
+        stats = machine.stats()
+        self.assertEqual((stats.instructions, stats.loads, stats.decode_cache_misses), (0, 0, 0))
+
+    def test_reset_stops_recording(self):
+        """
+        Tests that reset leaves device record mode.
+        """
+        machine = console_machine()
+        machine.device_manager.start_recording()
+        machine.reset()
+        self.assertIsInstance(machine.device_manager.get_device(0xF1), ConsoleInputDevice)
+
+    def test_release_removes_memory_wrappers(self):
+        """
+        Tests that a machine released with a memory profiler attached comes
+        back with plain memory methods.
+        """
+        pool = MachinePool()
+        machine = pool.acquire()
+        profiler = MemoryAccessProfiler()
+        profiler.attach(machine.memory)
+        machine.memory.write_word(0x100, 1)
+        pool.release(machine)
+
+        self.assertIs(pool.acquire(), machine)
+        self.assertNotIn("write_word", vars(machine.memory))
+        machine.memory.write_word(0x100, 2)
+        self.assertEqual(profiler.write_counts[0x100], 1)
+        profiler.detach()
+        self.assertNotIn("read_word", vars(machine.memory))
+
+    def test_acquire_reuses_released_machines(self):
+        """
+        Tests that released machines are reset and handed out again.
+        """
+        pool = MachinePool(size=2, factory=console_machine)
+        self.assertEqual((len(pool), pool.created), (2, 2))
+        first = pool.acquire()
+        first.memory.write_word(0, 0x123456)
+        pool.release(first)
+        self.assertIs(pool.acquire(), first)
+        self.assertEqual(first.memory.read_word(0), 0)
+        self.assertIsNotNone(first.device_manager.get_device(0x05))
+        pool.acquire()
+        extra = pool.acquire()
+        self.assertIsInstance(extra, SICMachine)
+        self.assertEqual((pool.created, pool.reused), (3, 3))
+
+    def test_context_manager_and_max_idle(self):
+        """
+        Tests the with-block helper and dropping machines beyond max_idle.
+        """
+        pool = MachinePool(max_idle=1)
+        with pool.machine() as machine:
+            machine.registers.A = 5
+        self.assertEqual(len(pool), 1)
+        self.assertEqual(machine.registers.A, 0)
+        pool.release(SICMachine())
+        self.assertEqual(len(pool), 1)
+        with self.assertRaises(ValueError):
+            MachinePool(size=-1)
+
+if __name__ == '__main__':
+    unittest.main()
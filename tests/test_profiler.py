@@ -0,0 +1,90 @@
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.machine import SICMachine
+from src.profiler import ExecutionProfiler
+from src.assembler.symtab import SymbolTable
+
+# Counts COUNT up to LIMIT, then spins on DONE.
+LOOP_PROGRAM = [
+    0x00101B, # 1000: LOOP  LDA   COUNT
+    0x18101E, # 1003:       ADD   ONE
+    0x0C101B, # 1006:       STA   COUNT
+    0x281021, # 1009:       COMP  LIMIT
+    0x301012, # 100C:       JEQ   DONE
+    0x3C1000, # 100F:       J     LOOP
+    0x3C1012, # 1012: DONE  J     DONE
+]
+
+class TestExecutionProfiler(unittest.TestCase):
+    """
+    Test suite for the per-opcode and per-address execution profiler.
+    """
+
+    def setUp(self):
+        self.machine = SICMachine()
+        self.machine.load_program(LOOP_PROGRAM, 0x1000)
+        self.machine.memory.write_word(0x101E, 1)  # ONE
+        self.machine.memory.write_word(0x1021, 5)  # LIMIT
+        self.machine.registers.PC = 0x1000
+        self.profiler = ExecutionProfiler()
+        self.machine.attach(self.profiler)
+
+    def test_counts_per_address_and_opcode(self):
+        """
+        Tests that every executed instruction is counted by address and opcode.
+        """
+        # 5 iterations: 4 full loops of 6 instructions, a last one of 5, then 3 spins.
+        self.machine.run(steps=32)
+
+        self.assertEqual(self.profiler.total, 32)
+        self.assertEqual(self.profiler.address_counts[0x1000], 5)
+        self.assertEqual(self.profiler.address_counts[0x100F], 4)
+        self.assertEqual(self.profiler.address_counts[0x1012], 3)
+        self.assertEqual(self.profiler.opcode_counts[0x3C], 7)
+        self.assertEqual(self.machine.memory.read_word(0x101B), 5)
+
+    def test_hot_spots_and_opcode_profile(self):
+        """
+        Tests the sorted hot-spot and opcode summaries.
+        """
+        self.machine.run(steps=32)
+        self.assertEqual(self.profiler.hot_spots(2), [(0x1000, 5), (0x1003, 5)])
+        self.assertEqual(self.profiler.opcode_profile()[0], ("J", 7))
+
+    def test_report_is_annotated_with_symbols(self):
+        """
+        Tests that the report names the symbol covering each hot spot.
+        """
+        symtab = SymbolTable()
+        symtab.add_symbol("LOOP", 0x1000)
+        symtab.add_symbol("DONE", 0x1012)
+        self.machine.run(steps=32)
+
+        report = self.profiler.report(symtab, limit=3)
+        self.assertIn("Instructions executed: 32", report)
+        self.assertIn("LOOP+3", report)
+
+    def test_detach_restores_plain_loop(self):
+        """
+        Tests that detached profilers stop counting.
+        """
+        self.assertIs(self.machine.detach(), self.profiler)
+        self.machine.run(steps=6)
+        self.assertEqual(self.profiler.total, 0)
+        self.assertEqual(self.machine.registers.PC, 0x1000)
+
+    def test_only_one_instrument_at_a_time(self):
+        """
+        Tests that attaching a second instrument is rejected.
+        """
+        with self.assertRaises(RuntimeError):
+            self.machine.attach(ExecutionProfiler())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -63,5 +63,16 @@ class TestRegisters(unittest.TestCase):
             self.registers.Z = 0
 
 
+    def test_reset(self):
+        """
+        Tests that reset clears every register.
+        """
+        self.registers.A = 1
+        self.registers.PC = 0x1000
+        self.registers.F = 5
+        self.registers.reset()
+        for name in ("A", "X", "L", "PC", "SW", "B", "S", "T", "F"):
+            self.assertEqual(getattr(self.registers, name), 0, name)
+
 if __name__ == '__main__':
     unittest.main()
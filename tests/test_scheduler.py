@@ -0,0 +1,229 @@
+import unittest
+import sys
+import os
+from itertools import count
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.machine import SICMachine
+from src.assembler.pass_two import assemble
+from src.devices import ConsoleInputDevice, ConsoleOutputDevice, StreamInputDevice
+from src.scheduler import (
+    Scheduler, blocked_device, PRIORITY, READY, PARKED, HALTED, FAILED
+)
+
+COUNTER_SOURCE = [
+    "COUNT   START   1000",
+    "LOOP    LDA     TOTAL",
+    "        ADD     ONE",
+    "        STA     TOTAL",
+    "        J       LOOP",
+    "ONE     WORD    1",
+    "TOTAL   WORD    0",
+    "        END     COUNT",
+]
+
+ECHO_SOURCE = [
+    "ECHO    START   1000",
+    "LOOP    TD      241",
+    "        JEQ     LOOP",
+    "        RD      241",
+    "        COMP    STOP",
+    "        JEQ     DONE",
+    "        WD      5",
+    "        J       LOOP",
+    "DONE    J       DONE",
+    "STOP    WORD    10",
+    "        END     ECHO",
+]
+
+FAULT_SOURCE = [
+    "FAULT   START   1000",
+    "        LDA     ONE",
+    "        DIV     ZERO",
+    "ONE     WORD    1",
+    "ZERO    WORD    0",
+    "        END     FAULT",
+]
+
+def load(source):
+    machine = SICMachine()
+    machine.load_object_code(assemble(source)[0])
+    return machine
+
+def echo_machine():
+    machine = load(ECHO_SOURCE)
+    keyboard, screen = ConsoleInputDevice(), ConsoleOutputDevice()
+    machine.device_manager.add_device(0xF1, keyboard)
+    machine.device_manager.add_device(0x05, screen)
+    return machine, keyboard, screen
+
+class TestScheduler(unittest.TestCase):
+    """
+    Test suite for the time-slicing Scheduler.
+    """
+
+    def test_round_robin_shares_equally(self):
+        """
+        Tests that round-robin gives every machine the same instructions.
+        """
+        scheduler = Scheduler(quantum=100)
+        for name in "abc":
+            scheduler.add(load(COUNTER_SOURCE), name)
+        order = [scheduler.run_once().name for _ in range(6)]
+        self.assertEqual(order, ["a", "b", "c", "a", "b", "c"])
+        self.assertEqual([stats.instructions for stats in scheduler.stats()], [200, 200, 200])
+        self.assertEqual(scheduler.fairness(), 1.0)
+
+    def test_priority_shares_in_proportion(self):
+        """
+        Tests that the priority policy shares instructions by priority.
+        """
+        scheduler = Scheduler(quantum=10, policy=PRIORITY)
+        scheduler.add(load(COUNTER_SOURCE), "high", priority=3)
+        scheduler.add(load(COUNTER_SOURCE), "low", priority=1)
+        self.assertEqual(scheduler.run(400), 400)
+        high, low = scheduler.stats()
+        self.assertEqual(high.instructions, 3 * low.instructions)
+        self.assertGreater(low.quanta, 0)
+        self.assertAlmostEqual(scheduler.fairness(), 1.0)
+
+    def test_halted_and_failed_machines_leave_rotation(self):
+        """
+        Tests that halting or raising removes a machine without stopping others.
+        """
+        scheduler = Scheduler(quantum=50)
+        machine, keyboard, _ = echo_machine()
+        keyboard.set_input("\n")
+        scheduler.add(machine, "echo")
+        faulty = scheduler.add(load(FAULT_SOURCE), "fault")
+        scheduler.add(load(COUNTER_SOURCE), "counter")
+        self.assertEqual(scheduler.run(10), 10)
+
+        self.assertEqual(scheduler["echo"].state, HALTED)
+        self.assertEqual(faulty.state, FAILED)
+        self.assertIsInstance(faulty.error, ZeroDivisionError)
+        self.assertEqual(faulty.instructions, 1)
+        self.assertEqual(scheduler["counter"].quanta, 8)
+
+    def test_blocked_machine_is_parked_and_woken(self):
+        """
+        Tests that a machine polling a busy device parks until it has input.
+        """
+        clock = count()
+        scheduler = Scheduler(quantum=100, clock=lambda: next(clock))
+        machine, keyboard, screen = echo_machine()
+        entry = scheduler.add(machine, "echo")
+        scheduler.add(load(COUNTER_SOURCE), "counter")
+
+        scheduler.run(4)
+        self.assertEqual(entry.state, PARKED)
+        self.assertEqual(entry.device_id, 0xF1)
+        self.assertEqual(blocked_device(machine), 0xF1)
+        spun = entry.instructions
+        self.assertLessEqual(spun, 100)
+
+        scheduler.run(4)
+        self.assertEqual(entry.instructions, spun)
+        self.assertEqual(entry.parks, 1)
+
+        keyboard.set_input("hi")
+        scheduler.wake("echo")
+        self.assertEqual(entry.state, READY)
+        scheduler.run(4)
+        self.assertEqual(screen.get_output(), "hi")
+        self.assertEqual(entry.state, PARKED)
+        self.assertGreater(entry.parked_seconds, 0)
+
+        keyboard.set_input("\n")
+        scheduler.poll()
+        scheduler.run(4)
+        self.assertEqual(entry.state, HALTED)
+
+    def test_run_stops_when_all_parked(self):
+        """
+        Tests that run() returns once no machine can make progress.
+        """
+        scheduler = Scheduler(quantum=20)
+        scheduler.add(echo_machine()[0])
+        scheduler.add(echo_machine()[0])
+        self.assertEqual(scheduler.run(), 2)
+        self.assertTrue(all(stats.state == PARKED for stats in scheduler.stats()))
+        self.assertIn("Fairness index", scheduler.report())
+
+    def test_latency_statistics(self):
+        """
+        Tests wait-time accounting with a deterministic clock.
+        """
+        clock = count()
+        scheduler = Scheduler(quantum=10, clock=lambda: next(clock))
+        scheduler.add(load(COUNTER_SOURCE), "a")
+        scheduler.add(load(COUNTER_SOURCE), "b")
+        scheduler.run(4)
+        a, b = scheduler.stats()
+        self.assertEqual(a.quanta, 2)
+        self.assertGreater(b.max_wait_seconds, a.max_wait_seconds - 1)
+        self.assertGreater(a.mean_wait_seconds, 0)
+
+    def test_default_names_are_not_reused(self):
+        """
+        Tests that default names stay unique after a machine is removed.
+        """
+        scheduler = Scheduler()
+        scheduler.add(SICMachine())
+        scheduler.add(SICMachine())
+        scheduler.remove("0")
+        self.assertEqual(scheduler.add(SICMachine()).name, "2")
+        scheduler.add(SICMachine(), "3")
+        self.assertEqual(scheduler.add(SICMachine()).name, "4")
+
+    def test_polling_has_no_device_side_effects(self):
+        """
+        Tests that finding a blocked device neither logs, consumes a replay
+        log nor reads from a stream.
+        """
+        machine, keyboard, _ = echo_machine()
+        log = machine.record_devices()
+        self.assertEqual(blocked_device(machine), 0xF1)
+        self.assertEqual(len(log), 0)
+        keyboard.set_input("\n")
+        machine.run(3)  # TD, JEQ, RD
+        machine.device_manager.stop()
+        self.assertEqual(len(log), 2)
+
+        replayed = load(ECHO_SOURCE)
+        replayed.device_manager.start_replay(log)
+        self.assertIsNone(blocked_device(replayed))
+        replayed.run(3)
+        self.assertEqual(replayed.registers.A, ord("\n"))
+
+        class UnreadableStream:
+            def read(self, size):
+                raise AssertionError("polling must not read the stream")
+
+        streamed = load(ECHO_SOURCE)
+        streamed.device_manager.add_device(0xF1, StreamInputDevice(UnreadableStream()))
+        self.assertIsNone(blocked_device(streamed))
+
+    def test_invalid_arguments(self):
+        """
+        Tests argument validation.
+        """
+        with self.assertRaises(ValueError):
+            Scheduler(quantum=0)
+        with self.assertRaises(ValueError):
+            Scheduler(policy="lottery")
+        scheduler = Scheduler()
+        scheduler.add(SICMachine(), "a")
+        with self.assertRaises(ValueError):
+            scheduler.add(SICMachine(), "a")
+        with self.assertRaises(ValueError):
+            scheduler.add(SICMachine(), "b", priority=0)
+        scheduler.remove("a")
+        self.assertEqual(len(scheduler), 0)
+        self.assertIsNone(scheduler.run_once())
+
+if __name__ == '__main__':
+    unittest.main()
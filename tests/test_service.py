@@ -0,0 +1,196 @@
+import unittest
+import sys
+import os
+import asyncio
+import base64
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.assembler.pass_two import assemble
+from src.service import (
+    ExecutionService, execute, encode_frame, read_frame,
+    STATUS_HALTED, STATUS_MAX_STEPS, STATUS_LIMIT, STATUS_ERROR
+)
+
+ECHO_CODE = assemble([
+    "ECHO    START   1000",
+    "LOOP    TD      241",
+    "        JEQ     DONE",
+    "        RD      241",
+    "        WD      5",
+    "        J       LOOP",
+    "DONE    J       DONE",
+    "        END     ECHO",
+])[0]
+
+SPIN_CODE = assemble([
+    "SPIN    START   0",
+    "LOOP    LDA     LOOP",
+    "        J       LOOP",
+    "        END     SPIN",
+])[0]
+
+def echo_request(request_id, text):
+    return {"id": request_id, "object_code": ECHO_CODE, "input": base64.b64encode(text).decode()}
+
+class GatedExecutor(ThreadPoolExecutor):
+    """Runs submitted work only once the gate is opened."""
+
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.gate = threading.Event()
+
+    def submit(self, fn, *args):
+        def gated():
+            self.gate.wait(5)
+            return fn(*args)
+        return super().submit(gated)
+
+class TestExecute(unittest.TestCase):
+    """
+    Test suite for running a single request in a worker.
+    """
+
+    def test_echo_program(self):
+        """
+        Tests output, status and final state of a halting program.
+        """
+        response = execute(echo_request(7, b"hello"))
+        self.assertEqual(response["id"], 7)
+        self.assertEqual(response["status"], STATUS_HALTED)
+        self.assertEqual(base64.b64decode(response["output"]), b"hello")
+        self.assertEqual(response["registers"]["PC"], 0x100F)
+        self.assertGreaterEqual(response["instructions"], 5 * 5 + 2)
+
+    def test_max_steps_is_capped(self):
+        """
+        Tests that the server's limit caps the requested steps.
+        """
+        response = execute({"object_code": SPIN_CODE, "max_steps": 10**9}, max_steps_limit=100)
+        self.assertEqual(response["status"], STATUS_MAX_STEPS)
+        self.assertEqual(response["instructions"], 100)
+
+    def test_limits_become_statuses(self):
+        """
+        Tests that request limits are applied and capped by the server's.
+        """
+        response = execute({"id": 4, "object_code": SPIN_CODE, "timeout": 60}, timeout_limit=0.05)
+        self.assertEqual((response["status"], response["limit"]), (STATUS_LIMIT, "timeout"))
+        self.assertGreater(response["instructions"], 0)
+        response = execute({"object_code": ECHO_CODE, "input": base64.b64encode(b"x" * 500).decode(),
+                            "max_output_bytes": 10})
+        self.assertEqual((response["status"], response["limit"]), (STATUS_LIMIT, "max_output_bytes"))
+
+    def test_device_limits_are_capped(self):
+        """
+        Tests that the server's output and input limits cap the request's.
+        """
+        request = {"object_code": ECHO_CODE, "input": base64.b64encode(b"x" * 500).decode(),
+                   "max_output_bytes": 10**9}
+        response = execute(request, max_output_bytes_limit=10)
+        self.assertEqual((response["status"], response["limit"]), (STATUS_LIMIT, "max_output_bytes"))
+        response = execute(dict(request, max_input_reads=10**9), max_input_reads_limit=10)
+        self.assertEqual((response["status"], response["limit"]), (STATUS_LIMIT, "max_input_reads"))
+        self.assertEqual(execute(dict(request, input=""))["status"], STATUS_HALTED)
+
+    def test_errors_become_responses(self):
+        """
+        Tests that bad requests produce error responses.
+        """
+        response = execute({"id": 1, "object_code": "garbage"})
+        self.assertEqual(response["status"], STATUS_ERROR)
+        self.assertIn("error", response)
+        response = execute({"id": 2, "object_code": ECHO_CODE, "input": "***"})
+        self.assertEqual(response["status"], STATUS_ERROR)
+
+class TestExecutionService(unittest.IsolatedAsyncioTestCase):
+    """
+    Test suite for the socket server.
+    """
+
+    async def start(self, service):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "sic.sock")
+        server = await service.start_unix(path)
+        self.addAsyncCleanup(server.wait_closed)
+        self.addCleanup(server.close)
+        return await asyncio.open_unix_connection(path)
+
+    async def close(self, writer):
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_pipelined_requests(self):
+        """
+        Tests several requests sent without waiting on one connection.
+        """
+        service = ExecutionService(executor=ThreadPoolExecutor(2))
+        self.addCleanup(service._executor.shutdown)
+        reader, writer = await self.start(service)
+        texts = {index: f"request {index}".encode() for index in range(5)}
+        writer.write(b"".join(encode_frame(echo_request(index, text)) for index, text in texts.items()))
+        responses = [await read_frame(reader) for _ in texts]
+        self.assertEqual(sorted(response["id"] for response in responses), list(texts))
+        for response in responses:
+            self.assertEqual(base64.b64decode(response["output"]), texts[response["id"]])
+        await self.close(writer)
+
+    async def test_backpressure_stops_reading(self):
+        """
+        Tests that no more than max_pending requests are dispatched at once.
+        """
+        executor = GatedExecutor()
+        self.addCleanup(executor.shutdown)
+        service = ExecutionService(max_pending=1, executor=executor)
+        reader, writer = await self.start(service)
+        writer.write(b"".join(encode_frame(echo_request(index, b"x")) for index in range(3)))
+        await writer.drain()
+        await asyncio.sleep(0.05)
+        self.assertEqual(service.requests, 1)
+        executor.gate.set()
+        responses = [await read_frame(reader) for _ in range(3)]
+        self.assertEqual([response["id"] for response in responses], [0, 1, 2])
+        self.assertEqual(service.requests, 3)
+        await self.close(writer)
+
+    async def test_bad_frames(self):
+        """
+        Tests responses to malformed requests.
+        """
+        service = ExecutionService(executor=ThreadPoolExecutor(1))
+        self.addCleanup(service._executor.shutdown)
+        reader, writer = await self.start(service)
+        writer.write(encode_frame({"id": 3}))
+        response = await read_frame(reader)
+        self.assertEqual((response["id"], response["status"]), (3, STATUS_ERROR))
+        writer.write(b"\x00\x00\x00\x03{{{")
+        response = await read_frame(reader)
+        self.assertEqual(response["status"], STATUS_ERROR)
+        self.assertIsNone(await read_frame(reader))
+        await self.close(writer)
+
+    async def test_process_pool_over_tcp(self):
+        """
+        Tests the default worker process pool over localhost TCP.
+        """
+        service = ExecutionService(workers=1)
+        self.addCleanup(service.close)
+        server = await service.start_tcp()
+        self.addAsyncCleanup(server.wait_closed)
+        self.addCleanup(server.close)
+        reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname())
+        for index in range(2):
+            writer.write(encode_frame(echo_request(index, b"warm")))
+            response = await read_frame(reader)
+            self.assertEqual(response["status"], STATUS_HALTED)
+            self.assertEqual(base64.b64decode(response["output"]), b"warm")
+        await self.close(writer)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.machine import SICMachine
+from src.assembler.pass_two import assemble
+from src.shared_image import SharedProgramImage
+
+SOURCE = [
+    "DOUBLE  START   1000",
+    "        LDA     VALUE",
+    "        ADD     VALUE",
+    "        STA     VALUE",
+    "HALT    J       HALT",
+    "VALUE   WORD    21",
+    "        END     DOUBLE",
+]
+
+def run_in_worker(name):
+    """Runs the published program in a worker process and returns VALUE."""
+    machine = SICMachine()
+    image = SharedProgramImage.attach(name)
+    try:
+        image.load_into(machine)
+    finally:
+        image.close()
+    machine.run(4)
+    return machine.memory.read_word(0x100C)
+
+class TestSharedProgramImage(unittest.TestCase):
+    """
+    Test suite for publishing loaded programs in shared memory.
+    """
+
+    def setUp(self):
+        self.machine = SICMachine()
+        self.machine.load_object_code(assemble(SOURCE)[0])
+        self.image = SharedProgramImage.publish(self.machine)
+        self.addCleanup(self.image.unlink)
+
+    def test_load_into_copies_memory_and_registers(self):
+        """
+        Tests that an attached image initializes a fresh machine.
+        """
+        attached = SharedProgramImage.attach(self.image.name)
+        self.addCleanup(attached.close)
+        machine = SICMachine()
+        attached.load_into(machine)
+        self.assertEqual(machine.memory.buffer, self.machine.memory.buffer)
+        self.assertEqual(machine.registers.PC, 0x1000)
+        machine.run(4)
+        self.assertEqual(machine.memory.read_word(0x100C), 42)
+        self.assertTrue(machine.is_halted())
+
+    @unittest.skipUnless(os.path.isdir("/dev/shm"), "Requires /dev/shm")
+    def test_map_into_is_copy_on_write(self):
+        """
+        Tests that writes through a mapped image stay private to the machine.
+        """
+        first, second = SICMachine(), SICMachine()
+        self.image.map_into(first)
+        self.image.map_into(second)
+        first.run(4)
+        self.assertEqual(first.memory.read_word(0x100C), 42)
+        self.assertEqual(second.memory.read_word(0x100C), 21)
+        attached = SharedProgramImage.attach(self.image.name)
+        self.addCleanup(attached.close)
+        fresh = SICMachine()
+        attached.load_into(fresh)
+        self.assertEqual(fresh.memory.read_word(0x100C), 21)
+        first.reset()
+        self.assertEqual(first.memory.read_word(0x1000), 0)
+
+    def test_workers_run_published_program(self):
+        """
+        Tests attaching from worker processes.
+        """
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(run_in_worker, [self.image.name] * 3))
+        self.assertEqual(results, [42, 42, 42])
+
+    def test_attach_rejects_other_segments(self):
+        """
+        Tests validation of attached segments and ownership.
+        """
+        from multiprocessing import shared_memory
+        other = shared_memory.SharedMemory(create=True, size=64)
+        self.addCleanup(other.unlink)
+        self.addCleanup(other.close)
+        with self.assertRaises(ValueError):
+            SharedProgramImage.attach(other.name)
+        attached = SharedProgramImage.attach(self.image.name)
+        with self.assertRaises(RuntimeError):
+            attached.unlink()
+        attached.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.machine import SICMachine
+from src.trace_file import TraceRecorder, TraceReader, BinaryTraceRecord
+
+class TestBinaryTrace(unittest.TestCase):
+    """
+    Test suite for the binary trace recorder and reader.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "run.trace")
+        self.machine = SICMachine()
+        self.machine.load_program([
+            0x001009, # 1000: LOOP  LDA   COUNT
+            0x18100C, # 1003:       ADD   ONE
+            0x3C1000, # 1006:       J     LOOP
+        ], 0x1000)
+        self.machine.memory.write_word(0x100C, 1)
+        self.machine.registers.PC = 0x1000
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def record(self, steps, buffer_records=4):
+        recorder = TraceRecorder(self.path, buffer_records=buffer_records, buffers=2)
+        self.machine.attach(recorder)
+        self.machine.run(steps=steps)
+        recorder.close()
+
+    def test_round_trip(self):
+        """
+        Tests that records written across several buffers read back in order.
+        """
+        self.record(10)
+        with TraceReader(self.path) as reader:
+            self.assertEqual(len(reader), 10)
+            self.assertEqual(reader[0], BinaryTraceRecord(1, 0x1000, 0x001009, 0, 0, 0))
+            self.assertEqual(reader[1], BinaryTraceRecord(2, 0x1003, 0x18100C, 1, 0, 0))
+            self.assertEqual(reader[-1].step, 10)
+            self.assertEqual([record.pc for record in reader][:4], [0x1000, 0x1003, 0x1006, 0x1000])
+
+    def test_find_step(self):
+        """
+        Tests random access by step number.
+        """
+        self.record(9)
+        with TraceReader(self.path) as reader:
+            self.assertEqual(reader.find_step(5).pc, 0x1003)
+            with self.assertRaises(KeyError):
+                reader.find_step(10)
+
+    def test_steps_continue_across_runs(self):
+        """
+        Tests that step numbers keep counting across runs.
+        """
+        recorder = TraceRecorder(self.path)
+        self.machine.attach(recorder)
+        self.machine.run(steps=2)
+        self.machine.run(steps=2)
+        recorder.close()
+        with TraceReader(self.path) as reader:
+            self.assertEqual([record.step for record in reader], [1, 2, 3, 4])
+
+    def test_detach_flushes_the_writer(self):
+        """
+        Tests that records are readable after detaching, before close().
+        """
+        recorder = TraceRecorder(self.path, buffer_records=4, buffers=2)
+        self.machine.attach(recorder)
+        self.machine.run(steps=6)
+        self.machine.detach()
+        with TraceReader(self.path) as reader:
+            self.assertEqual([record.step for record in reader], [1, 2, 3, 4, 5, 6])
+
+        self.machine.attach(recorder)
+        self.machine.run(steps=3)
+        recorder.close()
+        with TraceReader(self.path) as reader:
+            self.assertEqual(len(reader), 9)
+            self.assertEqual(reader[-1].step, 9)
+
+    def test_rejects_foreign_file(self):
+        """
+        Tests that non-trace files are rejected.
+        """
+        with open(self.path, "wb") as file:
+            file.write(b"not a trace file at all")
+        with self.assertRaises(ValueError):
+            TraceReader(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import io
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.machine import SICMachine
+from src.tracing import Tracer, CallbackSink, FileSink, RingBufferSink, TraceRecord
+
+class TestTracer(unittest.TestCase):
+    """
+    Test suite for instruction tracing.
+    """
+
+    def setUp(self):
+        self.machine = SICMachine()
+        self.machine.load_program([
+            0x001009, # 1000: LDA   FIVE
+            0x18900C, # 1003: ADD   THREE,X
+            0x0C100F, # 1006: STA   RESULT
+        ], 0x1000)
+        self.machine.memory.write_word(0x1009, 5)
+        self.machine.memory.write_word(0x100C, 3)
+        self.machine.registers.PC = 0x1000
+
+    def test_records_pc_effective_address_and_deltas(self):
+        """
+        Tests the contents of each trace record.
+        """
+        sink = RingBufferSink()
+        self.machine.attach(Tracer(sink))
+        self.machine.run(steps=3)
+        self.machine.detach()
+
+        self.assertEqual(sink.records, [
+            TraceRecord(1, 0x1000, 0x001009, 0x1009, (("A", 0, 5),)),
+            TraceRecord(2, 0x1003, 0x18900C, 0x100C, (("A", 5, 8),)),
+            TraceRecord(3, 0x1006, 0x0C100F, 0x100F, ()),
+        ])
+        self.assertEqual(sink.records[1].opcode, 0x18)
+
+    def test_records_are_delivered_in_batches(self):
+        """
+        Tests that the sink receives full batches, and the final partial
+        batch when the tracer is detached.
+        """
+        batches = []
+        self.machine.attach(Tracer(CallbackSink(batches.append), batch_size=2))
+        self.machine.run(steps=3)
+        self.assertEqual([len(batch) for batch in batches], [2])
+        self.machine.detach()
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+
+    def test_stepping_does_not_flush_partial_batches(self):
+        """
+        Tests that single steps accumulate into one batch.
+        """
+        batches = []
+        tracer = Tracer(CallbackSink(batches.append), batch_size=4)
+        self.machine.attach(tracer)
+        for _ in range(3):
+            self.machine.step()
+        self.assertEqual(batches, [])
+        tracer.flush()
+        self.assertEqual([[record.step for record in batch] for batch in batches], [[1, 2, 3]])
+
+    def test_ring_buffer_keeps_latest_records(self):
+        """
+        Tests that the ring buffer discards the oldest records.
+        """
+        sink = RingBufferSink(capacity=2)
+        self.machine.attach(Tracer(sink))
+        self.machine.run(steps=3)
+        self.machine.detach()
+        self.assertEqual([record.step for record in sink.records], [2, 3])
+
+    def test_file_sink_writes_text_lines(self):
+        """
+        Tests the text trace format.
+        """
+        output = io.StringIO()
+        tracer = Tracer(FileSink(output))
+        self.machine.attach(tracer)
+        self.machine.run(steps=2)
+        tracer.close()
+
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("LDA 1009", lines[0])
+        self.assertIn("A:000000->000005", lines[0])
+
+    def test_partial_batch_flushed_when_run_fails(self):
+        """
+        Tests that the records buffered before execution raised are kept
+        and written on detach.
+        """
+        sink = RingBufferSink()
+        self.machine.attach(Tracer(sink))
+        # The data word after the program becomes an unimplemented opcode.
+        self.machine.memory.write_word(0x1009, 0xFF0000)
+        with self.assertRaises(NotImplementedError):
+            self.machine.run(steps=10)
+        self.machine.detach()
+        self.assertEqual(len(sink.records), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.machine import SICMachine
+from src.undo import UndoLog
+
+# Counts COUNT up forever, mirroring it into SHADOW.
+COUNTER_PROGRAM = [
+    0x001012, # 1000: LOOP  LDA   COUNT
+    0x181015, # 1003:       ADD   ONE
+    0x0C1012, # 1006:       STA   COUNT
+    0x0C1018, # 1009:       STA   SHADOW
+    0x3C1000, # 100C:       J     LOOP
+]
+
+class TestUndoLog(unittest.TestCase):
+    """
+    Test suite for reverse execution with the undo log.
+    """
+
+    def setUp(self):
+        self.machine = SICMachine()
+        self.machine.load_program(COUNTER_PROGRAM, 0x1000)
+        self.machine.memory.write_word(0x1015, 1)  # ONE
+        self.machine.registers.PC = 0x1000
+        self.undo = UndoLog(capacity=8)
+        self.machine.attach(self.undo)
+
+    def snapshot(self):
+        registers = self.machine.registers
+        return (registers.A, registers.X, registers.L, registers.PC, registers.SW,
+                bytes(self.machine.memory.buffer[0x1000:0x1020]))
+
+    def test_step_back_restores_registers_and_memory(self):
+        """
+        Tests that undoing instructions returns to the exact earlier state.
+        """
+        self.machine.run(steps=2)
+        before = self.snapshot()
+        self.machine.run(steps=3)  # STA, STA, J
+
+        self.assertEqual(self.undo.step_back(3), 3)
+        self.assertEqual(self.snapshot(), before)
+        self.assertEqual(self.machine.instructions_executed, 2)
+
+    def test_step_back_restores_stored_character(self):
+        """
+        Tests that undoing STCH restores the single byte it overwrote.
+        """
+        self.machine.memory.write_word(0x1100, 0x541019) # STCH 1019
+        self.machine.memory.write_word(0x1019, 0xAABBCC)
+        self.machine.registers.A = 0x000011
+        self.machine.registers.PC = 0x1100
+        self.machine.step()
+        self.assertEqual(self.machine.memory.read_word(0x1019), 0x11BBCC)
+
+        self.assertEqual(self.undo.step_back(1), 1)
+        self.assertEqual(self.machine.memory.read_word(0x1019), 0xAABBCC)
+        self.assertEqual(self.machine.registers.PC, 0x1100)
+
+    def test_fetch_past_end_of_memory_is_reported_by_cpu(self):
+        """
+        Tests that a store opcode in the last two bytes faults in the CPU.
+        """
+        for pc in (0x7FFE, 0x7FFF):
+            self.machine.memory.write_byte(pc, 0x0C) # STA
+            self.machine.registers.PC = pc
+            with self.assertRaisesRegex(IndexError, "exceed memory bounds"):
+                self.machine.run(steps=1)
+
+    def test_run_back_to_pc(self):
+        """
+        Tests rewinding to the last time an address was about to execute.
+        """
+        self.machine.run(steps=7)  # second iteration, about to run STA
+        self.assertTrue(self.undo.run_back_to(0x1003))
+        self.assertEqual(self.machine.registers.PC, 0x1003)
+        self.assertEqual(self.machine.registers.A, 1)
+        self.assertEqual(self.machine.memory.read_word(0x1012), 1)
+
+    def test_capacity_bounds_history(self):
+        """
+        Tests that only the newest entries are kept once the log is full.
+        """
+        self.machine.run(steps=20)
+        self.assertEqual(len(self.undo), 8)
+        self.assertEqual(self.undo.memory_size, 8 * 28)
+        self.assertEqual(self.undo.step_back(100), 8)
+        self.assertEqual(self.machine.instructions_executed, 12)
+        self.assertFalse(self.undo.run_back_to(0x1000))
+
+    def test_resumes_after_step_back(self):
+        """
+        Tests that execution after rewinding reproduces the same results.
+        """
+        self.machine.run(steps=10)
+        after = self.snapshot()
+        self.undo.step_back(4)
+        self.machine.run(steps=4)
+        self.assertEqual(self.snapshot(), after)
+
+if __name__ == '__main__':
+    unittest.main()